@@ -2,7 +2,45 @@
 
 from __future__ import annotations
 
-from pydantic_settings import BaseSettings
+from collections.abc import Mapping
+from functools import cached_property
+from pathlib import Path
+
+from pydantic_settings import (
+    BaseSettings,
+    DotEnvSettingsSource,
+    PydanticBaseSettingsSource,
+    SettingsConfigDict,
+)
+
+_EnvFileKey = tuple[str, str | None, bool, bool, str | None]
+_ENV_FILE_CACHE: dict[_EnvFileKey, Mapping[str, str | None]] = {}
+
+
+def clear_env_file_cache() -> None:
+    """Forget every parsed ``.env`` file so the next settings load re-reads them."""
+    _ENV_FILE_CACHE.clear()
+
+
+class CachedDotEnvSettingsSource(DotEnvSettingsSource):
+    """Dotenv source that parses each env file at most once per process.
+
+    The cache key includes the resolved path, so subclasses pointing at
+    different files (``.env.dev`` vs ``.env.prod``) still load their own values.
+    """
+
+    def _read_env_file(self, file_path: Path) -> Mapping[str, str | None]:
+        key = (
+            str(file_path.resolve()),
+            self.env_file_encoding,
+            self.case_sensitive,
+            self.env_ignore_empty,
+            self.env_parse_none_str,
+        )
+        cached = _ENV_FILE_CACHE.get(key)
+        if cached is None:
+            cached = _ENV_FILE_CACHE[key] = super()._read_env_file(file_path)
+        return cached
 
 
 class BaseConfig(BaseSettings):
@@ -33,11 +71,29 @@ class BaseConfig(BaseSettings):
     api_version: str = "0.1.0"
     api_description: str = ""
 
-    model_config = {"env_file": ".env", "env_file_encoding": "utf-8"}
+    model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
+
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> tuple[PydanticBaseSettingsSource, ...]:
+        """Swap the default dotenv source for one that shares parsed files across classes."""
+        if isinstance(dotenv_settings, DotEnvSettingsSource):
+            dotenv_settings = CachedDotEnvSettingsSource(
+                settings_cls,
+                env_file=dotenv_settings.env_file,
+                env_file_encoding=dotenv_settings.env_file_encoding,
+            )
+        return init_settings, env_settings, dotenv_settings, file_secret_settings
 
-    @property
+    @cached_property
     def database_url(self) -> str:
-        """Build the database connection URL."""
+        """Build the database connection URL (computed once per instance)."""
         {% if cookiecutter.db_driver == "postgresql" -%}
         return f"postgresql+asyncpg://{self.db_user}:{self.db_password}@{self.db_host}:{self.db_port}/{self.db_name}"
         {%- else -%}
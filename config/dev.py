@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from pydantic_settings import SettingsConfigDict
+
 from .base import BaseConfig
 
 
@@ -22,7 +24,7 @@ class DevConfig(BaseConfig):
     db_name: str = "{{ cookiecutter.project_slug }}_dev.db"
     {%- endif %}
 
-    model_config = {
-        "env_file": ".env.dev",
-        "env_file_encoding": "utf-8",
-    }
+    model_config = SettingsConfigDict(
+        env_file=".env.dev",
+        env_file_encoding="utf-8",
+    )
@@ -3,14 +3,25 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import Final
 
-from .base import BaseConfig
+from .base import BaseConfig, clear_env_file_cache
 from .dev import DevConfig
 from .local import LocalConfig
 from .prod import ProdConfig
 from .stage import StageConfig
 
+_CONFIG_MAP: Final[Mapping[str, type[BaseConfig]]] = {
+    "local": LocalConfig,
+    "dev": DevConfig,
+    "stage": StageConfig,
+    "prod": ProdConfig,
+}
 
+
+@lru_cache(maxsize=None)
 def get_config() -> BaseConfig:
     """Load and return configuration based on APP_ENV environment variable.
 
@@ -20,17 +31,19 @@ def get_config() -> BaseConfig:
     - stage: Staging environment
     - prod: Production environment (default)
 
+    The result is cached for the lifetime of the process. Changing APP_ENV
+    (or any setting) at runtime requires calling reload_config().
+
     Returns:
         BaseConfig: The appropriate configuration instance for the current environment.
     """
-    env = os.getenv("APP_ENV", "prod").lower()
+    env = os.environ.get("APP_ENV", "prod").strip().casefold()
+    config_class = _CONFIG_MAP.get(env, ProdConfig)
+    return config_class()  # type: ignore
 
-    config_map = {
-        "local": LocalConfig,
-        "dev": DevConfig,
-        "stage": StageConfig,
-        "prod": ProdConfig,
-    }
 
-    config_class = config_map.get(env, ProdConfig)
-    return config_class()  # type: ignore
+def reload_config() -> BaseConfig:
+    """Drop the cached configuration and load it again from the environment."""
+    clear_env_file_cache()
+    get_config.cache_clear()
+    return get_config()
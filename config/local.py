@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from pydantic_settings import SettingsConfigDict
+
 from .base import BaseConfig
 
 
@@ -13,13 +15,9 @@ class LocalConfig(BaseConfig):
 
     # Use SQLite for local development
     db_driver: str = "sqlite"
-    {% if cookiecutter.db_driver == "postgresql" -%}
-    db_name: str = "{{ cookiecutter.project_slug }}_local.db"
-    {%- else -%}
     db_name: str = "{{ cookiecutter.project_slug }}_local.db"
-    {%- endif %}
 
-    model_config = {
-        "env_file": ".env.local",
-        "env_file_encoding": "utf-8",
-    }
+    model_config = SettingsConfigDict(
+        env_file=".env.local",
+        env_file_encoding="utf-8",
+    )
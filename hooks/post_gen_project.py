@@ -11,20 +11,24 @@ ENV_DIRS = ["deploy/local", "deploy/dev", "deploy/stage", "deploy/prod"]
 def _generate_env_files() -> None:
     """Copy each .env.*.example to .env.* so docker-compose can find them."""
     for env_dir in ENV_DIRS:
-        if not os.path.isdir(env_dir):
+        try:
+            entries = list(os.scandir(env_dir))
+        except FileNotFoundError:
             continue
-        for filename in os.listdir(env_dir):
-            if filename.endswith(".example"):
-                src = os.path.join(env_dir, filename)
-                dst = os.path.join(env_dir, filename[: -len(".example")])
-                if not os.path.exists(dst):
-                    shutil.copy(src, dst)
+        existing = {entry.name for entry in entries}
+        for entry in entries:
+            if entry.name.endswith(".example") and entry.is_file():
+                target = entry.name[: -len(".example")]
+                if target not in existing:
+                    shutil.copy(entry.path, os.path.join(env_dir, target))
 
 
 def main() -> None:
     if not USE_DOCKER:
-        if os.path.exists("deploy"):
+        try:
             shutil.rmtree("deploy")
+        except FileNotFoundError:
+            pass
         print("\nDocker files removed (use_docker=false).")
         print("\nQuickstart:")
         print("  uv sync        # or: pip install -e '.[dev]'")
@@ -1,6 +1,6 @@
 """Admin panel module — public API."""
 
-from app.admin.auth import AdminAuthProvider, AdminUser
+from app.admin.auth import AdminAuthProvider, AdminLoginRequiredError, AdminUser
 from app.admin.dao import AdminDAO
 from app.admin.resource import ColumnConfig, FieldConfig, FieldType, ResourceAdmin
 from app.admin.site import AdminSite
@@ -14,4 +14,5 @@ __all__ = [
     "FieldType",
     "AdminAuthProvider",
     "AdminUser",
+    "AdminLoginRequiredError",
 ]
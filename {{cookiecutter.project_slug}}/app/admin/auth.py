@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
 import secrets
-from typing import Any, Protocol, TypedDict
+from collections.abc import Coroutine
+from typing import Any, Protocol, TypedDict, TypeVar
 
 from fastapi import Request
 from fastapi.responses import RedirectResponse
 
+T = TypeVar("T")
+
+# Header that scripted clients may use instead of the csrf_token form field
+CSRF_HEADER = "x-csrf-token"
+
 
 class AdminUser(TypedDict):
     """Minimal representation of an authenticated admin user."""
@@ -17,6 +24,14 @@ class AdminUser(TypedDict):
     is_admin: bool
 
 
+class AdminLoginRequiredError(Exception):
+    """Raised by require_admin(); AdminSite turns it into the carried redirect."""
+
+    def __init__(self, login_url: str) -> None:
+        super().__init__(login_url)
+        self.response = RedirectResponse(url=login_url, status_code=303)
+
+
 class AdminAuthProvider(Protocol):
     """Abstract authentication interface for admin panel."""
 
@@ -29,31 +44,64 @@ class AdminAuthProvider(Protocol):
         ...
 
 
-async def require_admin(request: Request) -> AdminUser | RedirectResponse:
+async def require_admin(request: Request) -> AdminUser:
     """FastAPI dependency that checks admin session.
 
-    Returns AdminUser if authenticated, or a RedirectResponse to login.
+    Returns the AdminUser if authenticated; otherwise raises AdminLoginRequiredError
+    carrying a redirect to the login page.
+    A successful check is cached on ``request.state`` for the rest of the request.
     """
+    cached: AdminUser | None = getattr(request.state, "admin_user", None)
+    if cached is not None:
+        return cached
+
     admin_site = request.app.state.admin_site
-    prefix = admin_site.prefix
+    login_url = admin_site.login_url
 
     user_id = request.session.get("admin_user_id")
     if not user_id:
-        return RedirectResponse(url=f"{prefix}/login", status_code=303)
+        raise AdminLoginRequiredError(login_url)
 
     auth_provider = getattr(admin_site, "auth_provider", None)
     if auth_provider is None:
         request.session.clear()
-        return RedirectResponse(url=f"{prefix}/login", status_code=303)
+        raise AdminLoginRequiredError(login_url)
 
     user = await auth_provider.get_user(user_id)
     if not user or not user.get("is_admin"):
         request.session.clear()
-        return RedirectResponse(url=f"{prefix}/login", status_code=303)
+        raise AdminLoginRequiredError(login_url)
 
+    request.state.admin_user = user
     return user
 
 
+def _consume_result(task: asyncio.Future[Any]) -> None:
+    # Retrieve the outcome so a discarded task never logs "exception was never retrieved"
+    if not task.cancelled():
+        task.exception()
+
+
+async def require_admin_with(
+    request: Request, pending: Coroutine[Any, Any, T] | None
+) -> tuple[AdminUser, T | None]:
+    """Run require_admin() concurrently with an independent await (e.g. a DAO get).
+
+    The pending result is only returned to authenticated admins; if the check
+    raises (including AdminLoginRequiredError) the pending task is cancelled.
+    """
+    if pending is None:
+        return await require_admin(request), None
+    task = asyncio.ensure_future(pending)
+    try:
+        user = await require_admin(request)
+    except BaseException:
+        task.cancel()
+        task.add_done_callback(_consume_result)
+        raise
+    return user, await task
+
+
 def set_flash(request: Request, type: str, message: str) -> None:
     """Set a flash message in the session."""
     request.session["_flash"] = {"type": type, "message": message}
@@ -65,17 +113,38 @@ def get_flash(request: Request) -> dict[str, Any] | None:
 
 
 def get_csrf_token(request: Request) -> str:
-    """Return the CSRF token for this session, generating one if needed."""
+    """Return the CSRF token for this session, generating one if needed.
+
+    The token is also cached on ``request.state`` for the rest of the request.
+    """
+    token = getattr(request.state, "csrf_token", None)
+    if token:
+        return token
     token = request.session.get("_csrf_token")
     if not token:
         token = secrets.token_urlsafe(32)
         request.session["_csrf_token"] = token
+    request.state.csrf_token = token
     return token
 
 
 def validate_csrf(request: Request, submitted_token: str | None) -> bool:
     """Return True if submitted_token matches the session CSRF token."""
-    session_token = request.session.get("_csrf_token")
+    session_token = getattr(request.state, "csrf_token", None) or request.session.get(
+        "_csrf_token"
+    )
     if not session_token or not submitted_token:
         return False
     return secrets.compare_digest(session_token, submitted_token)
+
+
+def validate_csrf_header(request: Request) -> bool | None:
+    """Check the CSRF header before the request body is read.
+
+    Returns None when the header is absent, so callers fall back to the form
+    field; otherwise returns whether the header token is valid.
+    """
+    header_token = request.headers.get(CSRF_HEADER)
+    if header_token is None:
+        return None
+    return validate_csrf(request, header_token)
@@ -11,6 +11,10 @@ class AdminDAO(Protocol):
 
     Developers implement this protocol for each domain resource
     they want to manage through the admin panel.
+
+    Implementations may also define an optional ``async def count() -> int``;
+    the dashboard uses it (e.g. a cheap ``SELECT COUNT(*)``) instead of
+    ``list(0, 0)`` when present.
     """
 
     async def list(
@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from app.admin.dao import AdminDAO
+    from app.admin.views.forms import FormPlan
 
 
 class FieldType(str, Enum):
@@ -23,7 +25,7 @@ class FieldType(str, Enum):
     TEXTAREA = "textarea"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FieldConfig:
     """Configuration for a single form field in create/edit views."""
 
@@ -35,9 +37,15 @@ class FieldConfig:
     placeholder: str | None = None
     help_text: str | None = None
     readonly: bool = False
+    valid_choices: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Choice values as a set, built once instead of per submitted form
+        valid_choices = frozenset(c[0] for c in self.choices) if self.choices else frozenset()
+        object.__setattr__(self, "valid_choices", valid_choices)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ColumnConfig:
     """Configuration for a column in the list view table."""
 
@@ -61,6 +69,7 @@ class ResourceAdmin:
     id_field: str = "id"
     icon: str | None = None
     page_size: int = 25
+    form_field_names: frozenset[str] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         if not _SLUG_RE.match(self.name):
@@ -72,10 +81,13 @@ class ResourceAdmin:
         if not self.form_fields:
             raise ValueError("form_fields must not be empty")
 
-        all_field_names = {c.name for c in self.list_columns} | {
-            f.name for f in self.form_fields
-        }
-        if self.id_field not in all_field_names:
+        # Frozen dataclass: cache derived state via object.__setattr__
+        form_field_names = frozenset(f.name for f in self.form_fields)
+        object.__setattr__(self, "form_field_names", form_field_names)
+
+        if self.id_field not in form_field_names and not any(
+            c.name == self.id_field for c in self.list_columns
+        ):
             raise ValueError(
                 f"id_field '{self.id_field}' must exist in list_columns or form_fields"
             )
@@ -83,3 +95,10 @@ class ResourceAdmin:
         for f in self.form_fields:
             if f.field_type == FieldType.SELECT and not f.choices:
                 raise ValueError(f"Select field '{f.name}' must have choices defined")
+
+    @cached_property
+    def form_plan(self) -> FormPlan:
+        """Compiled validation/coercion plan for form_fields (built on first use)."""
+        from app.admin.views.forms import FormPlan
+
+        return FormPlan.for_fields(self.form_fields)
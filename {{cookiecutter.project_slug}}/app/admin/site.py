@@ -2,15 +2,25 @@
 
 from __future__ import annotations
 
+import hashlib
+from dataclasses import dataclass
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from fastapi import APIRouter, FastAPI, Request
+from fastapi.responses import HTMLResponse, RedirectResponse
 from fastapi.staticfiles import StaticFiles
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
+from markupsafe import Markup, escape
 from starlette.middleware.sessions import SessionMiddleware
 
-from app.admin.auth import AdminAuthProvider, get_csrf_token, get_flash
+from app.admin.auth import (
+    AdminAuthProvider,
+    AdminLoginRequiredError,
+    AdminUser,
+    get_csrf_token,
+    get_flash,
+)
 
 if TYPE_CHECKING:
     from app.admin.resource import ResourceAdmin
@@ -18,6 +28,44 @@ if TYPE_CHECKING:
 _TEMPLATES_DIR = Path(__file__).parent / "templates"
 _STATIC_DIR = Path(__file__).parent / "static"
 
+# Markers substituted into the pre-rendered "resource not found" page. Control
+# characters pass through autoescaping untouched and never occur in templates.
+_SLOT_USERNAME = "\x1fusername\x1f"
+_SLOT_CSRF = "\x1fcsrf\x1f"
+_SLOT_RESOURCE = "\x1fresource\x1f"
+
+
+def _etag_salt(session_secret: str) -> bytes:
+    """Derive the ETag key from the session secret and the template sources.
+
+    Workers sharing a secret and templates agree on every tag, while a deploy
+    that changes a template invalidates pages cached before it.
+    """
+    digest = hashlib.blake2b(session_secret.encode(), person=b"admin-etag", digest_size=32)
+    for path in sorted(_TEMPLATES_DIR.rglob("*.html")):
+        digest.update(path.read_bytes())
+    return digest.digest()
+
+
+@dataclass(frozen=True, slots=True)
+class ResourceURLs:
+    """Admin URLs for one resource, joined with the site prefix at registration."""
+
+    list_url: str
+    create_url: str
+
+    def detail_url(self, record_id: str) -> str:
+        """Return the detail page URL for record_id."""
+        return self.list_url + record_id
+
+    def edit_url(self, record_id: str) -> str:
+        """Return the edit page URL for record_id."""
+        return self.list_url + record_id + "/edit"
+
+    def delete_url(self, record_id: str) -> str:
+        """Return the delete confirmation URL for record_id."""
+        return self.list_url + record_id + "/delete"
+
 
 class AdminSite:
     """Central registry and configuration for the admin panel."""
@@ -29,44 +77,94 @@ class AdminSite:
         auth_provider: AdminAuthProvider | None = None,
         session_secret: str = "change-me-in-production",
         https_only: bool = False,
+        template_cache_dir: str | Path | None = None,
     ) -> None:
         if not prefix.startswith("/"):
             raise ValueError("prefix must start with '/'")
 
         self.title = title
         self.prefix = prefix
+        # Prefix-joined URLs used by redirects, computed once
+        self.login_url = f"{prefix}/login"
+        self.dashboard_url = f"{prefix}/"
+        self.static_url = f"{prefix}/static"
         self.auth_provider = auth_provider
         self.session_secret = session_secret
+        # Keys every ETag; stable across workers so If-None-Match can hit any of them
+        self.etag_salt = _etag_salt(session_secret)
         self.https_only = https_only
         self._resources: dict[str, ResourceAdmin] = {}
+        self._resources_tuple: tuple[ResourceAdmin, ...] = ()
+        self.resource_urls: dict[str, ResourceURLs] = {}
+        # With template_cache_dir, compiled template code is persisted so restarts
+        # skip the Jinja compiler; without it nothing is written to disk.
+        bytecode_cache = FileSystemBytecodeCache(str(template_cache_dir)) if template_cache_dir is not None else None
         self._env = Environment(
             loader=FileSystemLoader(str(_TEMPLATES_DIR)),
             autoescape=True,
+            auto_reload=False,
+            cache_size=-1,
+            bytecode_cache=bytecode_cache,
         )
+        self._templates: dict[str, Template] = {}
+        # Rendered from every not-found branch, so keep a direct reference
+        self.not_found_template = self._env.get_template("admin/404.html")
+        # Compiled once and exposed to every template as the `nav` global
+        self._nav_macro = self._env.get_template("admin/_macros.html").module.nav
+        self._env.globals["nav"] = self._nav_macro
+        # form.html walks fields and their values side by side
+        self._env.globals["zip"] = zip
+        self._nav_html_cache: dict[str, Markup] = {}
+        self._resource_not_found_html: str | None = None
+        self._router: APIRouter | None = None
 
     def register(self, resource: ResourceAdmin) -> None:
         """Register a resource with the admin panel."""
+        if self._router is not None:
+            raise RuntimeError("Cannot register resources after the router has been built.")
         if resource.name in self._resources:
             raise ValueError(f"Resource '{resource.name}' is already registered")
         self._resources[resource.name] = resource
+        list_url = f"{self.prefix}/{resource.name}/"
+        self.resource_urls[resource.name] = ResourceURLs(
+            list_url=list_url, create_url=list_url + "create"
+        )
+        self._resources_tuple = tuple(self._resources.values())
+        self._nav_html_cache.clear()
+        self._resource_not_found_html = None
 
-    def get_resources(self) -> list[ResourceAdmin]:
-        """Return all registered resources in registration order."""
-        return list(self._resources.values())
+    def get_resources(self) -> tuple[ResourceAdmin, ...]:
+        """Return all registered resources in registration order.
+
+        The tuple is built on register(), so repeated calls do not allocate.
+        """
+        return self._resources_tuple
 
     def get_resource(self, name: str) -> ResourceAdmin | None:
-        """Return a resource by name, or None."""
+        """Return a resource by name, or None.
+
+        Resources are keyed by name at register() time and frozen once the
+        router is built, so this is a single dict probe with nothing to cache.
+        """
         return self._resources.get(name)
 
-    def render(self, template_name: str, request: Request, **context: object) -> str:
-        """Render a Jinja2 template with common admin context."""
-        template = self._env.get_template(template_name)
+    def get_template(self, name: str) -> Template:
+        """Return the compiled template for name (memoised by the environment)."""
+        return self._templates.get(name) or self._env.get_template(name)
+
+    def render(
+        self, template: str | Template, request: Request, **context: object
+    ) -> str:
+        """Render a Jinja2 template (by name or compiled) with common admin context."""
+        if isinstance(template, str):
+            template = self.get_template(template)
         flash = get_flash(request)
         csrf_token = get_csrf_token(request)
         return template.render(
             admin_title=self.title,
             admin_prefix=self.prefix,
-            admin_resources=self.get_resources(),
+            admin_resources=self._resources_tuple,
+            admin_nav_html=self._render_nav(str(context.get("active_nav", ""))),
             admin_user=context.pop("admin_user", None),
             flash=flash,
             csrf_token=csrf_token,
@@ -74,8 +172,62 @@ class AdminSite:
             **context,
         )
 
+    def render_response(
+        self,
+        template: str | Template,
+        request: Request,
+        status_code: int = 200,
+        **context: object,
+    ) -> HTMLResponse:
+        """Render a template straight into an HTMLResponse.
+
+        The rendered text is encoded once into the response body; there is
+        no intermediate copy held by the view.
+        """
+        return HTMLResponse(
+            self.render(template, request, **context), status_code=status_code
+        )
+
+    def resource_not_found(
+        self, request: Request, user: AdminUser, resource_name: str
+    ) -> HTMLResponse:
+        """Return the 404 page for an unknown resource without a Jinja pass.
+
+        The page is rendered once with placeholder slots; each request only
+        substitutes the escaped username, CSRF token and resource name.
+        Unlike render(), this leaves any pending flash message in the session.
+        """
+        html = self._resource_not_found_html
+        if html is None:
+            html = self._resource_not_found_html = self.not_found_template.render(
+                admin_title=self.title,
+                admin_prefix=self.prefix,
+                admin_resources=self._resources_tuple,
+                admin_nav_html=self._render_nav(""),
+                admin_user={"username": _SLOT_USERNAME},
+                flash=None,
+                csrf_token=_SLOT_CSRF,
+                message=f"Resource '{_SLOT_RESOURCE}' not found.",
+            )
+        html = (
+            html.replace(_SLOT_USERNAME, escape(user["username"]))
+            .replace(_SLOT_CSRF, escape(get_csrf_token(request)))
+            .replace(_SLOT_RESOURCE, escape(resource_name))
+        )
+        return HTMLResponse(html, status_code=404)
+
+    def _render_nav(self, active_nav: str) -> Markup:
+        """Return the sidebar nav HTML, rendered once per active_nav value."""
+        html = self._nav_html_cache.get(active_nav)
+        if html is None:
+            html = self._nav_macro(self._resources_tuple, self.prefix, active_nav)
+            self._nav_html_cache[active_nav] = html
+        return html
+
     def get_router(self) -> APIRouter:
-        """Build and return the APIRouter with all admin routes."""
+        """Build and return the APIRouter with all admin routes (built once)."""
+        if self._router is not None:
+            return self._router
         if not self._resources:
             raise RuntimeError("No resources registered. Call register() first.")
 
@@ -97,17 +249,31 @@ class AdminSite:
         build_delete_routes(router, self)
         build_detail_routes(router, self)
 
+        self._precompile_templates()
+        self._router = router
         return router
 
+    def _precompile_templates(self) -> None:
+        """Compile every admin template once so render() is a plain dict lookup."""
+        self._templates = {
+            name: self._env.get_template(name)
+            for name in self._env.list_templates(extensions=["html"])
+        }
+
     def mount(self, app: FastAPI) -> None:
         """Mount admin panel on the FastAPI app.
 
-        Includes the router, mounts static files, and adds SessionMiddleware.
+        Includes the router, mounts static files, adds SessionMiddleware and
+        the handler that turns AdminLoginRequiredError into its login redirect.
         """
         app.state.admin_site = self
+        app.add_exception_handler(
+            AdminLoginRequiredError,
+            _login_required_handler,  # type: ignore[arg-type]
+        )
         app.include_router(self.get_router())
         app.mount(
-            f"{self.prefix}/static",
+            self.static_url,
             StaticFiles(directory=str(_STATIC_DIR)),
             name="admin-static",
         )
@@ -118,3 +284,10 @@ class AdminSite:
             same_site="lax",
             https_only=self.https_only,
         )
+
+
+async def _login_required_handler(
+    _request: Request, exc: AdminLoginRequiredError
+) -> RedirectResponse:
+    """Answer an unauthenticated admin request with its login redirect."""
+    return exc.response
@@ -2,25 +2,84 @@
 
 from __future__ import annotations
 
-import math
+import hashlib
+from functools import lru_cache
+from typing import TYPE_CHECKING, NamedTuple
+from urllib.parse import quote
 
+from starlette.responses import Response
 
-def compute_pagination(
-    page: int, page_size: int, total_count: int
-) -> dict[str, object]:
+if TYPE_CHECKING:
+    from starlette.requests import Request
+
+# Same safe set RedirectResponse uses when quoting the Location header
+_URL_SAFE = ":/%#?=@[]!$&'()*+,;"
+_CACHE_HEADERS = {"cache-control": "private, no-cache", "vary": "Cookie"}
+
+
+class Pagination(NamedTuple):
+    """Pagination values for a single list page."""
+
+    offset: int
+    total_pages: int
+    has_prev: bool
+    has_next: bool
+
+
+@lru_cache(maxsize=1024)
+def compute_pagination(page: int, page_size: int, total_count: int) -> Pagination:
     """Compute pagination values from page, page_size, and total_count.
 
-    Returns a dict with keys: offset, total_pages, has_prev, has_next.
+    The result is a pure function of its arguments, so it is memoised.
     """
+    # Integer ceiling division: exact for any int, no float round-trip
     total_pages = (
-        max(1, math.ceil(total_count / page_size)) if page_size > 0 else 1
+        max(1, (total_count + page_size - 1) // page_size) if page_size > 0 else 1
     )
-    offset = (page - 1) * page_size
-    has_prev = page > 1
-    has_next = page < total_pages
-    return {
-        "offset": offset,
-        "total_pages": total_pages,
-        "has_prev": has_prev,
-        "has_next": has_next,
-    }
+    return Pagination(
+        offset=(page - 1) * page_size,
+        total_pages=total_pages,
+        has_prev=page > 1,
+        has_next=page < total_pages,
+    )
+
+
+def see_other(url: str) -> Response:
+    """Return a bodiless 303 redirect to url.
+
+    Equivalent to ``RedirectResponse(url, status_code=303)`` without the
+    subclass machinery; the URL is quoted the same way.
+    """
+    return Response(status_code=303, headers={"location": quote(url, safe=_URL_SAFE)})
+
+
+def compute_etag(salt: bytes, *parts: object) -> str:
+    """Return a strong, quoted ETag for the repr of parts, keyed by salt.
+
+    ``salt`` is ``AdminSite.etag_salt``, so every worker of a deployment
+    produces the same tag for the same page.
+    """
+    digest = hashlib.blake2b(repr(parts).encode(), key=salt, digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def not_modified(request: Request, etag: str) -> Response | None:
+    """Return a 304 response if If-None-Match matches etag, else None.
+
+    Never short-circuits while a flash message is pending, since the cached
+    page would hide it.
+    """
+    header = request.headers.get("if-none-match")
+    if not header or "_flash" in request.session:
+        return None
+    candidates = (tag.strip().removeprefix("W/") for tag in header.split(","))
+    if etag not in candidates:
+        return None
+    return Response(status_code=304, headers={"etag": etag, **_CACHE_HEADERS})
+
+
+def set_etag(response: Response, etag: str) -> Response:
+    """Attach etag and revalidation headers to response and return it."""
+    response.headers["etag"] = etag
+    response.headers.update(_CACHE_HEADERS)
+    return response
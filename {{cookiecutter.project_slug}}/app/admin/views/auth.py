@@ -5,9 +5,11 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from fastapi import APIRouter, Request
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse
 from starlette.responses import Response
 
+from app.admin.utils import see_other
+
 if TYPE_CHECKING:
     from app.admin.site import AdminSite
 
@@ -15,21 +17,22 @@ if TYPE_CHECKING:
 def build_auth_routes(router: APIRouter, site: AdminSite) -> None:
     """Register login/logout routes on the router."""
 
+    login_tpl = site.get_template("admin/login.html")
+
     @router.get("/login", response_class=HTMLResponse, response_model=None)
     async def login_page(request: Request) -> Response:
         user_id = request.session.get("admin_user_id")
         if user_id and site.auth_provider:
             user = await site.auth_provider.get_user(user_id)
             if user and user.get("is_admin"):
-                return RedirectResponse(url=f"{site.prefix}/", status_code=303)
+                return see_other(site.dashboard_url)
 
-        html = site.render(
-            "admin/login.html",
+        return site.render_response(
+            login_tpl,
             request,
             error=None,
             active_nav="",
         )
-        return HTMLResponse(html)
 
     @router.post("/login", response_class=HTMLResponse, response_model=None)
     async def login_submit(request: Request) -> Response:
@@ -44,17 +47,16 @@ def build_auth_routes(router: APIRouter, site: AdminSite) -> None:
 
         if user and user.get("is_admin"):
             request.session["admin_user_id"] = user["id"]
-            return RedirectResponse(url=f"{site.prefix}/", status_code=303)
+            return see_other(site.dashboard_url)
 
-        html = site.render(
-            "admin/login.html",
+        return site.render_response(
+            login_tpl,
             request,
             error="Invalid username or password.",
             active_nav="",
         )
-        return HTMLResponse(html)
 
     @router.get("/logout", response_model=None)
     async def logout(request: Request) -> Response:
         request.session.clear()
-        return RedirectResponse(url=f"{site.prefix}/login", status_code=303)
+        return see_other(site.login_url)
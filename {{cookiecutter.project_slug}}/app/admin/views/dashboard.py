@@ -2,44 +2,54 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING
 
 from fastapi import APIRouter, Request
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse
 from starlette.responses import Response
 
 from app.admin.auth import require_admin
 
 if TYPE_CHECKING:
+    from app.admin.dao import AdminDAO
     from app.admin.site import AdminSite
 
 
+async def _count(dao: AdminDAO) -> int:
+    """Return the record count, preferring the DAO's optional count()."""
+    count = getattr(dao, "count", None)
+    if count is not None:
+        return await count()
+    _, total = await dao.list(0, 0)
+    return total
+
+
 def build_dashboard_routes(router: APIRouter, site: AdminSite) -> None:
     """Register dashboard route on the router."""
 
+    dashboard_tpl = site.get_template("admin/dashboard.html")
+
     @router.get("/", response_class=HTMLResponse, response_model=None)
     async def dashboard(request: Request) -> Response:
         user = await require_admin(request)
-        if isinstance(user, RedirectResponse):
-            return user
-
-        resource_counts = []
-        for resource in site.get_resources():
-            _, total = await resource.dao.list(0, 0)
-            resource_counts.append(
-                {
-                    "name": resource.name,
-                    "display_name": resource.display_name,
-                    "count": total,
-                    "icon": resource.icon,
-                }
-            )
-
-        html = site.render(
-            "admin/dashboard.html",
+
+        resources = site.get_resources()
+        totals = await asyncio.gather(*(_count(r.dao) for r in resources))
+        resource_counts = [
+            {
+                "name": resource.name,
+                "display_name": resource.display_name,
+                "count": total,
+                "icon": resource.icon,
+            }
+            for resource, total in zip(resources, totals, strict=True)
+        ]
+
+        return site.render_response(
+            dashboard_tpl,
             request,
             admin_user=user,
             resources=resource_counts,
             active_nav="dashboard",
         )
-        return HTMLResponse(html)
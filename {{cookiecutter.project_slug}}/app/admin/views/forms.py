@@ -2,61 +2,254 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Container, Mapping, Sequence
 from typing import TYPE_CHECKING
+from urllib.parse import unquote_to_bytes
+
+from fastapi import HTTPException, Request
 
 from app.admin.resource import FieldType
 
 if TYPE_CHECKING:
     from app.admin.resource import FieldConfig
 
+# Upper bound for an admin form body; larger posts are rejected with 413
+MAX_FORM_BYTES = 64 * 1024
+CSRF_FIELD = "csrf_token"
+CSRF_ONLY_KEYS: frozenset[str] = frozenset({CSRF_FIELD})
 
-def validate_form(fields: list[FieldConfig], data: dict[str, str]) -> dict[str, str]:
-    """Validate form data against field configs. Return errors dict."""
-    errors: dict[str, str] = {}
+_Validator = Callable[[dict[str, str]], dict[str, str]]
+_Coercer = Callable[[dict[str, str]], dict[str, object]]
+
+
+def _process_number(value: str) -> tuple[str | None, object]:
+    try:
+        return None, int(value)
+    except ValueError:
+        pass
+    try:
+        # Fall back to float for values like "1.5" or "1e3"
+        return None, float(value)
+    except ValueError:
+        return "Must be a number.", value
+
+
+def _is_number(value: str) -> bool:
+    return _process_number(value)[0] is None
+
+
+def _to_number(value: str) -> object:
+    return _process_number(value)[1]
+
+
+def _compile_function(
+    name: str, lines: list[str], namespace: dict[str, object]
+) -> Callable[..., object]:
+    exec(compile("\n".join(lines), f"<admin-form-{name}>", "exec"), namespace)
+    return namespace[name]  # type: ignore[return-value]
+
+
+def compile_validator(fields: Sequence[FieldConfig]) -> _Validator:
+    """Generate one straight-line validation function for the given fields.
+
+    Each editable field becomes a few inlined statements, so validating a
+    submission has no per-field loop, type dispatch or attribute lookups.
+    Names and messages are embedded with repr(); choice sets are bound as globals.
+    """
+    namespace: dict[str, object] = {"_is_number": _is_number}
+    lines = ["def _validate(raw):", "    errors = {}"]
+    for index, field in enumerate(fields):
+        if field.readonly or field.field_type == FieldType.BOOLEAN:
+            continue
+        key = repr(field.name)
+        checks: list[tuple[str, str]] = []
+        if field.field_type == FieldType.NUMBER:
+            checks.append(("not _is_number(v)", "Must be a number."))
+        elif field.field_type == FieldType.SELECT and field.choices:
+            choices_name = f"_choices_{index}"
+            namespace[choices_name] = field.valid_choices
+            checks.append((f"v not in {choices_name}", "Invalid choice."))
+        if not field.required and not checks:
+            continue
+        lines.append(f"    v = raw.get({key}, '').strip()")
+        keyword = "if"
+        if field.required:
+            lines.append(f"    if not v: errors[{key}] = 'This field is required.'")
+            keyword = "elif"
+        else:
+            checks = [(f"v and {cond}", message) for cond, message in checks]
+        for cond, message in checks:
+            lines.append(f"    {keyword} {cond}: errors[{key}] = {message!r}")
+    lines.append("    return errors")
+    return _compile_function("_validate", lines, namespace)  # type: ignore[return-value]
+
+
+def compile_coercer(fields: Sequence[FieldConfig]) -> _Coercer:
+    """Generate one straight-line coercion function for the given fields.
+
+    Booleans become ``name in raw``, numbers int/float, and empty values
+    ``None`` (optional) or ``""`` (required); readonly fields are skipped.
+    """
+    namespace: dict[str, object] = {"_to_number": _to_number}
+    lines = ["def _coerce(raw):", "    out = {}"]
     for field in fields:
         if field.readonly:
             continue
-        value = data.get(field.name, "").strip()
-
-        if field.required and field.field_type != FieldType.BOOLEAN and not value:
-            errors[field.name] = "This field is required."
+        key = repr(field.name)
+        if field.field_type == FieldType.BOOLEAN:
+            lines.append(f"    out[{key}] = {key} in raw")
             continue
+        empty = "''" if field.required else "None"
+        value = "_to_number(v)" if field.field_type == FieldType.NUMBER else "v"
+        lines.append(f"    v = raw.get({key}, '').strip()")
+        lines.append(f"    out[{key}] = {value} if v else {empty}")
+    lines.append("    return out")
+    return _compile_function("_coerce", lines, namespace)  # type: ignore[return-value]
+
+
+class FormPlan:
+    """Validation and coercion functions generated once for a set of fields.
+
+    Field types, required flags and select choices are resolved when the plan
+    is built, so processing a submission runs two straight-line functions.
+    """
+
+    __slots__ = ("accepted_keys", "validate", "coerce")
+
+    def __init__(
+        self, accepted_keys: frozenset[str], validate: _Validator, coerce: _Coercer
+    ) -> None:
+        # Body keys worth keeping from a submission: every field plus the CSRF token
+        self.accepted_keys = accepted_keys
+        # Generated by compile_validator(); returns the errors dict for raw form data
+        self.validate = validate
+        # Generated by compile_coercer(); returns raw form data as Python values
+        self.coerce = coerce
+
+    @classmethod
+    def for_fields(cls, fields: Sequence[FieldConfig]) -> FormPlan:
+        """Build a plan for the given fields (readonly fields are skipped)."""
+        return cls(
+            frozenset(f.name for f in fields) | CSRF_ONLY_KEYS,
+            compile_validator(fields),
+            compile_coercer(fields),
+        )
+
+    def process(self, raw: dict[str, str]) -> tuple[dict[str, str], dict[str, object]]:
+        """Validate and coerce form data.
 
-        if value and field.field_type == FieldType.NUMBER:
-            try:
-                float(value)
-            except ValueError:
-                errors[field.name] = "Must be a number."
+        Returns (errors, coerced). ``coerced`` is only meaningful when ``errors`` is empty.
+        """
+        return self.validate(raw), self.coerce(raw)
 
-        if value and field.field_type == FieldType.SELECT and field.choices:
-            valid_values = {c[0] for c in field.choices}
-            if value not in valid_values:
-                errors[field.name] = "Invalid choice."
 
-    return errors
+def _display_value(value: object) -> object:
+    # Preserve booleans so Jinja treats False as falsy (e.g., for checkboxes)
+    if isinstance(value, bool):
+        return value
+    return "" if value is None else str(value)
+
+
+def record_form_values(
+    fields: Sequence[FieldConfig], record: Mapping[str, object]
+) -> list[object]:
+    """Return display values for a stored record, aligned with fields."""
+    return [_display_value(record.get(f.name)) for f in fields]
+
+
+def raw_form_values(fields: Sequence[FieldConfig], raw: Mapping[str, str]) -> list[str]:
+    """Return submitted values aligned with fields (empty string when absent)."""
+    return [raw.get(f.name, "") for f in fields]
+
+
+# Plans built for the standalone helpers below, keyed by everything the
+# generated code depends on; views use the per-resource ResourceAdmin.form_plan
+_PLANS: dict[tuple[object, ...], FormPlan] = {}
+_MAX_PLANS = 64
+
+
+def _plan_for(fields: Sequence[FieldConfig]) -> FormPlan:
+    key = tuple((f.name, f.field_type, f.required, f.readonly, f.valid_choices) for f in fields)
+    plan = _PLANS.get(key)
+    if plan is None:
+        if len(_PLANS) >= _MAX_PLANS:
+            _PLANS.clear()
+        plan = _PLANS[key] = FormPlan.for_fields(fields)
+    return plan
+
+
+def process_form(
+    fields: list[FieldConfig], raw: dict[str, str]
+) -> tuple[dict[str, str], dict[str, object]]:
+    """Validate and coerce form data.
+
+    Returns (errors, coerced). ``coerced`` is only meaningful when ``errors`` is empty.
+    """
+    return _plan_for(fields).process(raw)
+
+
+def validate_form(fields: list[FieldConfig], data: dict[str, str]) -> dict[str, str]:
+    """Validate form data against field configs. Return errors dict."""
+    return _plan_for(fields).validate(data)
 
 
 def coerce_form_data(
     fields: list[FieldConfig], raw: dict[str, str]
 ) -> dict[str, object]:
     """Coerce form string values to appropriate Python types."""
-    result: dict[str, object] = {}
-    for field in fields:
-        if field.readonly:
-            continue
-        value = raw.get(field.name, "").strip()
+    return _plan_for(fields).coerce(raw)
 
-        if field.field_type == FieldType.BOOLEAN:
-            result[field.name] = field.name in raw
-        elif field.field_type == FieldType.NUMBER and value:
-            try:
-                # Prefer int when possible, fall back to float for values like "1e3"
-                result[field.name] = int(value)
-            except ValueError:
-                result[field.name] = float(value)
-        elif value:
-            result[field.name] = value
-        else:
-            result[field.name] = None if not field.required else ""
 
-    return result
+def _unquote(raw: bytes) -> str:
+    return unquote_to_bytes(raw.replace(b"+", b" ")).decode("utf-8", "replace")
+
+
+async def parse_urlencoded_stream(
+    request: Request,
+    *,
+    allowed_keys: Container[str],
+    max_bytes: int = MAX_FORM_BYTES,
+) -> dict[str, str]:
+    """Parse an urlencoded body chunk by chunk, keeping only allowed_keys.
+
+    Raises HTTPException(413) as soon as the body exceeds max_bytes, so an
+    oversized post is never fully buffered. Other content types (multipart)
+    fall back to Starlette's parser with the same key filter.
+
+    Values are stripped while decoding, so the ``.strip()`` calls in the
+    generated validator/coercer are no-ops that return the same string object.
+    """
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > max_bytes:
+        raise HTTPException(status_code=413, detail="Form body too large.")
+
+    data: dict[str, str] = {}
+    content_type = request.headers.get("content-type", "")
+    if not content_type.startswith("application/x-www-form-urlencoded"):
+        if not content_type:
+            return data
+        form = await request.form()
+        for key, value in form.multi_items():
+            if key in allowed_keys:
+                data[key] = (value if isinstance(value, str) else str(value)).strip()
+        return data
+
+    def add_pair(pair: bytes) -> None:
+        if not pair:
+            return
+        raw_key, _, raw_value = pair.partition(b"=")
+        key = _unquote(raw_key)
+        if key in allowed_keys:
+            data[key] = _unquote(raw_value).strip()
+
+    received = 0
+    pending = b""
+    async for chunk in request.stream():
+        received += len(chunk)
+        if received > max_bytes:
+            raise HTTPException(status_code=413, detail="Form body too large.")
+        *pairs, pending = (pending + chunk).split(b"&")
+        for pair in pairs:
+            add_pair(pair)
+    add_pair(pending)
+    return data
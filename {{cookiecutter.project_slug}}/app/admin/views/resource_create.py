@@ -6,11 +6,21 @@ import logging
 from typing import TYPE_CHECKING
 
 from fastapi import APIRouter, Request
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse
 from starlette.responses import Response
 
-from app.admin.auth import require_admin, set_flash, validate_csrf
-from app.admin.views.forms import coerce_form_data, validate_form
+from app.admin.auth import (
+    require_admin,
+    set_flash,
+    validate_csrf,
+    validate_csrf_header,
+)
+from app.admin.utils import see_other
+from app.admin.views.forms import (
+    CSRF_FIELD,
+    parse_urlencoded_stream,
+    raw_form_values,
+)
 
 if TYPE_CHECKING:
     from app.admin.site import AdminSite
@@ -21,97 +31,77 @@ logger = logging.getLogger(__name__)
 def build_create_routes(router: APIRouter, site: AdminSite) -> None:
     """Register resource create routes on the router."""
 
+    form_tpl = site.get_template("admin/form.html")
+
     @router.get(
         "/{resource_name}/create", response_class=HTMLResponse, response_model=None
     )
     async def resource_create_form(request: Request, resource_name: str) -> Response:
         user = await require_admin(request)
-        if isinstance(user, RedirectResponse):
-            return user
 
         resource = site.get_resource(resource_name)
         if not resource:
-            html = site.render(
-                "admin/404.html",
-                request,
-                admin_user=user,
-                message=f"Resource '{resource_name}' not found.",
-                active_nav="",
-            )
-            return HTMLResponse(html, status_code=404)
+            return site.resource_not_found(request, user, resource_name)
 
-        html = site.render(
-            "admin/form.html",
+        return site.render_response(
+            form_tpl,
             request,
             admin_user=user,
             resource=resource,
-            form_data={},
+            form_values=raw_form_values(resource.form_fields, {}),
             errors={},
             is_edit=False,
             active_nav=resource_name,
         )
-        return HTMLResponse(html)
 
     @router.post(
         "/{resource_name}/create", response_class=HTMLResponse, response_model=None
     )
     async def resource_create_submit(request: Request, resource_name: str) -> Response:
         user = await require_admin(request)
-        if isinstance(user, RedirectResponse):
-            return user
 
         resource = site.get_resource(resource_name)
         if not resource:
-            html = site.render(
-                "admin/404.html",
-                request,
-                admin_user=user,
-                message=f"Resource '{resource_name}' not found.",
-                active_nav="",
+            return site.resource_not_found(request, user, resource_name)
+
+        urls = site.resource_urls[resource_name]
+        # A bad X-CSRF-Token header is rejected before the body is buffered
+        csrf_ok = validate_csrf_header(request)
+        raw_data: dict[str, str] = {}
+        if csrf_ok is not False:
+            raw_data = await parse_urlencoded_stream(
+                request, allowed_keys=resource.form_plan.accepted_keys
             )
-            return HTMLResponse(html, status_code=404)
+            if csrf_ok is None:
+                csrf_ok = validate_csrf(request, raw_data.get(CSRF_FIELD))
 
-        form = await request.form()
-        raw_data = {key: str(form[key]) for key in form}
-
-        if not validate_csrf(request, raw_data.get("csrf_token")):
+        if not csrf_ok:
             set_flash(request, "error", "Invalid or missing CSRF token.")
-            return RedirectResponse(
-                url=f"{site.prefix}/{resource_name}/create", status_code=303
-            )
-
-        errors = validate_form(resource.form_fields, raw_data)
-        if errors:
-            html = site.render(
-                "admin/form.html",
-                request,
-                admin_user=user,
-                resource=resource,
-                form_data=raw_data,
-                errors=errors,
-                is_edit=False,
-                active_nav=resource_name,
-            )
-            return HTMLResponse(html)
-
-        coerced = coerce_form_data(resource.form_fields, raw_data)
-        try:
-            await resource.dao.create(coerced)
-            set_flash(request, "success", "Record created.")
-            return RedirectResponse(
-                url=f"{site.prefix}/{resource_name}/", status_code=303
-            )
-        except Exception:
-            logger.exception("Error creating record for resource '%s'", resource_name)
-            set_flash(request, "error", "An error occurred while creating the record.")
-            html = site.render(
-                "admin/form.html",
-                request,
-                admin_user=user,
-                resource=resource,
-                form_data=raw_data,
-                errors={},
-                is_edit=False,
-                active_nav=resource_name,
-            )
-            return HTMLResponse(html)
+            return see_other(urls.create_url)
+
+        errors = resource.form_plan.validate(raw_data)
+        if not errors:
+            coerced = resource.form_plan.coerce(raw_data)
+            try:
+                await resource.dao.create(coerced)
+                set_flash(request, "success", "Record created.")
+                return see_other(urls.list_url)
+            except Exception:
+                logger.exception(
+                    "Error creating record for resource '%s'", resource_name
+                )
+                set_flash(
+                    request, "error", "An error occurred while creating the record."
+                )
+
+        # Validation errors and DAO failures share the single re-render below
+        return site.render_response(
+            form_tpl,
+            request,
+            admin_user=user,
+            resource=resource,
+            form_values=raw_form_values(resource.form_fields, raw_data),
+            errors=errors,
+            is_edit=False,
+            active_nav=resource_name,
+        )
@@ -6,10 +6,18 @@ import logging
 from typing import TYPE_CHECKING
 
 from fastapi import APIRouter, Request
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse
 from starlette.responses import Response
 
-from app.admin.auth import require_admin, set_flash, validate_csrf
+from app.admin.auth import (
+    require_admin,
+    require_admin_with,
+    set_flash,
+    validate_csrf,
+    validate_csrf_header,
+)
+from app.admin.utils import see_other
+from app.admin.views.forms import CSRF_FIELD, CSRF_ONLY_KEYS, parse_urlencoded_stream
 
 if TYPE_CHECKING:
     from app.admin.site import AdminSite
@@ -20,6 +28,8 @@ logger = logging.getLogger(__name__)
 def build_delete_routes(router: APIRouter, site: AdminSite) -> None:
     """Register resource delete routes on the router."""
 
+    delete_tpl = site.get_template("admin/delete_confirm.html")
+
     @router.get(
         "/{resource_name}/{record_id}/delete",
         response_class=HTMLResponse,
@@ -28,34 +38,26 @@ def build_delete_routes(router: APIRouter, site: AdminSite) -> None:
     async def resource_delete_confirm(
         request: Request, resource_name: str, record_id: str
     ) -> Response:
-        user = await require_admin(request)
-        if isinstance(user, RedirectResponse):
-            return user
-
         resource = site.get_resource(resource_name)
+        # The session check and the record fetch are independent; overlap them
+        user, record = await require_admin_with(
+            request, resource.dao.get(record_id) if resource else None
+        )
         if not resource:
-            html = site.render(
-                "admin/404.html",
-                request,
-                admin_user=user,
-                message=f"Resource '{resource_name}' not found.",
-                active_nav="",
-            )
-            return HTMLResponse(html, status_code=404)
+            return site.resource_not_found(request, user, resource_name)
 
-        record = await resource.dao.get(record_id)
         if record is None:
-            html = site.render(
-                "admin/404.html",
+            return site.render_response(
+                site.not_found_template,
                 request,
                 admin_user=user,
                 message=f"Record '{record_id}' not found.",
                 active_nav=resource_name,
+                status_code=404,
             )
-            return HTMLResponse(html, status_code=404)
 
-        html = site.render(
-            "admin/delete_confirm.html",
+        return site.render_response(
+            delete_tpl,
             request,
             admin_user=user,
             resource=resource,
@@ -63,41 +65,35 @@ def build_delete_routes(router: APIRouter, site: AdminSite) -> None:
             record_id=record_id,
             active_nav=resource_name,
         )
-        return HTMLResponse(html)
 
     @router.post("/{resource_name}/{record_id}/delete", response_model=None)
     async def resource_delete_submit(
         request: Request, resource_name: str, record_id: str
     ) -> Response:
-        user = await require_admin(request)
-        if isinstance(user, RedirectResponse):
-            return user
+        await require_admin(request)
 
         resource = site.get_resource(resource_name)
         if not resource:
             set_flash(request, "error", "Resource not found.")
-            return RedirectResponse(url=f"{site.prefix}/", status_code=303)
-
-        form = await request.form()
-        submitted_token = str(form.get("csrf_token", ""))
-        if not validate_csrf(request, submitted_token):
+            return see_other(site.dashboard_url)
+
+        urls = site.resource_urls[resource_name]
+        # A CSRF header avoids reading the body at all
+        csrf_ok = validate_csrf_header(request)
+        if csrf_ok is None:
+            form = await parse_urlencoded_stream(request, allowed_keys=CSRF_ONLY_KEYS)
+            csrf_ok = validate_csrf(request, form.get(CSRF_FIELD))
+        if not csrf_ok:
             set_flash(request, "error", "Invalid or missing CSRF token.")
-            return RedirectResponse(
-                url=f"{site.prefix}/{resource_name}/{record_id}/delete", status_code=303
-            )
+            return see_other(urls.delete_url(record_id))
 
         try:
             await resource.dao.delete(record_id)
             set_flash(request, "success", "Record deleted.")
-            return RedirectResponse(
-                url=f"{site.prefix}/{resource_name}/", status_code=303
-            )
+            return see_other(urls.list_url)
         except Exception:
             logger.exception(
                 "Error deleting record '%s' for resource '%s'", record_id, resource_name
             )
             set_flash(request, "error", "An error occurred while deleting the record.")
-            return RedirectResponse(
-                url=f"{site.prefix}/{resource_name}/{record_id}",
-                status_code=303,
-            )
+            return see_other(urls.detail_url(record_id))
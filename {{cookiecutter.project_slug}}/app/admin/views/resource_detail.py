@@ -5,10 +5,11 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from fastapi import APIRouter, Request
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse
 from starlette.responses import Response
 
-from app.admin.auth import require_admin
+from app.admin.auth import get_csrf_token, require_admin_with
+from app.admin.utils import compute_etag, not_modified, set_etag
 
 if TYPE_CHECKING:
     from app.admin.site import AdminSite
@@ -17,44 +18,50 @@ if TYPE_CHECKING:
 def build_detail_routes(router: APIRouter, site: AdminSite) -> None:
     """Register resource detail route on the router."""
 
+    detail_tpl = site.get_template("admin/detail.html")
+
     @router.get(
         "/{resource_name}/{record_id}", response_class=HTMLResponse, response_model=None
     )
     async def resource_detail(
         request: Request, resource_name: str, record_id: str
     ) -> Response:
-        user = await require_admin(request)
-        if isinstance(user, RedirectResponse):
-            return user
-
         resource = site.get_resource(resource_name)
+        # The session check and the record fetch are independent; overlap them
+        user, record = await require_admin_with(
+            request, resource.dao.get(record_id) if resource else None
+        )
         if not resource:
-            html = site.render(
-                "admin/404.html",
-                request,
-                admin_user=user,
-                message=f"Resource '{resource_name}' not found.",
-                active_nav="",
-            )
-            return HTMLResponse(html, status_code=404)
+            return site.resource_not_found(request, user, resource_name)
 
-        record = await resource.dao.get(record_id)
         if record is None:
-            html = site.render(
-                "admin/404.html",
+            return site.render_response(
+                site.not_found_template,
                 request,
                 admin_user=user,
                 message=f"Record '{record_id}' not found.",
                 active_nav=resource_name,
+                status_code=404,
             )
-            return HTMLResponse(html, status_code=404)
 
-        html = site.render(
-            "admin/detail.html",
+        # The page embeds the user and CSRF token, so both are part of the seed
+        etag = compute_etag(
+            site.etag_salt,
+            resource_name,
+            user["id"],
+            get_csrf_token(request),
+            record.get("updated_at") or record,
+        )
+        cached = not_modified(request, etag)
+        if cached is not None:
+            return cached
+
+        response = site.render_response(
+            detail_tpl,
             request,
             admin_user=user,
             resource=resource,
             record=record,
             active_nav=resource_name,
         )
-        return HTMLResponse(html)
+        return set_etag(response, etag)
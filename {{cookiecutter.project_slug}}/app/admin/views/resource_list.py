@@ -5,11 +5,11 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from fastapi import APIRouter, Request
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse
 from starlette.responses import Response
 
-from app.admin.auth import require_admin
-from app.admin.utils import compute_pagination
+from app.admin.auth import get_csrf_token, require_admin
+from app.admin.utils import compute_etag, compute_pagination, not_modified, set_etag
 
 if TYPE_CHECKING:
     from app.admin.site import AdminSite
@@ -18,22 +18,15 @@ if TYPE_CHECKING:
 def build_list_routes(router: APIRouter, site: AdminSite) -> None:
     """Register resource list route on the router."""
 
+    list_tpl = site.get_template("admin/list.html")
+
     @router.get("/{resource_name}/", response_class=HTMLResponse, response_model=None)
     async def resource_list(request: Request, resource_name: str) -> Response:
         user = await require_admin(request)
-        if isinstance(user, RedirectResponse):
-            return user
 
         resource = site.get_resource(resource_name)
         if not resource:
-            html = site.render(
-                "admin/404.html",
-                request,
-                admin_user=user,
-                message=f"Resource '{resource_name}' not found.",
-                active_nav="",
-            )
-            return HTMLResponse(html, status_code=404)
+            return site.resource_not_found(request, user, resource_name)
 
         page_param = request.query_params.get("page", "1")
         try:
@@ -49,18 +42,33 @@ def build_list_routes(router: APIRouter, site: AdminSite) -> None:
 
         pagination = compute_pagination(page, resource.page_size, total_count)
 
-        html = site.render(
-            "admin/list.html",
+        # Hashing the fetched rows is far cheaper than rendering the table
+        etag = compute_etag(
+            site.etag_salt,
+            resource_name,
+            user["id"],
+            get_csrf_token(request),
+            offset,
+            search,
+            total_count,
+            items,
+        )
+        cached = not_modified(request, etag)
+        if cached is not None:
+            return cached
+
+        response = site.render_response(
+            list_tpl,
             request,
             admin_user=user,
             resource=resource,
             items=items,
             page=page,
-            total_pages=pagination["total_pages"],
+            total_pages=pagination.total_pages,
             total_count=total_count,
             search=search or "",
-            has_prev=pagination["has_prev"],
-            has_next=pagination["has_next"],
+            has_prev=pagination.has_prev,
+            has_next=pagination.has_next,
             active_nav=resource_name,
         )
-        return HTMLResponse(html)
+        return set_etag(response, etag)
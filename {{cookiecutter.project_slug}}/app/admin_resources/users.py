@@ -2,62 +2,115 @@
 
 from __future__ import annotations
 
-import uuid
+import os
 from typing import Any
 
 from app.admin import AdminDAO, ColumnConfig, FieldConfig, FieldType, ResourceAdmin
 
 
 class InMemoryUserDAO(AdminDAO):
-    """In-memory DAO for demonstration. Replace with your real data access."""
+    """In-memory DAO for demonstration. Replace with your real data access.
+
+    Storage is column-oriented: parallel lists of ids, records and lowercase
+    search blobs, plus an id -> position index. Search scans only the blob
+    column and records are materialised just for the requested page.
+    Deletes swap the last row into the hole, so order is insertion order
+    only until the first delete.
+    """
 
     def __init__(self) -> None:
-        self._store: dict[str, dict[str, Any]] = {}
+        self._ids: list[str] = []
+        self._records: list[dict[str, Any]] = []
+        # Lowercased "name\x00email", kept in sync on every write so search
+        # never lowercases on the read path
+        self._search_blobs: list[str] = []
+        self._index: dict[str, int] = {}
         # Seed sample data
-        for i in range(1, 6):
-            uid = str(uuid.uuid4())
-            self._store[uid] = {
-                "id": uid,
-                "name": f"User {i}",
-                "email": f"user{i}@example.com",
-                "role": "admin" if i == 1 else "user",
-            }
+        self._extend(
+            [
+                {
+                    "id": os.urandom(16).hex(),
+                    "name": f"User {i}",
+                    "email": f"user{i}@example.com",
+                    "role": "admin" if i == 1 else "user",
+                }
+                for i in range(1, 6)
+            ]
+        )
+
+    @staticmethod
+    def _search_blob(record: dict[str, Any]) -> str:
+        return f"{record.get('name') or ''}\x00{record.get('email') or ''}".lower()
+
+    def _append(self, record: dict[str, Any]) -> None:
+        self._index[record["id"]] = len(self._ids)
+        self._ids.append(record["id"])
+        self._records.append(record)
+        self._search_blobs.append(self._search_blob(record))
+
+    def _extend(self, records: list[dict[str, Any]]) -> None:
+        """Bulk-append rows, filling each column in one pass."""
+        ids = [record["id"] for record in records]
+        self._index.update({uid: pos for pos, uid in enumerate(ids, len(self._ids))})
+        self._ids.extend(ids)
+        self._records.extend(records)
+        self._search_blobs.extend(map(self._search_blob, records))
 
     async def list(
         self, offset: int, limit: int, search: str | None = None
     ) -> tuple[list[dict[str, Any]], int]:
-        items = list(self._store.values())
-        if search:
-            term = search.lower()
-            items = [
-                item
-                for item in items
-                if term in item["name"].lower() or term in item["email"].lower()
-            ]
-        total = len(items)
-        if limit > 0:
-            items = items[offset : offset + limit]
-        return items, total
+        records = self._records
+        if not search:
+            if limit > 0:
+                return records[offset : offset + limit], len(records)
+            return list(records), len(records)
+
+        term = search.lower()
+        if "\x00" in term:
+            # Only a term containing the separator could span name and email
+            return [], 0
+        matches = [i for i, blob in enumerate(self._search_blobs) if term in blob]
+        page = matches[offset : offset + limit] if limit > 0 else matches
+        return [records[i] for i in page], len(matches)
 
-    async def get(self, id: str) -> dict[str, Any] | None:
-        return self._store.get(id)
+    async def count(self) -> int:
+        return len(self._ids)
+
+    # Parameter name fixed by the AdminDAO protocol
+    async def get(self, id: str) -> dict[str, Any] | None:  # noqa: A002
+        idx = self._index.get(id)
+        return None if idx is None else self._records[idx]
 
     async def create(self, data: dict[str, Any]) -> dict[str, Any]:
-        uid = str(uuid.uuid4())
+        uid = os.urandom(16).hex()
         record = {"id": uid, **data}
-        self._store[uid] = record
+        self._append(record)
         return record
 
-    async def update(self, id: str, data: dict[str, Any]) -> dict[str, Any]:
-        if id not in self._store:
+    # Parameter name fixed by the AdminDAO protocol
+    async def update(self, id: str, data: dict[str, Any]) -> dict[str, Any]:  # noqa: A002
+        idx = self._index.get(id)
+        if idx is None:
             raise ValueError(f"Record '{id}' not found")
-        self._store[id].update(data)
-        return self._store[id]
+        record = self._records[idx]
+        record.update(data)
+        self._search_blobs[idx] = self._search_blob(record)
+        return record
 
-    async def delete(self, id: str) -> None:
-        if id not in self._store:
+    # Parameter name fixed by the AdminDAO protocol
+    async def delete(self, id: str) -> None:  # noqa: A002
+        idx = self._index.pop(id, None)
+        if idx is None:
             raise ValueError(f"Record '{id}' not found")
-        del self._store[id]
+        # Swap-with-last keeps the columns dense without shifting every row
+        last_id = self._ids.pop()
+        last_record = self._records.pop()
+        last_blob = self._search_blobs.pop()
+        if idx < len(self._ids):
+            self._ids[idx] = last_id
+            self._records[idx] = last_record
+            self._search_blobs[idx] = last_blob
+            self._index[last_id] = idx
 
 
 def create_user_resource() -> ResourceAdmin:
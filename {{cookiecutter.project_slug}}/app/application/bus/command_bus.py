@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any, Callable
+
+from app.application.bus.dispatch import compile_dispatch
+
+if TYPE_CHECKING:
+    from app.application.bus.message import Command
 
 
 class HandlerNotFoundError(Exception):
@@ -19,29 +24,50 @@ class DuplicateHandlerError(Exception):
         super().__init__(f"Handler already registered for {command_type.__name__}")
 
 
-class CommandBus:
-    """Dispatches commands to their registered handlers."""
+_HANDLERS: dict[type, Callable[..., Any]] = {}
 
-    _handlers: dict[type, Callable[..., Any]] = {}
 
-    @classmethod
-    def handler(cls, command_type: type) -> Callable[..., Any]:
-        """Decorator to register a command handler."""
+def command_handler(command_type: type) -> Callable[..., Any]:
+    """Decorator to register a command handler."""
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        if command_type in _HANDLERS:
+            raise DuplicateHandlerError(command_type)
+        _HANDLERS[command_type] = func
+        return func
 
-        def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
-            if command_type in cls._handlers:
-                raise DuplicateHandlerError(command_type)
-            cls._handlers[command_type] = func
-            return func
+    return decorator
 
-        return decorator
 
-    async def dispatch(self, command: Any, **kwargs: Any) -> Any:
+class CommandBus:
+    """Dispatches commands to their registered handlers.
+
+    Call :meth:`freeze` once every handler module has been imported to swap
+    the dict lookup for a generated if-ladder over the registered types.
+    """
+
+    async def dispatch(
+        self,
+        command: Command,
+        *,
+        _handlers: dict[type, Callable[..., Any]] = _HANDLERS,
+        **kwargs: Any,
+    ) -> Any:
         """Dispatch a command to its registered handler."""
-        handler = self._handlers.get(type(command))
-        if handler is None:
-            raise HandlerNotFoundError(type(command))
+        try:
+            handler = _handlers[getattr(command, "__dispatch_key__", type(command))]
+        except KeyError:
+            raise HandlerNotFoundError(type(command)) from None
         return await handler(command, **kwargs)
 
+    _dispatch_lookup = dispatch
+
+    @classmethod
+    def freeze(cls) -> None:
+        """Replace ``dispatch`` with one specialised to the current handlers."""
+        cls.dispatch = compile_dispatch(dict(_HANDLERS), cls._dispatch_lookup)
 
-command_handler = CommandBus.handler
+    @classmethod
+    def thaw(cls) -> None:
+        """Restore the generic dict-based ``dispatch``."""
+        cls.dispatch = cls._dispatch_lookup
@@ -0,0 +1,32 @@
+"""Generated dispatch functions for frozen buses."""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+
+def compile_dispatch(
+    handlers: dict[type, Callable[..., Any]],
+    fallback: Callable[..., Any],
+) -> Callable[..., Any]:
+    """Build an async ``dispatch(self, message, **kwargs)`` as an if-ladder.
+
+    Each registered message type becomes an ``is`` check against the
+    message's ``__dispatch_key__`` (its type, for objects that are not a
+    ``Message``) followed by a direct call to its handler,
+    so no dict lookup happens per call. Messages registered after the ladder
+    was built go through ``fallback``.
+    """
+    namespace: dict[str, Any] = {"_fallback": fallback}
+    lines = [
+        "async def dispatch(self, message, **kwargs):",
+        "    key = getattr(message, '__dispatch_key__', type(message))",
+    ]
+    for i, (message_type, handler) in enumerate(handlers.items()):
+        namespace[f"_t{i}"] = message_type
+        namespace[f"_h{i}"] = handler
+        lines.append(f"    if key is _t{i}:")
+        lines.append(f"        return await _h{i}(message, **kwargs)")
+    lines.append("    return await _fallback(self, message, **kwargs)")
+    exec(compile("\n".join(lines), "<bus-dispatch>", "exec"), namespace)
+    return namespace["dispatch"]
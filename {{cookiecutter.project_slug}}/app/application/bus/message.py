@@ -0,0 +1,33 @@
+"""Base classes for messages dispatched through the command and query buses."""
+
+from __future__ import annotations
+
+from typing import Any, ClassVar
+
+
+class Message:
+    """Base for bus messages.
+
+    Every subclass records itself as ``__dispatch_key__`` so the buses can
+    resolve handlers with a class-attribute load instead of calling ``type()``.
+    """
+
+    __slots__ = ()
+
+    __dispatch_key__: ClassVar[type]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls.__dispatch_key__ = cls
+
+
+class Command(Message):
+    """Base for commands handled by the CommandBus."""
+
+    __slots__ = ()
+
+
+class Query(Message):
+    """Base for queries handled by the QueryBus."""
+
+    __slots__ = ()
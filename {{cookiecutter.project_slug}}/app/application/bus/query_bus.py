@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any, Callable
+
+from app.application.bus.dispatch import compile_dispatch
+
+if TYPE_CHECKING:
+    from app.application.bus.message import Query
 
 
 class HandlerNotFoundError(Exception):
@@ -19,29 +24,50 @@ class DuplicateHandlerError(Exception):
         super().__init__(f"Handler already registered for {query_type.__name__}")
 
 
-class QueryBus:
-    """Dispatches queries to their registered handlers."""
+_HANDLERS: dict[type, Callable[..., Any]] = {}
 
-    _handlers: dict[type, Callable[..., Any]] = {}
 
-    @classmethod
-    def handler(cls, query_type: type) -> Callable[..., Any]:
-        """Decorator to register a query handler."""
+def query_handler(query_type: type) -> Callable[..., Any]:
+    """Decorator to register a query handler."""
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        if query_type in _HANDLERS:
+            raise DuplicateHandlerError(query_type)
+        _HANDLERS[query_type] = func
+        return func
 
-        def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
-            if query_type in cls._handlers:
-                raise DuplicateHandlerError(query_type)
-            cls._handlers[query_type] = func
-            return func
+    return decorator
 
-        return decorator
 
-    async def dispatch(self, query: Any, **kwargs: Any) -> Any:
+class QueryBus:
+    """Dispatches queries to their registered handlers.
+
+    Call :meth:`freeze` once every handler module has been imported to swap
+    the dict lookup for a generated if-ladder over the registered types.
+    """
+
+    async def dispatch(
+        self,
+        query: Query,
+        *,
+        _handlers: dict[type, Callable[..., Any]] = _HANDLERS,
+        **kwargs: Any,
+    ) -> Any:
         """Dispatch a query to its registered handler."""
-        handler = self._handlers.get(type(query))
-        if handler is None:
-            raise HandlerNotFoundError(type(query))
+        try:
+            handler = _handlers[getattr(query, "__dispatch_key__", type(query))]
+        except KeyError:
+            raise HandlerNotFoundError(type(query)) from None
         return await handler(query, **kwargs)
 
+    _dispatch_lookup = dispatch
+
+    @classmethod
+    def freeze(cls) -> None:
+        """Replace ``dispatch`` with one specialised to the current handlers."""
+        cls.dispatch = compile_dispatch(dict(_HANDLERS), cls._dispatch_lookup)
 
-query_handler = QueryBus.handler
+    @classmethod
+    def thaw(cls) -> None:
+        """Restore the generic dict-based ``dispatch``."""
+        cls.dispatch = cls._dispatch_lookup
@@ -4,9 +4,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from app.application.bus.message import Command
 
-@dataclass(frozen=True)
-class ChangePasswordCommand:
+
+@dataclass(frozen=True, slots=True)
+class ChangePasswordCommand(Command):
     """Command to change a user's password."""
 
     user_id: str
@@ -4,9 +4,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from app.application.bus.message import Command
 
-@dataclass(frozen=True)
-class CreateUserCommand:
+
+@dataclass(frozen=True, slots=True)
+class CreateUserCommand(Command):
     """Command to create a new user."""
 
     name: str
@@ -4,9 +4,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from app.application.bus.message import Command
 
-@dataclass(frozen=True)
-class LoginUserCommand:
+
+@dataclass(frozen=True, slots=True)
+class LoginUserCommand(Command):
     """Command to log in a user."""
 
     email: str
@@ -4,9 +4,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from app.application.bus.message import Command
 
-@dataclass(frozen=True)
-class LogoutUserCommand:
+
+@dataclass(frozen=True, slots=True)
+class LogoutUserCommand(Command):
     """Command to log out a user by revoking their refresh token."""
 
     refresh_token: str
@@ -4,9 +4,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from app.application.bus.message import Command
 
-@dataclass(frozen=True)
-class RefreshTokenCommand:
+
+@dataclass(frozen=True, slots=True)
+class RefreshTokenCommand(Command):
     """Command to refresh an access token."""
 
     refresh_token: str
@@ -4,9 +4,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from app.application.bus.message import Command
 
-@dataclass(frozen=True)
-class RegisterUserCommand:
+
+@dataclass(frozen=True, slots=True)
+class RegisterUserCommand(Command):
     """Command to register a new user."""
 
     name: str
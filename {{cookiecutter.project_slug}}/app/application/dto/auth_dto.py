@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel
+from dataclasses import dataclass
 
 
-class AuthTokensDTO(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class AuthTokensDTO:
     """Data transfer object for authentication tokens."""
 
     access_token: str
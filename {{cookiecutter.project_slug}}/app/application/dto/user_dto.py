@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel
+from dataclasses import dataclass
 
 
-class UserDTO(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class UserDTO:
     """Data transfer object for user data between layers."""
 
     id: str
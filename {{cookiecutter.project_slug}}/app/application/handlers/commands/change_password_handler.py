@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+import re
 import uuid
 from typing import TYPE_CHECKING
 
 from app.application.bus.command_bus import command_handler
 from app.application.commands.change_password import ChangePasswordCommand
+from app.application.services.blocking import run_blocking
+from app.domain.error_codes import INVALID_PASSWORD, INVALID_USER_ID, USER_NOT_FOUND
 from app.domain.errors import AuthenticationError, NotFoundError, ValidationError
 from app.domain.value_objects.user_id import UserId
 
@@ -14,6 +17,11 @@ if TYPE_CHECKING:
     from app.application.unit_of_work import UnitOfWork
     from app.domain.services.password_hasher import PasswordHasher
 
+# Canonical hyphenated form, as issued in the access token's ``sub`` claim
+_match_user_id = re.compile(
+    r"\A[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\Z", re.IGNORECASE
+).match
+
 
 @command_handler(ChangePasswordCommand)
 async def handle_change_password(
@@ -23,18 +31,17 @@ async def handle_change_password(
     password_hasher: PasswordHasher,
 ) -> None:
     """Verify old password, update to new password."""
-    try:
-        parsed_user_id = uuid.UUID(command.user_id)
-    except ValueError:
-        raise ValidationError(code="INVALID_USER_ID", message="Malformed user ID")
+    if _match_user_id(command.user_id) is None:
+        raise ValidationError(code=INVALID_USER_ID, message="Malformed user ID")
+    parsed_user_id = uuid.UUID(command.user_id)
 
     async with uow:
         user = await uow.user_repository.get_by_id(UserId(value=parsed_user_id))
         if user is None:
-            raise NotFoundError(code="USER_NOT_FOUND", message="User not found")
+            raise NotFoundError(code=USER_NOT_FOUND, message="User not found")
 
-        if not password_hasher.verify(command.old_password, user.password_hash):
-            raise AuthenticationError(code="INVALID_PASSWORD", message="Current password is incorrect")
+        if not await run_blocking(password_hasher.verify, command.old_password, user.password_hash):
+            raise AuthenticationError(code=INVALID_PASSWORD, message="Current password is incorrect")
 
-        user.update_password(password_hasher.hash(command.new_password))
+        user.update_password(await run_blocking(password_hasher.hash, command.new_password))
         await uow.user_repository.save(user)
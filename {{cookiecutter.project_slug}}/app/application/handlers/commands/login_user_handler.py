@@ -8,14 +8,17 @@ from typing import TYPE_CHECKING
 from app.application.bus.command_bus import command_handler
 from app.application.commands.login_user import LoginUserCommand
 from app.application.dto.auth_dto import AuthTokensDTO
+from app.application.services.blocking import run_blocking
+from app.domain.error_codes import INVALID_CREDENTIALS
 from app.domain.errors import AuthenticationError
-from app.domain.interfaces.refresh_token_repository import RefreshTokenRecord
 
 if TYPE_CHECKING:
     from app.application.services.token_service import TokenService
     from app.application.unit_of_work import UnitOfWork
     from app.domain.services.password_hasher import PasswordHasher
 
+_now = datetime.now
+
 
 @command_handler(LoginUserCommand)
 async def handle_login_user(
@@ -26,28 +29,44 @@ async def handle_login_user(
     token_service: TokenService,
 ) -> AuthTokensDTO:
     """Authenticate user by email/password, return tokens."""
+    user = await uow.user_reader.get_by_email(command.email)
+    # Always run a full verify, off the event loop, so unknown emails cost the
+    # same as wrong passwords and hashing never blocks other requests.
+    verified = await run_blocking(
+        _verify, password_hasher, command.password, None if user is None else user.password_hash
+    )
+    if user is None or not verified:
+        raise AuthenticationError(code=INVALID_CREDENTIALS, message="Invalid email or password")
+
+    # Upgrade legacy or outdated hashes while the plaintext is at hand
+    new_hash = None
+    if password_hasher.needs_rehash(user.password_hash):
+        new_hash = await run_blocking(password_hasher.hash, command.password)
+
+    user_id = str(user.id_.value)
+    now = _now(UTC)
+    access_token = token_service.create_access_token(user_id, now=now)
+    refresh_token, record = token_service.issue_refresh_token(user_id, now=now)
+
     async with uow:
-        user = await uow.user_repository.get_by_email(command.email)
-        if user is None or not password_hasher.verify(command.password, user.password_hash):
-            raise AuthenticationError(code="INVALID_CREDENTIALS", message="Invalid email or password")
-
-        user_id = str(user.id_.value)
-        access_token = token_service.create_access_token(user_id)
-        refresh_token, token_id, expires_at = token_service.create_refresh_token(user_id)
-
-        await uow.refresh_token_repository.save(
-            RefreshTokenRecord(
-                id=token_id,
-                user_id=user_id,
-                token_hash=token_service.hash_token(refresh_token),
-                expires_at=expires_at,
-                revoked_at=None,
-                created_at=datetime.now(UTC),
-            )
-        )
+        if new_hash is not None:
+            # Reload inside the transaction: reader results may be shared cache entries
+            current = await uow.user_repository.get_by_id(user.id_)
+            if current is not None:
+                current.update_password(new_hash)
+                await uow.user_repository.save(current)
+        await uow.refresh_token_repository.save(record)
 
     return AuthTokensDTO(
         access_token=access_token,
         refresh_token=refresh_token,
         expires_in=token_service.access_token_expire_minutes * 60,
     )
+
+
+def _verify(password_hasher: PasswordHasher, password: str, password_hash: str | None) -> bool:
+    # dummy_hash is itself a password hash computed on first use, so it is
+    # resolved here, in the worker thread, rather than on the event loop.
+    if password_hash is None:
+        password_hash = password_hasher.dummy_hash
+    return password_hasher.verify(password, password_hash)
@@ -6,6 +6,8 @@ from typing import TYPE_CHECKING
 
 from app.application.bus.command_bus import command_handler
 from app.application.commands.logout_user import LogoutUserCommand
+from app.domain.error_codes import TOKEN_REVOKED
+from app.domain.errors import AuthenticationError
 
 if TYPE_CHECKING:
     from app.application.services.token_service import TokenService
@@ -19,10 +21,18 @@ async def handle_logout_user(
     uow: UnitOfWork,
     token_service: TokenService,
 ) -> None:
-    """Revoke the refresh token to log out."""
+    """Revoke the refresh token to log out.
+
+    Logging out with a token that was already revoked is a no-op. If a
+    concurrent refresh revokes it first, the session lives on under the new
+    pair, so that case is reported as TOKEN_REVOKED instead.
+    """
     token_hash = token_service.hash_token(command.refresh_token)
 
+    record = await uow.refresh_token_reader.get_by_token_hash(token_hash)
+    if record is None or record.revoked_at is not None:
+        return
+
     async with uow:
-        record = await uow.refresh_token_repository.get_by_token_hash(token_hash)
-        if record is not None and record.revoked_at is None:
-            await uow.refresh_token_repository.revoke(record.id)
+        if not await uow.refresh_token_repository.revoke(record.id):
+            raise AuthenticationError(code=TOKEN_REVOKED, message="Refresh token has been revoked")
@@ -8,13 +8,15 @@ from typing import TYPE_CHECKING
 from app.application.bus.command_bus import command_handler
 from app.application.commands.refresh_token import RefreshTokenCommand
 from app.application.dto.auth_dto import AuthTokensDTO
+from app.domain.error_codes import INVALID_TOKEN, TOKEN_EXPIRED, TOKEN_REVOKED
 from app.domain.errors import AuthenticationError
-from app.domain.interfaces.refresh_token_repository import RefreshTokenRecord
 
 if TYPE_CHECKING:
     from app.application.services.token_service import TokenService
     from app.application.unit_of_work import UnitOfWork
 
+_now = datetime.now
+
 
 @command_handler(RefreshTokenCommand)
 async def handle_refresh_token(
@@ -25,41 +27,35 @@ async def handle_refresh_token(
 ) -> AuthTokensDTO:
     """Validate refresh token, issue new pair, revoke old."""
     try:
-        payload = token_service.decode_token(command.refresh_token)
+        payload = token_service.decode_refresh_token(command.refresh_token)
     except Exception as exc:
-        raise AuthenticationError(code="INVALID_TOKEN", message="Invalid or expired refresh token") from exc
+        raise AuthenticationError(code=INVALID_TOKEN, message="Invalid or expired refresh token") from exc
 
     if payload.get("type") != "refresh":
-        raise AuthenticationError(code="INVALID_TOKEN", message="Token is not a refresh token")
+        raise AuthenticationError(code=INVALID_TOKEN, message="Token is not a refresh token")
 
     token_hash = token_service.hash_token(command.refresh_token)
 
-    async with uow:
-        record = await uow.refresh_token_repository.get_by_token_hash(token_hash)
-        if record is None or record.revoked_at is not None:
-            raise AuthenticationError(code="TOKEN_REVOKED", message="Refresh token has been revoked")
+    now = _now(UTC)
+    record = await uow.refresh_token_reader.get_by_token_hash(token_hash)
+    if record is None or record.revoked_at is not None:
+        raise AuthenticationError(code=TOKEN_REVOKED, message="Refresh token has been revoked")
 
-        if record.expires_at < datetime.now(UTC):
-            raise AuthenticationError(code="TOKEN_EXPIRED", message="Refresh token has expired")
+    if record.expires_at < now:
+        raise AuthenticationError(code=TOKEN_EXPIRED, message="Refresh token has expired")
 
-        # Revoke old refresh token
-        await uow.refresh_token_repository.revoke(record.id)
+    async with uow:
+        # Revoke old refresh token. The check above ran outside the
+        # transaction, so a concurrent replay is only caught here
+        if not await uow.refresh_token_repository.revoke(record.id):
+            raise AuthenticationError(code=TOKEN_REVOKED, message="Refresh token has been revoked")
 
         # Issue new pair
         user_id = payload["sub"]
-        access_token = token_service.create_access_token(user_id)
-        new_refresh_token, new_token_id, expires_at = token_service.create_refresh_token(user_id)
+        access_token = token_service.create_access_token(user_id, now=now)
+        new_refresh_token, new_record = token_service.issue_refresh_token(user_id, now=now)
 
-        await uow.refresh_token_repository.save(
-            RefreshTokenRecord(
-                id=new_token_id,
-                user_id=user_id,
-                token_hash=token_service.hash_token(new_refresh_token),
-                expires_at=expires_at,
-                revoked_at=None,
-                created_at=datetime.now(UTC),
-            )
-        )
+        await uow.refresh_token_repository.save(new_record)
 
     return AuthTokensDTO(
         access_token=access_token,
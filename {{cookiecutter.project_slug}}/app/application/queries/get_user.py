@@ -4,9 +4,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from app.application.bus.message import Query
 
-@dataclass(frozen=True)
-class GetUserQuery:
+
+@dataclass(frozen=True, slots=True)
+class GetUserQuery(Query):
     """Query to retrieve a user by ID."""
 
     user_id: str
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel
+from dataclasses import dataclass
 
 
-class UserReadModel(BaseModel):
+@dataclass(frozen=True, slots=True, kw_only=True)
+class UserReadModel:
     """Read-optimized user model mapped directly from SQL results."""
 
     id: str
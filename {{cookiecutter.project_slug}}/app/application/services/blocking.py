@@ -0,0 +1,49 @@
+"""Bounded thread pool for CPU-heavy calls made from async handlers."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+def usable_cpu_count() -> int:
+    """CPUs this process may run on, honouring affinity and cpusets (min 1).
+
+    ``os.cpu_count()`` reports every core on the host, which oversizes the
+    pool inside a CPU-pinned container.
+    """
+    process_cpu_count = getattr(os, "process_cpu_count", None)  # Python 3.13+
+    if process_cpu_count is not None:
+        return process_cpu_count() or 1
+    try:
+        return len(os.sched_getaffinity(0)) or 1
+    except AttributeError:  # not available on macOS / Windows
+        return os.cpu_count() or 1
+
+
+@lru_cache
+def get_blocking_pool() -> ThreadPoolExecutor:
+    """Return the process-wide pool, one thread per usable CPU.
+
+    Password hashing releases the GIL, so one thread per core is enough; a
+    burst of logins queues here instead of spawning a thread each, and the
+    hashes of concurrent logins run in parallel across cores.
+    """
+    return ThreadPoolExecutor(max_workers=usable_cpu_count(), thread_name_prefix="blocking")
+
+
+async def run_blocking(func: Callable[..., T], /, *args: Any) -> T:
+    """Run ``func(*args)`` in the blocking pool without stalling the event loop."""
+    return await asyncio.get_running_loop().run_in_executor(get_blocking_pool(), func, *args)
+
+
+def shutdown_blocking_pool() -> None:
+    """Shut the pool down if it was ever created."""
+    if get_blocking_pool.cache_info().currsize:
+        get_blocking_pool().shutdown(wait=False, cancel_futures=True)
+        get_blocking_pool.cache_clear()
@@ -3,12 +3,22 @@
 from __future__ import annotations
 
 import hashlib
-import uuid
+import os
 from datetime import UTC, datetime, timedelta
 
 import jwt
 
+from app.domain.error_codes import INVALID_TOKEN
 from app.domain.errors import AuthenticationError
+from app.domain.interfaces.refresh_token_repository import RefreshTokenRecord
+
+_urandom = os.urandom
+_now = datetime.now
+
+
+def _new_jti() -> str:
+    """Return a random 128-bit token id as 32 hex characters."""
+    return _urandom(16).hex()
 
 
 class TokenService:
@@ -26,31 +36,46 @@ class TokenService:
         self._algorithm = algorithm
         self._access_token_expire_minutes = access_token_expire_minutes
         self._refresh_token_expire_days = refresh_token_expire_days
+        self._access_delta = timedelta(minutes=access_token_expire_minutes)
+        self._refresh_delta = timedelta(days=refresh_token_expire_days)
+        self._algorithms = [algorithm]
+        self._jwt = jwt.PyJWT()
+        self._encode = self._jwt.encode
+        self._decode = self._jwt.decode
+        self._access_options = {"require": ["exp", "sub", "type"]}
+        # Refresh tokens are checked against refresh_token_repository, whose
+        # expires_at is authoritative, so PyJWT need not parse exp itself.
+        self._refresh_options = {"verify_exp": False, "require": ["sub", "type"]}
 
     @property
     def access_token_expire_minutes(self) -> int:
         return self._access_token_expire_minutes
 
-    def create_access_token(self, user_id: str) -> str:
-        """Create a short-lived access token."""
-        now = datetime.now(UTC)
+    def create_access_token(self, user_id: str, *, now: datetime | None = None) -> str:
+        """Create a short-lived access token.
+
+        ``now`` lets callers issuing several tokens share one timestamp.
+        """
+        if now is None:
+            now = _now(UTC)
         payload = {
             "sub": user_id,
             "type": "access",
             "iat": now,
-            "exp": now + timedelta(minutes=self._access_token_expire_minutes),
-            "jti": str(uuid.uuid4()),
+            "exp": now + self._access_delta,
+            "jti": _new_jti(),
         }
-        return jwt.encode(payload, self._secret_key, algorithm=self._algorithm)
+        return self._encode(payload, self._secret_key, algorithm=self._algorithm)
 
-    def create_refresh_token(self, user_id: str) -> tuple[str, str, datetime]:
+    def create_refresh_token(self, user_id: str, *, now: datetime | None = None) -> tuple[str, str, datetime]:
         """Create a long-lived refresh token.
 
         Returns (encoded_token, token_id, expires_at).
         """
-        now = datetime.now(UTC)
-        token_id = str(uuid.uuid4())
-        expires_at = now + timedelta(days=self._refresh_token_expire_days)
+        if now is None:
+            now = _now(UTC)
+        token_id = _new_jti()
+        expires_at = now + self._refresh_delta
         payload = {
             "sub": user_id,
             "type": "refresh",
@@ -58,22 +83,56 @@ class TokenService:
             "exp": expires_at,
             "jti": token_id,
         }
-        encoded = jwt.encode(payload, self._secret_key, algorithm=self._algorithm)
+        encoded = self._encode(payload, self._secret_key, algorithm=self._algorithm)
         return encoded, token_id, expires_at
 
+    def issue_refresh_token(self, user_id: str, *, now: datetime | None = None) -> tuple[str, RefreshTokenRecord]:
+        """Create a refresh token together with the record to persist for it.
+
+        Returns (encoded_token, record); the record stores only the token's hash.
+        """
+        if now is None:
+            now = _now(UTC)
+        encoded, token_id, expires_at = self.create_refresh_token(user_id, now=now)
+        record = RefreshTokenRecord(
+            id=token_id,
+            user_id=user_id,
+            token_hash=self.hash_token(encoded),
+            expires_at=expires_at,
+            revoked_at=None,
+            created_at=now,
+        )
+        return encoded, record
+
     def decode_token(self, token: str) -> dict:
         """Decode and validate a JWT token.
 
         Raises AuthenticationError if token is invalid, expired, or malformed.
         """
+        return self._decode_with(token, self._access_options)
+
+    def decode_refresh_token(self, token: str) -> dict:
+        """Decode a refresh token, verifying its signature but not ``exp``.
+
+        Expiry is enforced by the caller against the stored refresh token record.
+        Raises AuthenticationError if token is invalid or malformed.
+        """
+        return self._decode_with(token, self._refresh_options)
+
+    def _decode_with(self, token: str, options: dict) -> dict:
         try:
-            return jwt.decode(token, self._secret_key, algorithms=[self._algorithm])
-        except (jwt.InvalidTokenError, jwt.ExpiredSignatureError) as exc:
+            return self._decode(token, self._secret_key, algorithms=self._algorithms, options=options)
+        except jwt.InvalidTokenError as exc:
             raise AuthenticationError(
-                code="INVALID_TOKEN", message="Token is invalid or expired"
+                code=INVALID_TOKEN, message="Token is invalid or expired"
             ) from exc
 
     @staticmethod
     def hash_token(token: str) -> str:
-        """Hash a token for storage (refresh tokens are stored hashed)."""
+        """Hash a token for storage (refresh tokens are stored hashed).
+
+        ``hashlib.sha256`` is backed by OpenSSL, which uses the CPU's SHA
+        extensions where present; a JWT fits in a few blocks, so this is
+        negligible next to signing.
+        """
         return hashlib.sha256(token.encode()).hexdigest()
@@ -19,6 +19,16 @@ class UnitOfWork(Protocol):
     @property
     def refresh_token_repository(self) -> RefreshTokenRepositoryInterface: ...
 
+    @property
+    def user_reader(self) -> UserRepositoryInterface:
+        """User repository usable outside the transaction, for reads only."""
+        ...
+
+    @property
+    def refresh_token_reader(self) -> RefreshTokenRepositoryInterface:
+        """Refresh token repository usable outside the transaction, for reads only."""
+        ...
+
     async def __aenter__(self) -> UnitOfWork: ...
 
     async def __aexit__(
@@ -5,6 +5,7 @@ from __future__ import annotations
 from datetime import UTC, datetime
 
 from app.domain.entities.base import Entity
+from app.domain.error_codes import INVALID_EMAIL, INVALID_NAME
 from app.domain.errors import ValidationError
 from app.domain.value_objects.user_id import UserId
 
@@ -42,6 +43,33 @@ class UserEntity(Entity[UserId]):
             created_at=datetime.now(UTC),
         )
 
+    @classmethod
+    def rehydrate(
+        cls,
+        *,
+        id_: UserId,
+        name: str,
+        email: str,
+        password_hash: str,
+        created_at: datetime,
+        updated_at: datetime | None = None,
+    ) -> UserEntity:
+        """Rebuild a persisted user without validation.
+
+        For repositories loading trusted rows: writes the attributes straight
+        into ``__dict__`` instead of going through the guarded ``__setattr__``.
+        """
+        user = object.__new__(cls)
+        user.__dict__.update(
+            id_=id_,
+            name=name,
+            email=email,
+            password_hash=password_hash,
+            created_at=created_at,
+            updated_at=updated_at,
+        )
+        return user
+
     def update_password(self, password_hash: str) -> None:
         """Update the user's password hash."""
         self.password_hash = password_hash
@@ -55,10 +83,10 @@ class UserEntity(Entity[UserId]):
 
     @staticmethod
     def _validate_name(name: str) -> None:
-        if not name or not name.strip():
-            raise ValidationError(code="INVALID_NAME", message="Name must be non-empty")
+        if not name or name.isspace():
+            raise ValidationError(code=INVALID_NAME, message="Name must be non-empty")
 
     @staticmethod
     def _validate_email(email: str) -> None:
         if not email or "@" not in email:
-            raise ValidationError(code="INVALID_EMAIL", message="Email must contain @")
+            raise ValidationError(code=INVALID_EMAIL, message="Email must contain @")
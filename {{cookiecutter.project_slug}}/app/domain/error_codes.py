@@ -0,0 +1,31 @@
+"""Machine-readable error codes carried by DomainError.code.
+
+Import these instead of repeating string literals, so callers that branch on
+a code share one definition with the code that raises it.
+"""
+
+from __future__ import annotations
+
+# Defaults for the DomainError hierarchy
+DOMAIN_ERROR = "DOMAIN_ERROR"
+NOT_FOUND = "NOT_FOUND"
+CONFLICT = "CONFLICT"
+VALIDATION_ERROR = "VALIDATION_ERROR"
+AUTHENTICATION_ERROR = "AUTHENTICATION_ERROR"
+AUTHORIZATION_ERROR = "AUTHORIZATION_ERROR"
+RATE_LIMIT_EXCEEDED = "RATE_LIMIT_EXCEEDED"
+
+# Users
+USER_NOT_FOUND = "USER_NOT_FOUND"
+USER_ALREADY_EXISTS = "USER_ALREADY_EXISTS"
+EMAIL_TAKEN = "EMAIL_TAKEN"
+INVALID_USER_ID = "INVALID_USER_ID"
+INVALID_NAME = "INVALID_NAME"
+INVALID_EMAIL = "INVALID_EMAIL"
+
+# Authentication
+INVALID_CREDENTIALS = "INVALID_CREDENTIALS"
+INVALID_PASSWORD = "INVALID_PASSWORD"
+INVALID_TOKEN = "INVALID_TOKEN"
+TOKEN_REVOKED = "TOKEN_REVOKED"
+TOKEN_EXPIRED = "TOKEN_EXPIRED"
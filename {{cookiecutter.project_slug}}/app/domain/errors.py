@@ -6,6 +6,16 @@ human-readable message, optional details dict, and HTTP status code.
 
 from __future__ import annotations
 
+from app.domain.error_codes import (
+    AUTHENTICATION_ERROR,
+    AUTHORIZATION_ERROR,
+    CONFLICT,
+    DOMAIN_ERROR,
+    NOT_FOUND,
+    RATE_LIMIT_EXCEEDED,
+    VALIDATION_ERROR,
+)
+
 
 class DomainError(Exception):
     """Base domain error."""
@@ -13,7 +23,7 @@ class DomainError(Exception):
     def __init__(
         self,
         *,
-        code: str = "DOMAIN_ERROR",
+        code: str = DOMAIN_ERROR,
         message: str = "A domain error occurred",
         details: dict | None = None,
         status_code: int = 400,
@@ -31,7 +41,7 @@ class NotFoundError(DomainError):
     def __init__(
         self,
         *,
-        code: str = "NOT_FOUND",
+        code: str = NOT_FOUND,
         message: str = "Resource not found",
         details: dict | None = None,
     ) -> None:
@@ -44,7 +54,7 @@ class ConflictError(DomainError):
     def __init__(
         self,
         *,
-        code: str = "CONFLICT",
+        code: str = CONFLICT,
         message: str = "Resource conflict",
         details: dict | None = None,
     ) -> None:
@@ -57,7 +67,7 @@ class ValidationError(DomainError):
     def __init__(
         self,
         *,
-        code: str = "VALIDATION_ERROR",
+        code: str = VALIDATION_ERROR,
         message: str = "Validation failed",
         details: dict | None = None,
     ) -> None:
@@ -70,7 +80,7 @@ class AuthenticationError(DomainError):
     def __init__(
         self,
         *,
-        code: str = "AUTHENTICATION_ERROR",
+        code: str = AUTHENTICATION_ERROR,
         message: str = "Authentication failed",
         details: dict | None = None,
     ) -> None:
@@ -83,7 +93,7 @@ class AuthorizationError(DomainError):
     def __init__(
         self,
         *,
-        code: str = "AUTHORIZATION_ERROR",
+        code: str = AUTHORIZATION_ERROR,
         message: str = "Permission denied",
         details: dict | None = None,
     ) -> None:
@@ -96,7 +106,7 @@ class RateLimitError(DomainError):
     def __init__(
         self,
         *,
-        code: str = "RATE_LIMIT_EXCEEDED",
+        code: str = RATE_LIMIT_EXCEEDED,
         message: str = "Rate limit exceeded",
         details: dict | None = None,
     ) -> None:
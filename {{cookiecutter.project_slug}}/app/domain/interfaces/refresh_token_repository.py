@@ -1,13 +1,16 @@
-"""Abstract repository interface for refresh tokens."""
+"""Repository protocol for refresh tokens."""
 
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
+from typing import TYPE_CHECKING, Protocol, runtime_checkable
 
 from app.domain.value_objects.base import ValueObject
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
 
 @dataclass(frozen=True, slots=True, repr=False)
 class RefreshTokenRecord(ValueObject):
@@ -20,18 +23,43 @@ class RefreshTokenRecord(ValueObject):
     revoked_at: datetime | None
     created_at: datetime
 
+    @classmethod
+    def rehydrate(
+        cls,
+        *,
+        id: str,  # noqa: A002
+        user_id: str,
+        token_hash: str,
+        expires_at: datetime,
+        revoked_at: datetime | None,
+        created_at: datetime,
+    ) -> RefreshTokenRecord:
+        """Rebuild a stored record, bypassing ``ValueObject.__new__`` and ``__init__``.
+
+        For repositories mapping trusted rows; fields are written straight
+        into the slots.
+        """
+        record = object.__new__(cls)
+        _set = object.__setattr__
+        _set(record, "id", id)
+        _set(record, "user_id", user_id)
+        _set(record, "token_hash", token_hash)
+        _set(record, "expires_at", expires_at)
+        _set(record, "revoked_at", revoked_at)
+        _set(record, "created_at", created_at)
+        return record
 
-class RefreshTokenRepositoryInterface(ABC):
-    """Abstract refresh token repository contract."""
 
-    @abstractmethod
+@runtime_checkable
+class RefreshTokenRepositoryInterface(Protocol):
+    """Protocol for refresh token persistence."""
+
     async def save(self, record: RefreshTokenRecord) -> None: ...
 
-    @abstractmethod
+    async def save_many(self, records: Sequence[RefreshTokenRecord]) -> None: ...
+
     async def get_by_token_hash(self, token_hash: str) -> RefreshTokenRecord | None: ...
 
-    @abstractmethod
-    async def revoke(self, token_id: str) -> None: ...
+    async def revoke(self, token_id: str) -> bool: ...
 
-    @abstractmethod
     async def revoke_all_for_user(self, user_id: str) -> None: ...
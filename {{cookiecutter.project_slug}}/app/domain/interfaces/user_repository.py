@@ -1,26 +1,22 @@
-"""Abstract repository interface for User entities."""
+"""Repository protocol for User entities."""
 
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Protocol, runtime_checkable
 
 if TYPE_CHECKING:
     from app.domain.entities.user import UserEntity
     from app.domain.value_objects.user_id import UserId
 
 
-class UserRepositoryInterface(ABC):
-    """Abstract User repository contract for the domain layer."""
+@runtime_checkable
+class UserRepositoryInterface(Protocol):
+    """Protocol for User persistence, implemented by the infrastructure layer."""
 
-    @abstractmethod
     async def get_by_id(self, user_id: UserId) -> UserEntity | None: ...
 
-    @abstractmethod
     async def save(self, user: UserEntity) -> None: ...
 
-    @abstractmethod
     async def get_by_email(self, email: str) -> UserEntity | None: ...
 
-    @abstractmethod
     async def list_all(self) -> list[UserEntity]: ...
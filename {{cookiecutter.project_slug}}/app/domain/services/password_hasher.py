@@ -7,8 +7,17 @@ from typing import Protocol, runtime_checkable
 
 @runtime_checkable
 class PasswordHasher(Protocol):
-    """Protocol for password hashing. Keeps bcrypt out of the domain layer."""
+    """Protocol for password hashing. Keeps argon2 and bcrypt out of the domain layer."""
 
     def hash(self, password: str) -> str: ...
 
     def verify(self, password: str, password_hash: str) -> bool: ...
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        """Whether ``password_hash`` should be replaced by a fresh ``hash()``."""
+        ...
+
+    @property
+    def dummy_hash(self) -> str:
+        """A valid hash of an unguessable password, for verifying unknown users."""
+        ...
@@ -1,5 +1,6 @@
 """Base ValueObject class for domain value objects."""
 
+from collections.abc import Callable
 from dataclasses import dataclass, fields
 from typing import Any, Self
 
@@ -18,8 +19,31 @@ class ValueObject:
             raise TypeError("Base ValueObject cannot be instantiated directly.")
         return object.__new__(cls)
 
+    def __init_subclass__(cls) -> None:
+        # Never inherit a parent's compiled __repr__: it names the parent's fields.
+        if "__repr__" not in cls.__dict__:
+            cls.__repr__ = ValueObject.__repr__
+
     def __repr__(self) -> str:
-        field_str = ", ".join(
-            f"{f.name}={getattr(self, f.name)!r}" for f in fields(self)
-        )
-        return f"{type(self).__name__}({field_str})"
+        # First repr of a class: compile a specialised __repr__ for it and
+        # install it, so later calls skip this method entirely.
+        cls = type(self)
+        cls.__repr__ = _compile_repr(cls)
+        return cls.__repr__(self)
+
+
+def _compile_repr(cls: type[ValueObject]) -> Callable[[ValueObject], str]:
+    """Build ``cls.__repr__`` from source, as ``@dataclass(repr=True)`` does.
+
+    Fields are only known once ``@dataclass`` has run, which is after
+    ``__init_subclass__``, so this happens on the first repr instead.
+    """
+    names = tuple(f.name for f in fields(cls))
+    cls.__vo_field_names__ = names
+    body = ", ".join(name + "={self." + name + "!r}" for name in names)
+    source = "def __repr__(self):\n    return f'" + cls.__name__ + "(" + body + ")'"
+    namespace: dict[str, Any] = {}
+    exec(source, {}, namespace)
+    fn = namespace["__repr__"]
+    fn.__qualname__ = f"{cls.__qualname__}.__repr__"
+    return fn
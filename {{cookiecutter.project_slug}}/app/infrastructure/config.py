@@ -2,9 +2,18 @@
 
 from __future__ import annotations
 
+import os
+from functools import cached_property, lru_cache
+
+from pydantic import Field
 from pydantic_settings import BaseSettings
 
 
+def default_pool_size() -> int:
+    """Two connections per CPU, at least RowQuery's default of 5 and at most 25."""
+    return min(max(2 * (os.cpu_count() or 1), 5), 25)
+
+
 class Settings(BaseSettings):
     """Application settings loaded from environment variables and .env file."""
 
@@ -36,9 +45,16 @@ class Settings(BaseSettings):
     db_password: str = ""
     {%- endif %}
 
-    @property
+    # Connection pool. RowQuery opens db_pool_size connections up front and
+    # fails fast when they are all checked out, so size it to expected concurrency
+    db_pool_size: int = Field(default_factory=default_pool_size)
+    # psycopg prepares a query server-side once it has run this many times on
+    # a pooled connection (0 = on first use, None = never). SQLite ignores it
+    db_prepare_threshold: int | None = 0
+
+    @cached_property
     def database_url(self) -> str:
-        """Build the database connection URL."""
+        """Build the database connection URL (computed once per instance)."""
         {% if cookiecutter.db_driver == "postgresql" -%}
         return f"postgresql+asyncpg://{self.db_user}:{self.db_password}@{self.db_host}:{self.db_port}/{self.db_name}"
         {%- else -%}
@@ -46,3 +62,9 @@ class Settings(BaseSettings):
         {%- endif %}
 
     model_config = {"env_file": ".env", "env_file_encoding": "utf-8"}
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings, parsing env vars and ``.env`` only once."""
+    return Settings()
@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import logging
+from typing import TYPE_CHECKING, Any
 
 from row_query import AsyncEngine, ConnectionConfig, SQLRegistry
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from app.infrastructure.config import Settings
 
+logger = logging.getLogger(__name__)
+
 
 def create_engine(settings: Settings) -> AsyncEngine:
     """Create and configure the async database engine."""
@@ -20,8 +25,41 @@ def create_engine(settings: Settings) -> AsyncEngine:
             database=settings.db_name,
             user=settings.db_user,
             password=settings.db_password,
+            pool_size=settings.db_pool_size,
         )
     else:
-        config = ConnectionConfig(driver="sqlite", database=settings.db_name)
+        config = ConnectionConfig(driver="sqlite", database=settings.db_name, pool_size=settings.db_pool_size)
     registry = SQLRegistry(root_dir="app/infrastructure/sql")
     return AsyncEngine.from_config(config, registry)
+
+
+def configure_prepared_statements(engine: AsyncEngine, settings: Settings) -> None:
+    """Let pooled PostgreSQL connections reuse server-side prepared statements.
+
+    Call once the pool exists (``run_migrations`` initialises it). Pooled
+    connections live for the whole process, so each one prepares a registry
+    query once and reuses its plan. SQLite connections already keep a
+    per-connection cache of compiled statements.
+    """
+    if settings.db_driver != "postgresql":
+        return
+    for connection in _pooled_connections(engine):
+        connection.prepare_threshold = settings.db_prepare_threshold
+
+
+def _pooled_connections(engine: AsyncEngine) -> Iterable[Any]:
+    """Return the engine's open pool connections.
+
+    RowQuery has no public accessor for them, so this reads its private
+    ``_connection_manager._pool``. If a RowQuery upgrade moves it, warn and
+    return nothing rather than fail startup: queries still work, they just
+    stop reusing prepared statements.
+    """
+    manager = getattr(engine, "_connection_manager", None)
+    if manager is None or not hasattr(manager, "_pool"):
+        logger.warning(
+            "RowQuery engine exposes no _connection_manager._pool; "
+            "prepared statements are not configured for pooled connections"
+        )
+        return ()
+    return manager._pool or ()
@@ -0,0 +1,84 @@
+"""Column converters shared by the RowQuery repositories.
+
+Ids are stored as TEXT on every driver (see sql/migrations), so strings are
+the common case and are checked first. Refresh token timestamps are BIGINT
+milliseconds since the epoch; user timestamps are still ISO strings. datetime
+values pass through for drivers or callers that already produce them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import uuid
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+T = TypeVar("T")
+
+MAP_BATCH_SIZE = 500
+
+_fromisoformat = datetime.fromisoformat
+_fromtimestamp = datetime.fromtimestamp
+_UUID = uuid.UUID
+
+
+def now_epoch_ms() -> int:
+    """Current time in milliseconds since the Unix epoch, without a datetime."""
+    return time.time_ns() // 1_000_000
+
+
+def to_epoch_ms(value: datetime) -> int:
+    """Convert an aware datetime to milliseconds since the Unix epoch."""
+    return int(value.timestamp() * 1000)
+
+
+def to_optional_epoch_ms(value: datetime | None) -> int | None:
+    """Like :func:`to_epoch_ms`, passing ``None`` through."""
+    return None if value is None else to_epoch_ms(value)
+
+
+def to_datetime(value: int | str | datetime) -> datetime:
+    """Convert a stored timestamp column (epoch ms or ISO string) to a datetime."""
+    if value.__class__ is int:
+        return _fromtimestamp(value / 1000, UTC)
+    if value.__class__ is str:
+        return _fromisoformat(value)
+    if isinstance(value, datetime):
+        return value
+    raise TypeError(f"Expected epoch ms, ISO string or datetime, got {type(value).__name__}")
+
+
+def to_optional_datetime(value: int | str | datetime | None) -> datetime | None:
+    """Like :func:`to_datetime`, passing ``None`` through."""
+    return None if value is None else to_datetime(value)
+
+
+def to_uuid(value: str | uuid.UUID) -> uuid.UUID:
+    """Convert a stored id column to a UUID."""
+    if value.__class__ is str:
+        return _UUID(value)
+    if isinstance(value, uuid.UUID):
+        return value
+    raise TypeError(f"Expected UUID string or UUID, got {type(value).__name__}")
+
+
+async def map_rows(
+    rows: Sequence[Any], convert: Callable[[Any], T], *, batch_size: int = MAP_BATCH_SIZE
+) -> list[T]:
+    """Convert ``rows`` in batches, yielding to the event loop between batches.
+
+    RowQuery returns whole result sets, so large ``list_all`` style queries
+    would otherwise map every row in one uninterrupted stretch of CPU.
+    """
+    if len(rows) <= batch_size:
+        return [convert(row) for row in rows]
+    mapped: list[T] = []
+    for start in range(0, len(rows), batch_size):
+        if start:
+            await asyncio.sleep(0)
+        mapped.extend(map(convert, rows[start : start + batch_size]))
+    return mapped
@@ -2,11 +2,46 @@
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
-from typing import Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 from app.domain.interfaces.refresh_token_repository import RefreshTokenRecord, RefreshTokenRepositoryInterface
-from app.infrastructure.errors import DatabaseError, DataMappingError
+from app.infrastructure.db.mapping import (
+    now_epoch_ms,
+    to_datetime,
+    to_epoch_ms,
+    to_optional_datetime,
+    to_optional_epoch_ms,
+)
+from app.infrastructure.errors import DataMappingError, wrap_database_errors
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+_INSERT_COLUMNS = ("id", "user_id", "token_hash", "expires_at", "revoked_at", "created_at")
+
+# 100 rows x 6 columns stays below SQLite's historical 999 bind-parameter limit.
+SAVE_MANY_BATCH_SIZE = 100
+
+
+@lru_cache(maxsize=8)
+def _insert_many_sql(rows: int) -> str:
+    """Multi-row INSERT with ``:<column>_<row>`` placeholders for ``rows`` records."""
+    values = ", ".join(
+        "(" + ", ".join(f":{column}_{row}" for column in _INSERT_COLUMNS) + ")" for row in range(rows)
+    )
+    return f"INSERT INTO refresh_tokens ({', '.join(_INSERT_COLUMNS)}) VALUES {values}"
+
+
+def _insert_params(record: RefreshTokenRecord) -> dict[str, Any]:
+    return {
+        "id": record.id,
+        "user_id": record.user_id,
+        "token_hash": record.token_hash,
+        "expires_at": to_epoch_ms(record.expires_at),
+        "revoked_at": to_optional_epoch_ms(record.revoked_at),
+        "created_at": to_epoch_ms(record.created_at),
+    }
 
 
 class RefreshTokenRepository(RefreshTokenRepositoryInterface):
@@ -15,84 +50,60 @@ class RefreshTokenRepository(RefreshTokenRepositoryInterface):
     def __init__(self, transaction: Any) -> None:
         self._tx = transaction
 
+    @wrap_database_errors("Failed to save refresh token")
     async def save(self, record: RefreshTokenRecord) -> None:
         """Persist a refresh token record."""
-        try:
-            await self._tx.execute(
-                "refresh_tokens.insert",
-                {
-                    "id": record.id,
-                    "user_id": record.user_id,
-                    "token_hash": record.token_hash,
-                    "expires_at": record.expires_at.isoformat(),
-                    "revoked_at": record.revoked_at.isoformat() if record.revoked_at else None,
-                    "created_at": record.created_at.isoformat(),
-                },
-            )
-        except Exception as exc:
-            raise DatabaseError(message="Failed to save refresh token", cause=exc) from exc
+        await self._tx.execute("refresh_tokens.insert", _insert_params(record))
 
+    @wrap_database_errors("Failed to save refresh tokens")
+    async def save_many(self, records: Sequence[RefreshTokenRecord]) -> None:
+        """Persist several records with one multi-row INSERT per batch."""
+        if len(records) == 1:
+            await self.save(records[0])
+            return
+        for start in range(0, len(records), SAVE_MANY_BATCH_SIZE):
+            batch = records[start : start + SAVE_MANY_BATCH_SIZE]
+            params = {
+                f"{column}_{row}": value
+                for row, record in enumerate(batch)
+                for column, value in _insert_params(record).items()
+            }
+            await self._tx.execute(_insert_many_sql(len(batch)), params)
+
+    @wrap_database_errors("Failed to fetch refresh token by hash")
     async def get_by_token_hash(self, token_hash: str) -> RefreshTokenRecord | None:
         """Look up a refresh token by its hash."""
-        try:
-            row = await self._tx.fetch_one("refresh_tokens.get_by_token_hash", {"token_hash": token_hash})
-        except Exception as exc:
-            raise DatabaseError(message="Failed to fetch refresh token by hash", cause=exc) from exc
+        row = await self._tx.fetch_one("refresh_tokens.get_by_token_hash", {"token_hash": token_hash})
         if row is None:
             return None
         return self._to_record(row)
 
-    async def revoke(self, token_id: str) -> None:
-        """Revoke a single refresh token."""
-        try:
-            await self._tx.execute(
-                "refresh_tokens.revoke",
-                {"id": token_id, "revoked_at": datetime.now(UTC).isoformat()},
-            )
-        except Exception as exc:
-            raise DatabaseError(message="Failed to revoke refresh token", cause=exc) from exc
+    @wrap_database_errors("Failed to revoke refresh token")
+    async def revoke(self, token_id: str) -> bool:
+        """Revoke a single refresh token; False if it was already revoked.
+
+        The UPDATE only matches unrevoked rows, so of two concurrent calls
+        for the same token exactly one returns True.
+        """
+        row = await self._tx.fetch_one("refresh_tokens.revoke", {"id": token_id, "revoked_at": now_epoch_ms()})
+        return row is not None
 
+    @wrap_database_errors("Failed to revoke all refresh tokens for user")
     async def revoke_all_for_user(self, user_id: str) -> None:
         """Revoke all refresh tokens for a user."""
-        try:
-            await self._tx.execute(
-                "refresh_tokens.revoke_all_for_user",
-                {"user_id": user_id, "revoked_at": datetime.now(UTC).isoformat()},
-            )
-        except Exception as exc:
-            raise DatabaseError(message="Failed to revoke all refresh tokens for user", cause=exc) from exc
+        await self._tx.execute("refresh_tokens.revoke_all_for_user", {"user_id": user_id, "revoked_at": now_epoch_ms()})
 
     @staticmethod
     def _to_record(row: dict) -> RefreshTokenRecord:
         """Map a database row to a RefreshTokenRecord."""
         try:
-            raw_expires = row["expires_at"]
-            expires_at = (
-                raw_expires
-                if isinstance(raw_expires, datetime)
-                else datetime.fromisoformat(raw_expires)
-            )
-            raw_revoked = row.get("revoked_at")
-            revoked_at = None
-            if raw_revoked is not None:
-                revoked_at = (
-                    raw_revoked
-                    if isinstance(raw_revoked, datetime)
-                    else datetime.fromisoformat(raw_revoked)
-                )
-            raw_created = row["created_at"]
-            created_at = (
-                raw_created
-                if isinstance(raw_created, datetime)
-                else datetime.fromisoformat(raw_created)
-            )
-            return RefreshTokenRecord(
+            return RefreshTokenRecord.rehydrate(
                 id=row["id"],
                 user_id=row["user_id"],
                 token_hash=row["token_hash"],
-                expires_at=expires_at,
-                revoked_at=revoked_at,
-                created_at=created_at,
+                expires_at=to_datetime(row["expires_at"]),
+                revoked_at=to_optional_datetime(row.get("revoked_at")),
+                created_at=to_datetime(row["created_at"]),
             )
         except (ValueError, KeyError, TypeError) as exc:
             raise DataMappingError(
@@ -2,45 +2,47 @@
 
 from __future__ import annotations
 
-import uuid
-from datetime import datetime
 from typing import Any
 
 from row_query.core.exceptions import ParameterBindingError
 
 from app.domain.entities.user import UserEntity
+from app.domain.error_codes import USER_ALREADY_EXISTS
 from app.domain.errors import ConflictError
 from app.domain.interfaces.user_repository import UserRepositoryInterface
 from app.domain.value_objects.user_id import UserId
-from app.infrastructure.errors import DatabaseError, DataMappingError
+from app.infrastructure.db.mapping import map_rows, to_datetime, to_optional_datetime, to_uuid
+from app.infrastructure.errors import DataMappingError, wrap_database_errors
 
 
 class UserRepository(UserRepositoryInterface):
-    """Concrete user repository using RowQuery transactions."""
+    """Concrete user repository using RowQuery transactions.
+
+    Ids are bound as strings: ``users.id`` is TEXT on every driver, sqlite3
+    cannot bind ``uuid.UUID`` at all, and psycopg would send it typed as
+    ``uuid``, which PostgreSQL will not compare with a TEXT column.
+    """
 
     def __init__(self, transaction: Any) -> None:
         self._tx = transaction
 
+    @wrap_database_errors("Failed to fetch user by ID")
     async def get_by_id(self, user_id: UserId) -> UserEntity | None:
         """Fetch a user by ID from the database."""
-        try:
-            row = await self._tx.fetch_one("users.get_by_id", {"id": str(user_id.value)})
-        except Exception as exc:
-            raise DatabaseError(message="Failed to fetch user by ID", cause=exc) from exc
+        row = await self._tx.fetch_one("users.get_by_id", {"id": str(user_id.value)})
         if row is None:
             return None
         return self._to_entity(row)
 
+    @wrap_database_errors("Failed to fetch user by email")
     async def get_by_email(self, email: str) -> UserEntity | None:
         """Fetch a user by email from the database."""
-        try:
-            row = await self._tx.fetch_one("users.get_by_email", {"email": email})
-        except Exception as exc:
-            raise DatabaseError(message="Failed to fetch user by email", cause=exc) from exc
+        row = await self._tx.fetch_one("users.get_by_email", {"email": email})
         if row is None:
             return None
         return self._to_entity(row)
 
+    @wrap_database_errors("Failed to save user")
     async def save(self, user: UserEntity) -> None:
         """Persist a user entity to the database."""
         try:
@@ -58,46 +60,28 @@ class UserRepository(UserRepositoryInterface):
         except ParameterBindingError as exc:
             if "unique" in str(exc).lower():
                 raise ConflictError(
-                    code="USER_ALREADY_EXISTS",
+                    code=USER_ALREADY_EXISTS,
                     message=f"A user with email '{user.email}' already exists",
                 ) from exc
-            raise DatabaseError(message="Failed to save user", cause=exc) from exc
-        except Exception as exc:
-            raise DatabaseError(message="Failed to save user", cause=exc) from exc
+            raise
 
+    @wrap_database_errors("Failed to fetch all users")
     async def list_all(self) -> list[UserEntity]:
         """Fetch all users from the database."""
-        try:
-            rows = await self._tx.fetch_all("users.list_all")
-        except Exception as exc:
-            raise DatabaseError(message="Failed to fetch all users", cause=exc) from exc
-        return [self._to_entity(row) for row in rows]
+        rows = await self._tx.fetch_all("users.list_all")
+        return await map_rows(rows, self._to_entity)
 
     @staticmethod
     def _to_entity(row: dict) -> UserEntity:
         """Map a database row to a UserEntity."""
         try:
-            raw_id = row["id"]
-            user_id = UserId(value=raw_id if isinstance(raw_id, uuid.UUID) else uuid.UUID(raw_id))
-            raw_created = row["created_at"]
-            created_at = (
-                raw_created
-                if isinstance(raw_created, datetime)
-                else datetime.fromisoformat(raw_created)
-            )
-            raw_updated = row.get("updated_at")
-            updated_at = (
-                raw_updated
-                if raw_updated is None or isinstance(raw_updated, datetime)
-                else datetime.fromisoformat(raw_updated)
-            )
-            return UserEntity(
-                id_=user_id,
+            return UserEntity.rehydrate(
+                id_=UserId(value=to_uuid(row["id"])),
                 name=row["name"],
                 email=row["email"],
                 password_hash=row.get("password_hash", ""),
-                created_at=created_at,
-                updated_at=updated_at,
+                created_at=to_datetime(row["created_at"]),
+                updated_at=to_optional_datetime(row.get("updated_at")),
             )
         except (ValueError, KeyError, TypeError) as exc:
             raise DataMappingError(message="Failed to map database row to UserEntity", cause=exc) from exc
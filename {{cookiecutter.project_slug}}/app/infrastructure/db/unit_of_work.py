@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from contextlib import AsyncExitStack
 from typing import TYPE_CHECKING
 
 from app.infrastructure.db.repositories.refresh_token_repository import RefreshTokenRepository
@@ -19,30 +20,68 @@ logger = logging.getLogger(__name__)
 
 
 class SqlUnitOfWork:
-    """UnitOfWork wrapping a RowQuery transaction."""
+    """UnitOfWork wrapping a RowQuery transaction.
+
+    ``user_reader`` and ``refresh_token_reader`` run directly on the engine, so
+    lookups that may end the request early do not pay for BEGIN/COMMIT.
+    """
+
+    __slots__ = (
+        "_engine",
+        "_stack",
+        "_transaction",
+        "_user_repository",
+        "_refresh_token_repository",
+        "_user_reader",
+        "_refresh_token_reader",
+    )
 
     def __init__(self, engine: AsyncEngine) -> None:
         self._engine = engine
+        self._stack: AsyncExitStack | None = None
         self._transaction: object | None = None
-        self._user_repository: UserRepository | None = None
+        self._user_repository: UserRepositoryInterface | None = None
         self._refresh_token_repository: RefreshTokenRepository | None = None
+        self._user_reader: UserRepositoryInterface | None = None
+        self._refresh_token_reader: RefreshTokenRepository | None = None
 
     @property
     def user_repository(self) -> UserRepositoryInterface:
         if self._user_repository is None:
-            raise RuntimeError("UnitOfWork not entered")
+            self._user_repository = UserRepository(self._require_transaction())
         return self._user_repository
 
     @property
     def refresh_token_repository(self) -> RefreshTokenRepositoryInterface:
         if self._refresh_token_repository is None:
-            raise RuntimeError("UnitOfWork not entered")
+            self._refresh_token_repository = RefreshTokenRepository(self._require_transaction())
         return self._refresh_token_repository
 
+    @property
+    def user_reader(self) -> UserRepositoryInterface:
+        if self._user_reader is None:
+            self._user_reader = UserRepository(self._engine)
+        return self._user_reader
+
+    @property
+    def refresh_token_reader(self) -> RefreshTokenRepositoryInterface:
+        if self._refresh_token_reader is None:
+            self._refresh_token_reader = RefreshTokenRepository(self._engine)
+        return self._refresh_token_reader
+
+    def _require_transaction(self) -> object:
+        if self._transaction is None:
+            raise RuntimeError("UnitOfWork not entered")
+        return self._transaction
+
     async def __aenter__(self) -> SqlUnitOfWork:
-        self._transaction = await self._engine.transaction().__aenter__()
-        self._user_repository = UserRepository(self._transaction)
-        self._refresh_token_repository = RefreshTokenRepository(self._transaction)
+        # Transactional repositories are built on first access, so a request
+        # only pays for the ones it actually uses.
+        self._user_repository = None
+        self._refresh_token_repository = None
+        stack = AsyncExitStack()
+        self._transaction = await stack.enter_async_context(self._engine.transaction())
+        self._stack = stack
         return self
 
     async def __aexit__(
@@ -51,11 +90,14 @@ class SqlUnitOfWork:
         exc_val: BaseException | None,
         exc_tb: object | None,
     ) -> None:
-        if self._transaction is not None:
+        if self._stack is not None:
+            stack, self._stack = self._stack, None
             try:
-                await self._transaction.__aexit__(exc_type, exc_val, exc_tb)
+                await stack.__aexit__(exc_type, exc_val, exc_tb)
             except Exception as exc:
                 # Catch unexpected database-level exceptions (connection errors, constraint violations, etc.)
                 # and re-raise as DatabaseError so they're properly handled by the infrastructure error handler.
                 logger.exception("Database operation failed", exc_info=exc)
                 raise DatabaseError(message="Database operation failed", cause=exc) from exc
+            finally:
+                self._transaction = None
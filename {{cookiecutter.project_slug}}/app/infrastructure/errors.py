@@ -6,6 +6,17 @@ not a business rule violation.
 
 from __future__ import annotations
 
+import functools
+from typing import TYPE_CHECKING, ParamSpec, TypeVar
+
+from app.domain.errors import DomainError
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
 
 class InfrastructureError(Exception):
     """Base infrastructure error."""
@@ -35,3 +46,25 @@ class DataMappingError(InfrastructureError):
         self.message = message
         self.cause = cause
         super().__init__(message=message)
+
+
+def wrap_database_errors(message: str) -> Callable[[Callable[P, Awaitable[T]]], Callable[P, Awaitable[T]]]:
+    """Re-raise unexpected exceptions from an async repository method as DatabaseError.
+
+    Domain and infrastructure errors the method raises itself (ConflictError,
+    DataMappingError, ...) pass through unchanged.
+    """
+
+    def decorator(fn: Callable[P, Awaitable[T]]) -> Callable[P, Awaitable[T]]:
+        @functools.wraps(fn)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+            try:
+                return await fn(*args, **kwargs)
+            except (DomainError, InfrastructureError):
+                raise
+            except Exception as exc:
+                raise DatabaseError(message=message, cause=exc) from exc
+
+        return wrapper
+
+    return decorator
@@ -2,21 +2,27 @@
 
 from __future__ import annotations
 
-import json
 import logging
 import sys
+from datetime import UTC, datetime
 from typing import TYPE_CHECKING
 
+import orjson
+
 if TYPE_CHECKING:
     from app.infrastructure.config import Settings
 
 
 class JsonFormatter(logging.Formatter):
-    """JSON log formatter for structured logging."""
+    """JSON log formatter for structured logging.
+
+    Records are encoded with orjson, which also writes the timestamp as an
+    RFC 3339 UTC string without a separate formatting step.
+    """
 
     def format(self, record: logging.LogRecord) -> str:
         log_entry = {
-            "timestamp": self.formatTime(record),
+            "timestamp": datetime.fromtimestamp(record.created, UTC),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -25,7 +31,7 @@ class JsonFormatter(logging.Formatter):
             log_entry["correlation_id"] = record.correlation_id
         if record.exc_info and record.exc_info[1]:
             log_entry["exception"] = self.formatException(record.exc_info)
-        return json.dumps(log_entry)
+        return orjson.dumps(log_entry, default=str).decode()
 
 
 def setup_logging(settings: Settings) -> None:
@@ -1,12 +1,74 @@
-"""Bcrypt password hasher implementation."""
+"""Password hasher implementations: argon2id (default) and bcrypt (legacy)."""
 
 from __future__ import annotations
 
+import hashlib
+import hmac
+import secrets
+import threading
+from collections import OrderedDict
+from functools import cached_property
+
 import bcrypt
+from argon2 import PasswordHasher as _Argon2
+from argon2 import Type
+from argon2.exceptions import InvalidHashError, VerificationError
+
+
+class _VerifiedPasswords:
+    """LRU of passwords already verified, stored as HMACs keyed by their hash.
+
+    The HMAC key is random per process and the cache never leaves process
+    memory, but the key lives in that same memory. Anyone who can read it,
+    e.g. from a core dump, gets the key alongside the MACs and can test
+    password guesses at SHA-256 speed, bypassing the hash's work factor for
+    every cached account. ``size=0`` disables it.
+    """
+
+    def __init__(self, size: int) -> None:
+        self._size = size
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._lock = threading.Lock()  # verify runs in a thread pool
+        self._mac_key = secrets.token_bytes(32)
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+    def mac(self, password: bytes) -> bytes:
+        return hmac.new(self._mac_key, password, hashlib.sha256).digest()
+
+    def matches(self, password_hash: str, mac: bytes) -> bool:
+        with self._lock:
+            cached = self._entries.get(password_hash)
+            if cached is not None:
+                self._entries.move_to_end(password_hash)
+        return cached is not None and hmac.compare_digest(cached, mac)
+
+    def remember(self, password_hash: str, mac: bytes) -> None:
+        with self._lock:
+            self._entries[password_hash] = mac
+            self._entries.move_to_end(password_hash)
+            if len(self._entries) > self._size:
+                self._entries.popitem(last=False)
 
 
 class BcryptPasswordHasher:
-    """Concrete PasswordHasher using bcrypt."""
+    """Concrete PasswordHasher using bcrypt.
+
+    Successful verifications are remembered as an HMAC of the password under a
+    random per-process key, keyed by the bcrypt hash. A later verify of the
+    same password against the same hash is answered by that HMAC instead of
+    another bcrypt round; anything else, including wrong passwords, still
+    pays for ``bcrypt.checkpw``.
+
+    The cache is off by default (``verified_cache_size=0``): it trades the
+    work factor of every cached hash for speed should process memory leak,
+    see :class:`_VerifiedPasswords`. Enable it only where repeat logins are
+    hot and memory dumps are not a concern.
+    """
+
+    def __init__(self, *, verified_cache_size: int = 0) -> None:
+        self._verified = _VerifiedPasswords(verified_cache_size)
 
     def hash(self, password: str) -> str:
         """Hash a password using bcrypt."""
@@ -14,4 +76,85 @@ class BcryptPasswordHasher:
 
     def verify(self, password: str, password_hash: str) -> bool:
         """Verify a password against a bcrypt hash."""
-        return bcrypt.checkpw(password.encode(), password_hash.encode())
+        if not self._verified:
+            return bcrypt.checkpw(password.encode(), password_hash.encode())
+
+        password_bytes = password.encode()
+        mac = self._verified.mac(password_bytes)
+        if self._verified.matches(password_hash, mac):
+            return True
+        if not bcrypt.checkpw(password_bytes, password_hash.encode()):
+            return False
+        self._verified.remember(password_hash, mac)
+        return True
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        """bcrypt hashes are kept as they are."""
+        return False
+
+    @cached_property
+    def dummy_hash(self) -> str:
+        """Hash of a random password, computed once, so misses cost a full verify."""
+        return self.hash(secrets.token_urlsafe(32))
+
+
+class Argon2PasswordHasher:
+    """Concrete PasswordHasher using argon2id (libargon2 via argon2-cffi).
+
+    Defaults follow the OWASP baseline of 46 MiB memory, 2 iterations and
+    1 lane. Hashes that are not argon2, i.e. bcrypt hashes from before the
+    switch, are verified by ``legacy``. ``needs_rehash`` reports them, so the
+    login handler can upgrade them once the password is known. Successful
+    verifications can be cached as in :class:`BcryptPasswordHasher`, off by
+    default for the same reason.
+    """
+
+    def __init__(
+        self,
+        *,
+        time_cost: int = 2,
+        memory_cost: int = 46 * 1024,
+        parallelism: int = 1,
+        verified_cache_size: int = 0,
+        legacy: BcryptPasswordHasher | None = None,
+    ) -> None:
+        self._argon2 = _Argon2(
+            time_cost=time_cost,
+            memory_cost=memory_cost,
+            parallelism=parallelism,
+            hash_len=32,
+            type=Type.ID,
+        )
+        self._verified = _VerifiedPasswords(verified_cache_size)
+        self._legacy = BcryptPasswordHasher(verified_cache_size=verified_cache_size) if legacy is None else legacy
+
+    def hash(self, password: str) -> str:
+        """Hash a password using argon2id."""
+        return self._argon2.hash(password)
+
+    def verify(self, password: str, password_hash: str) -> bool:
+        """Verify a password against an argon2 hash, or a legacy bcrypt one."""
+        if not password_hash.startswith("$argon2"):
+            return self._legacy.verify(password, password_hash)
+
+        mac = self._verified.mac(password.encode()) if self._verified else b""
+        if mac and self._verified.matches(password_hash, mac):
+            return True
+        try:
+            self._argon2.verify(password_hash, password)
+        except (VerificationError, InvalidHashError):
+            return False
+        if mac:
+            self._verified.remember(password_hash, mac)
+        return True
+
+    def needs_rehash(self, password_hash: str) -> bool:
+        """True for legacy hashes and argon2 hashes with outdated parameters."""
+        if not password_hash.startswith("$argon2"):
+            return True
+        return self._argon2.check_needs_rehash(password_hash)
+
+    @cached_property
+    def dummy_hash(self) -> str:
+        """Hash of a random password, computed once, so misses cost a full verify."""
+        return self.hash(secrets.token_urlsafe(32))
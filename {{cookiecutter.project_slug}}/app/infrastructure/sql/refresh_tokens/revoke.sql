@@ -1,3 +1,4 @@
 UPDATE refresh_tokens
 SET revoked_at = :revoked_at
-WHERE id = :id
+WHERE id = :id AND revoked_at IS NULL
+RETURNING id
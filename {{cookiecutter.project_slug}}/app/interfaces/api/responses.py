@@ -0,0 +1,20 @@
+"""Response classes shared by the API layer."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson instead of the stdlib ``json`` module.
+
+    Used for responses built by hand (exception handlers, token routes).
+    Routes with a response model keep FastAPI's default class, which
+    serializes straight to JSON bytes through pydantic-core.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
@@ -5,7 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from fastapi import APIRouter, Depends
-from fastapi_request_pipeline import RequestContext, flow_dependency
+from fastapi_request_pipeline import RequestContext
 
 from app.application.bus.command_bus import CommandBus
 from app.application.bus.query_bus import QueryBus
@@ -15,6 +15,7 @@ from app.application.commands.logout_user import LogoutUserCommand
 from app.application.commands.refresh_token import RefreshTokenCommand
 from app.application.commands.register_user import RegisterUserCommand
 from app.application.queries.get_user import GetUserQuery
+from app.interfaces.api.responses import ORJSONResponse
 from app.interfaces.api.schemas.auth import (
     ChangePasswordRequest,
     LoginRequest,
@@ -31,9 +32,10 @@ from app.interfaces.dependencies.container import (
     get_token_service,
     get_unit_of_work,
 )
-from app.interfaces.pipeline.flows import authenticated_flow, public_flow
+from app.interfaces.pipeline.flows import authenticated_flow_dependency, public_flow_dependency
 
 if TYPE_CHECKING:
+    from app.application.dto.auth_dto import AuthTokensDTO
     from app.application.services.token_service import TokenService
     from app.application.unit_of_work import UnitOfWork
     from app.domain.services.password_hasher import PasswordHasher
@@ -41,70 +43,72 @@ if TYPE_CHECKING:
 
 router = APIRouter(tags=["auth"])
 
+# Token responses must not be stored by browsers or proxies (RFC 6749 §5.1)
+_TOKEN_HEADERS = {"Cache-Control": "no-store", "Pragma": "no-cache"}
+
+
+def _token_response(result: AuthTokensDTO, status_code: int = 200) -> ORJSONResponse:
+    """Serialize handler tokens directly; the DTO is server-built, so it skips response-model validation."""
+    return ORJSONResponse(
+        {
+            "access_token": result.access_token,
+            "refresh_token": result.refresh_token,
+            "token_type": result.token_type,
+            "expires_in": result.expires_in,
+        },
+        status_code=status_code,
+        headers=_TOKEN_HEADERS,
+    )
+
 
-@router.post("/auth/register", status_code=201, response_model=TokenResponse)
+@router.post("/auth/register", status_code=201, response_model=None, responses={201: {"model": TokenResponse}})
 async def register(
     body: RegisterRequest,
-    _ctx: RequestContext = Depends(flow_dependency(public_flow)),
+    _ctx: RequestContext = Depends(public_flow_dependency),
     bus: CommandBus = Depends(get_command_bus),
     uow: UnitOfWork = Depends(get_unit_of_work),
     password_hasher: PasswordHasher = Depends(get_password_hasher),
     token_service: TokenService = Depends(get_token_service),
-) -> TokenResponse:
+) -> ORJSONResponse:
     """Register a new user and return tokens."""
     command = RegisterUserCommand(name=body.name, email=body.email, password=body.password)
     result = await bus.dispatch(command, uow=uow, password_hasher=password_hasher, token_service=token_service)
-    return TokenResponse(
-        access_token=result.access_token,
-        refresh_token=result.refresh_token,
-        token_type=result.token_type,
-        expires_in=result.expires_in,
-    )
+    return _token_response(result, status_code=201)
 
 
-@router.post("/auth/login", response_model=TokenResponse)
+@router.post("/auth/login", response_model=None, responses={200: {"model": TokenResponse}})
 async def login(
     body: LoginRequest,
-    _ctx: RequestContext = Depends(flow_dependency(public_flow)),
+    _ctx: RequestContext = Depends(public_flow_dependency),
     bus: CommandBus = Depends(get_command_bus),
     uow: UnitOfWork = Depends(get_unit_of_work),
     password_hasher: PasswordHasher = Depends(get_password_hasher),
     token_service: TokenService = Depends(get_token_service),
-) -> TokenResponse:
+) -> ORJSONResponse:
     """Log in a user and return tokens."""
     command = LoginUserCommand(email=body.email, password=body.password)
     result = await bus.dispatch(command, uow=uow, password_hasher=password_hasher, token_service=token_service)
-    return TokenResponse(
-        access_token=result.access_token,
-        refresh_token=result.refresh_token,
-        token_type=result.token_type,
-        expires_in=result.expires_in,
-    )
+    return _token_response(result)
 
 
-@router.post("/auth/refresh", response_model=TokenResponse)
+@router.post("/auth/refresh", response_model=None, responses={200: {"model": TokenResponse}})
 async def refresh(
     body: RefreshRequest,
-    _ctx: RequestContext = Depends(flow_dependency(public_flow)),
+    _ctx: RequestContext = Depends(public_flow_dependency),
     bus: CommandBus = Depends(get_command_bus),
     uow: UnitOfWork = Depends(get_unit_of_work),
     token_service: TokenService = Depends(get_token_service),
-) -> TokenResponse:
+) -> ORJSONResponse:
     """Refresh access token using a refresh token."""
     command = RefreshTokenCommand(refresh_token=body.refresh_token)
     result = await bus.dispatch(command, uow=uow, token_service=token_service)
-    return TokenResponse(
-        access_token=result.access_token,
-        refresh_token=result.refresh_token,
-        token_type=result.token_type,
-        expires_in=result.expires_in,
-    )
+    return _token_response(result)
 
 
 @router.post("/auth/logout", status_code=204)
 async def logout(
     body: RefreshRequest,
-    _ctx: RequestContext = Depends(flow_dependency(public_flow)),
+    _ctx: RequestContext = Depends(public_flow_dependency),
     bus: CommandBus = Depends(get_command_bus),
     uow: UnitOfWork = Depends(get_unit_of_work),
     token_service: TokenService = Depends(get_token_service),
@@ -116,7 +120,7 @@ async def logout(
 
 @router.get("/auth/me", response_model=UserResponse)
 async def me(
-    ctx: RequestContext = Depends(flow_dependency(authenticated_flow)),
+    ctx: RequestContext = Depends(authenticated_flow_dependency),
     bus: QueryBus = Depends(get_query_bus),
     engine: AsyncEngine = Depends(get_engine),
 ) -> UserResponse:
@@ -130,7 +134,7 @@ async def me(
 @router.post("/auth/change-password", status_code=204)
 async def change_password(
     body: ChangePasswordRequest,
-    ctx: RequestContext = Depends(flow_dependency(authenticated_flow)),
+    ctx: RequestContext = Depends(authenticated_flow_dependency),
     bus: CommandBus = Depends(get_command_bus),
     uow: UnitOfWork = Depends(get_unit_of_work),
     password_hasher: PasswordHasher = Depends(get_password_hasher),
@@ -2,17 +2,12 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Request, Response
 
 router = APIRouter()
 
 
 @router.get("/health")
-async def health_check(request: Request) -> dict:
-    """Return service health status."""
-    settings = request.app.state.settings
-    return {
-        "status": "healthy",
-        "service": settings.app_name,
-        "version": "0.1.0",
-    }
+async def health_check(request: Request) -> Response:
+    """Return service health status, serialized once at startup."""
+    return Response(content=request.app.state.health_body, media_type="application/json")
@@ -5,7 +5,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from fastapi import APIRouter, Depends
-from fastapi_request_pipeline import RequestContext, flow_dependency
+from fastapi_request_pipeline import RequestContext
 
 from app.application.bus.command_bus import CommandBus
 from app.application.bus.query_bus import QueryBus
@@ -13,7 +13,7 @@ from app.application.commands.create_user import CreateUserCommand
 from app.application.queries.get_user import GetUserQuery
 from app.interfaces.api.schemas.user import CreateUserRequest, UserResponse
 from app.interfaces.dependencies.container import get_command_bus, get_engine, get_query_bus, get_unit_of_work
-from app.interfaces.pipeline.flows import authenticated_flow
+from app.interfaces.pipeline.flows import authenticated_flow_dependency
 
 if TYPE_CHECKING:
     from row_query import AsyncEngine
@@ -26,7 +26,7 @@ router = APIRouter(tags=["users"])
 @router.post("/users", status_code=201, response_model=UserResponse)
 async def create_user(
     request: CreateUserRequest,
-    ctx: RequestContext = Depends(flow_dependency(authenticated_flow)),
+    ctx: RequestContext = Depends(authenticated_flow_dependency),
     bus: CommandBus = Depends(get_command_bus),
     uow: UnitOfWork = Depends(get_unit_of_work),
 ) -> UserResponse:
@@ -39,7 +39,7 @@ async def create_user(
 @router.get("/users/{user_id}", response_model=UserResponse)
 async def get_user(
     user_id: str,
-    ctx: RequestContext = Depends(flow_dependency(authenticated_flow)),
+    ctx: RequestContext = Depends(authenticated_flow_dependency),
     bus: QueryBus = Depends(get_query_bus),
     engine: AsyncEngine = Depends(get_engine),
 ) -> UserResponse:
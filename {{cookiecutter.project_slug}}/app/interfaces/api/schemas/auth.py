@@ -2,32 +2,37 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, Field
 
+from app.interfaces.api.schemas.base import Email, RequestSchema
 
-class RegisterRequest(BaseModel):
+
+class RegisterRequest(RequestSchema):
     """Request schema for user registration."""
 
     name: str = Field(min_length=1, max_length=100)
-    email: EmailStr
+    email: Email
     password: str = Field(min_length=8, max_length=128)
 
 
-class LoginRequest(BaseModel):
+class LoginRequest(RequestSchema):
     """Request schema for user login."""
 
-    email: EmailStr
+    email: Email
     password: str = Field(min_length=8, max_length=128)
 
 
-class RefreshRequest(BaseModel):
+class RefreshRequest(RequestSchema):
     """Request schema for token refresh."""
 
     refresh_token: str = Field(min_length=1)
 
 
 class TokenResponse(BaseModel):
-    """Response schema for authentication tokens."""
+    """Response schema for authentication tokens.
+
+    Documents the token routes in OpenAPI; they serialize their body directly.
+    """
 
     access_token: str
     refresh_token: str
@@ -35,7 +40,7 @@ class TokenResponse(BaseModel):
     expires_in: int
 
 
-class ChangePasswordRequest(BaseModel):
+class ChangePasswordRequest(RequestSchema):
     """Request schema for changing password."""
 
     old_password: str = Field(min_length=8, max_length=128)
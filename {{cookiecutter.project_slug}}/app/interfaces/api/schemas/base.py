@@ -0,0 +1,37 @@
+"""Shared base and field types for API request schemas."""
+
+from __future__ import annotations
+
+import re
+from typing import Annotated
+
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field
+
+_EMAIL_PATTERN = re.compile(
+    r"[A-Za-z0-9.!#$%&'*+/=?^_`{|}~-]+"
+    r"@[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?(?:\.[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?)+"
+)
+
+
+def _validate_email(value: str) -> str:
+    """Check the address shape and lowercase the domain, as EmailStr would."""
+    if _EMAIL_PATTERN.fullmatch(value) is None:
+        raise ValueError("value is not a valid email address")
+    local, _, domain = value.rpartition("@")
+    return f"{local}@{domain.lower()}"
+
+
+# Request bodies use a precompiled pattern instead of EmailStr and its
+# email-validator round trip. Only ASCII addresses are accepted.
+Email = Annotated[str, Field(max_length=254), AfterValidator(_validate_email)]
+
+
+class RequestSchema(BaseModel):
+    """Base for request bodies: immutable once parsed, unknown keys rejected.
+
+    Validators are built when each subclass is defined (pydantic's default,
+    ``defer_build=False``), so the first request to an endpoint pays nothing
+    extra.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="forbid")
@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, Field
 
+from app.interfaces.api.schemas.base import Email, RequestSchema
 
-class CreateUserRequest(BaseModel):
+
+class CreateUserRequest(RequestSchema):
     """Request schema for creating a user."""
 
     name: str = Field(min_length=1, max_length=100)
-    email: EmailStr
+    email: Email
 
 
 class UserResponse(BaseModel):
@@ -2,18 +2,22 @@
 
 from __future__ import annotations
 
-from fastapi_request_pipeline import Flow
+from fastapi_request_pipeline import Flow, flow_dependency
 
-from app.interfaces.pipeline.stages.auth import AuthenticationStage
+from app.interfaces.pipeline.stages.auth import AuthAndAuditStage
 from app.interfaces.pipeline.stages.logging_stage import LoggingStage
-from app.interfaces.pipeline.stages.permission import PermissionStage
 
 public_flow = Flow(
     LoggingStage(),
 )
 
+# AuthAndAuditStage fuses AuthenticationStage, PermissionStage and
+# LoggingStage while the permission check is a stub
 authenticated_flow = Flow(
-    AuthenticationStage(),
-    PermissionStage(),
-    LoggingStage(),
+    AuthAndAuditStage(),
 )
+
+# Resolve each flow once and share the dependency between routes, so the flow
+# is not re-resolved per route and FastAPI can dedupe it within a request.
+public_flow_dependency = flow_dependency(public_flow)
+authenticated_flow_dependency = flow_dependency(authenticated_flow)
@@ -2,46 +2,124 @@
 
 from __future__ import annotations
 
+import hashlib
+import time
+from typing import TYPE_CHECKING, Any
+
 from fastapi_request_pipeline import ComponentCategory, FlowAbort, FlowComponent, RequestContext
 
-from app.application.services.token_service import TokenService
-from app.infrastructure.config import Settings
+from app.domain.errors import AuthenticationError
+from app.interfaces.pipeline.stages.logging_stage import log_request
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from app.application.services.token_service import TokenService
 
 
 class AuthenticationFailed(FlowAbort):
     """Raised when authentication fails."""
 
 
+class AccessTokenCache:
+    """Bounded TTL cache of verified access-token payloads.
+
+    Keys are 16-byte BLAKE2b digests of the raw token, so tokens themselves are
+    never held. An entry lives for at most ``ttl`` seconds and never past the
+    token's own ``exp``; once ``maxsize`` entries are stored the oldest is
+    evicted. Access tokens cannot be revoked, so a cached verification stays
+    valid for as long as the token does.
+    """
+
+    def __init__(
+        self,
+        *,
+        maxsize: int = 8192,
+        ttl: float = 30.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._clock = clock
+        # digest -> (valid_until, payload); insertion order doubles as age order
+        self._entries: dict[bytes, tuple[float, dict[str, Any]]] = {}
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    def get(self, token: str) -> dict[str, Any] | None:
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= self._clock():
+            del self._entries[key]
+            return None
+        return entry[1]
+
+    def put(self, token: str, payload: dict[str, Any]) -> None:
+        key = self._key(token)
+        self._entries.pop(key, None)
+        if len(self._entries) >= self._maxsize:
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (min(float(payload["exp"]), self._clock() + self._ttl), payload)
+
+
 class AuthenticationStage(FlowComponent):
     """Extracts and validates a JWT Bearer token from the Authorization header.
 
     On success, sets ctx.state["user_id"] and ctx.state["authenticated"] = True.
-    Aborts with 401 on missing/invalid token.
+    Aborts with 401 on missing/invalid token. Verified access tokens are kept
+    in an :class:`AccessTokenCache`, so repeat requests skip signature checks.
     """
 
     category = ComponentCategory.AUTHENTICATION
 
+    def __init__(self, *, cache: AccessTokenCache | None = None) -> None:
+        self._cache = AccessTokenCache() if cache is None else cache
+
     async def resolve(self, ctx: RequestContext) -> None:
         """Authenticate the request via JWT Bearer token."""
+        self.authenticate(ctx)
+
+    def authenticate(self, ctx: RequestContext) -> None:
+        """Validate the Bearer token and record the user on ``ctx.state``."""
         auth_header = ctx.request.headers.get("Authorization")
         if not auth_header or not auth_header.startswith("Bearer "):
             raise AuthenticationFailed("Missing or invalid Authorization header")
 
         token = auth_header[7:]  # Strip "Bearer "
 
-        settings: Settings = ctx.request.app.state.settings
-        token_service = TokenService(
-            secret_key=settings.jwt_secret_key,
-            algorithm=settings.jwt_algorithm,
-        )
+        payload = self._cache.get(token)
+        if payload is None:
+            # A JWS compact token is exactly three dot-separated segments
+            if token.count(".") != 2:
+                raise AuthenticationFailed("Invalid or expired token")
+            token_service: TokenService = ctx.request.app.state.token_service
+            try:
+                payload = token_service.decode_token(token)
+            except AuthenticationError:
+                raise AuthenticationFailed("Invalid or expired token") from None
 
-        try:
-            payload = token_service.decode_token(token)
-        except Exception:
-            raise AuthenticationFailed("Invalid or expired token")
-
-        if payload.get("type") != "access":
-            raise AuthenticationFailed("Token is not an access token")
+            if payload.get("type") != "access":
+                raise AuthenticationFailed("Token is not an access token")
+            self._cache.put(token, payload)
 
         ctx.state["user_id"] = payload["sub"]
         ctx.state["authenticated"] = True
+
+
+class AuthAndAuditStage(AuthenticationStage):
+    """Authentication, permission check and request logging in one stage.
+
+    ``authenticated_flow`` would otherwise run AuthenticationStage,
+    PermissionStage and LoggingStage as three coroutines, none of which
+    awaits anything. Once permission checks need I/O, compose the separate
+    stages in ``flows.py`` again.
+    """
+
+    async def resolve(self, ctx: RequestContext) -> None:
+        """Authenticate, authorize (stub, see PermissionStage) and log the request."""
+        self.authenticate(ctx)
+        log_request(ctx)
@@ -9,6 +9,22 @@ from fastapi_request_pipeline import ComponentCategory, FlowComponent, RequestCo
 logger = logging.getLogger(__name__)
 
 
+def log_request(ctx: RequestContext) -> None:
+    """Log the request method, path, and user info.
+
+    Skipped entirely below INFO, since Starlette builds ``request.url`` on
+    first access.
+    """
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    logger.info(
+        "Request: %s %s (user=%s)",
+        ctx.request.method,
+        ctx.request.url.path,
+        ctx.state.get("user_id"),
+    )
+
+
 class LoggingStage(FlowComponent):
     """Logs request method, path, and user info."""
 
@@ -16,10 +32,4 @@ class LoggingStage(FlowComponent):
 
     async def resolve(self, ctx: RequestContext) -> None:
         """Log the incoming request."""
-        user_info = getattr(ctx, "user", None)
-        logger.info(
-            "Request: %s %s (user=%s)",
-            ctx.request.method,
-            ctx.request.url.path,
-            user_info,
-        )
+        log_request(ctx)
@@ -5,11 +5,12 @@ from __future__ import annotations
 import logging
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
+from functools import cache
 
+import orjson
 from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.openapi.utils import get_openapi
-from fastapi.responses import JSONResponse
 from fastapi_request_pipeline import FlowAbort
 
 import app.application.handlers.commands.change_password_handler  # noqa: F401
@@ -19,44 +20,76 @@ import app.application.handlers.commands.logout_user_handler  # noqa: F401
 import app.application.handlers.commands.refresh_token_handler  # noqa: F401
 import app.application.handlers.commands.register_user_handler  # noqa: F401
 import app.application.handlers.queries.get_user_handler  # noqa: F401
-from app.application.bus.command_bus import DuplicateHandlerError, HandlerNotFoundError
+from app.application.bus.command_bus import CommandBus, DuplicateHandlerError, HandlerNotFoundError
+from app.application.bus.query_bus import QueryBus
+from app.application.services.blocking import shutdown_blocking_pool
+from app.application.services.token_service import TokenService
 from app.domain.errors import DomainError
-from app.infrastructure.config import Settings
-from app.infrastructure.db.connection import create_engine
+from app.infrastructure.config import get_settings
+from app.infrastructure.db.connection import configure_prepared_statements, create_engine
 from app.infrastructure.db.migrations import run_migrations
 from app.infrastructure.errors import InfrastructureError
 from app.infrastructure.logging import setup_logging
+from app.interfaces.api.responses import ORJSONResponse
 from app.interfaces.api.routes.auth import router as auth_router
 from app.interfaces.api.routes.health import router as health_router
 from app.interfaces.api.routes.users import router as users_router
 
 logger = logging.getLogger(__name__)
 
+_FLOW_ABORT_STATUS = {
+    "AuthenticationFailed": 401,
+    "PermissionDenied": 403,
+    "Throttled": 429,
+}
+
+
+@cache
+def _flow_abort_status(exc_type: type[FlowAbort]) -> tuple[int, str]:
+    """Status code and error code for a FlowAbort subclass, worked out once per class."""
+    name = exc_type.__name__
+    return _FLOW_ABORT_STATUS.get(name, 400), name.upper()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """Application lifespan: initialize and shutdown resources."""
-    settings = Settings()
+    settings = app.state.settings
     setup_logging(settings)
     engine = create_engine(settings)
     await run_migrations("sql/migrations", engine)
-    app.state.settings = settings
+    configure_prepared_statements(engine, settings)
     app.state.engine = engine
+    # /health serves these bytes as they are; nothing in them changes at runtime
+    app.state.health_body = orjson.dumps({"status": "healthy", "service": settings.app_name, "version": "0.1.0"})
+    app.state.token_service = TokenService(
+        secret_key=settings.jwt_secret_key,
+        algorithm=settings.jwt_algorithm,
+        access_token_expire_minutes=settings.access_token_expire_minutes,
+        refresh_token_expire_days=settings.refresh_token_expire_days,
+    )
+    if not settings.debug:
+        # Handlers are all registered by now; specialise dispatch to them
+        CommandBus.freeze()
+        QueryBus.freeze()
     logger.info("Application started", extra={"service": settings.app_name})
     yield
     logger.info("Application shutting down")
+    shutdown_blocking_pool()
 
 
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
+    settings = get_settings()
     app = FastAPI(lifespan=lifespan)
+    # The lifespan reads this same instance, so settings are parsed once
+    app.state.settings = settings
 
     app.include_router(health_router)
     app.include_router(auth_router, prefix="/api/v1")
     app.include_router(users_router, prefix="/api/v1")
 
     # Admin panel — only mounted when ADMIN_ENABLED=true in environment
-    settings = Settings()
     if settings.admin_enabled:
         from app.admin.site import AdminSite
         from app.admin_resources.auth import FakeAdminAuthProvider
@@ -74,10 +107,10 @@ def create_app() -> FastAPI:
     @app.exception_handler(RequestValidationError)
     async def request_validation_error_handler(
         _request: Request, exc: RequestValidationError
-    ) -> JSONResponse:
+    ) -> ORJSONResponse:
         """Handle Pydantic validation errors with custom envelope."""
-        details = {".".join(str(p) for p in e["loc"]): e["msg"] for e in exc.errors()}
-        return JSONResponse(
+        details = {".".join(map(str, e["loc"])): e["msg"] for e in exc.errors()}
+        return ORJSONResponse(
             status_code=422,
             content={
                 "error": {
@@ -91,10 +124,10 @@ def create_app() -> FastAPI:
     @app.exception_handler(HandlerNotFoundError)
     async def handler_not_found_error_handler(
         _request: Request, exc: HandlerNotFoundError
-    ) -> JSONResponse:
+    ) -> ORJSONResponse:
         """Handle missing command handlers (programming error)."""
         logger.error("Handler not found (programming error)", exc_info=exc)
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": {
@@ -108,10 +141,10 @@ def create_app() -> FastAPI:
     @app.exception_handler(DuplicateHandlerError)
     async def duplicate_handler_error_handler(
         _request: Request, exc: DuplicateHandlerError
-    ) -> JSONResponse:
+    ) -> ORJSONResponse:
         """Handle duplicate handler registrations (programming error)."""
         logger.error("Duplicate handler registered (programming error)", exc_info=exc)
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": {
@@ -125,10 +158,10 @@ def create_app() -> FastAPI:
     @app.exception_handler(InfrastructureError)
     async def infrastructure_error_handler(
         _request: Request, exc: InfrastructureError
-    ) -> JSONResponse:
+    ) -> ORJSONResponse:
         """Handle infrastructure errors (DB, mapping, etc.)."""
         logger.exception("Infrastructure error", exc_info=exc)
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": {
@@ -140,34 +173,27 @@ def create_app() -> FastAPI:
         )
 
     @app.exception_handler(DomainError)
-    async def domain_error_handler(_request: Request, exc: DomainError) -> JSONResponse:
+    async def domain_error_handler(_request: Request, exc: DomainError) -> ORJSONResponse:
         """Handle domain errors with custom envelope and status codes."""
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=exc.status_code,
             content={"error": {"code": exc.code, "message": exc.message, "details": exc.details}},
         )
 
     @app.exception_handler(FlowAbort)
-    async def flow_abort_handler(_request: Request, exc: FlowAbort) -> JSONResponse:
+    async def flow_abort_handler(_request: Request, exc: FlowAbort) -> ORJSONResponse:
         """Handle request pipeline abort (auth, permission, throttle)."""
-        status_map = {
-            "AuthenticationFailed": 401,
-            "PermissionDenied": 403,
-            "Throttled": 429,
-        }
-        exc_name = type(exc).__name__
-        status_code = status_map.get(exc_name, 400)
-        code = exc_name.upper()
-        return JSONResponse(
+        status_code, code = _flow_abort_status(type(exc))
+        return ORJSONResponse(
             status_code=status_code,
             content={"error": {"code": code, "message": str(exc), "details": {}}},
         )
 
     @app.exception_handler(Exception)
-    async def generic_error_handler(_request: Request, exc: Exception) -> JSONResponse:
+    async def generic_error_handler(_request: Request, exc: Exception) -> ORJSONResponse:
         """Catch-all for truly unexpected exceptions."""
         logger.exception("Unhandled exception", exc_info=exc)
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "error": {
@@ -0,0 +1,17 @@
+-- Store refresh token timestamps as BIGINT milliseconds since the Unix epoch (UTC)
+-- Refresh tokens are short-lived, so the table is recreated rather than converted
+-- and every existing session has to log in again
+
+DROP TABLE refresh_tokens;
+
+CREATE TABLE refresh_tokens (
+    id TEXT PRIMARY KEY,
+    user_id TEXT NOT NULL REFERENCES users(id),
+    token_hash TEXT NOT NULL UNIQUE,
+    expires_at BIGINT NOT NULL,
+    revoked_at BIGINT,
+    created_at BIGINT NOT NULL
+);
+
+CREATE INDEX idx_refresh_tokens_user_id ON refresh_tokens(user_id);
+CREATE INDEX idx_refresh_tokens_token_hash ON refresh_tokens(token_hash);
@@ -1 +1,34 @@
 """Shared test fixtures."""
+
+from __future__ import annotations
+
+import asyncio
+import dis
+import inspect
+
+import pytest
+
+try:
+    import uvloop
+except ImportError:  # not available on Windows
+    uvloop = None
+
+# Opcodes emitted for await, async with and async for
+_AWAIT_OPCODES = frozenset({"GET_AWAITABLE", "GET_AITER", "GET_ANEXT"})
+
+
+def pytest_asyncio_loop_factories(config, item):
+    """Run async tests and fixtures on uvloop, as the app does under uvicorn."""
+    if uvloop is None:
+        return {"asyncio": asyncio.new_event_loop}
+    return {"uvloop": uvloop.new_event_loop}
+
+
+def pytest_collection_modifyitems(config, items):
+    """Warn about ``async def`` tests that never await; they should be plain functions."""
+    for item in items:
+        func = getattr(item, "obj", None)
+        if not inspect.iscoroutinefunction(func):
+            continue
+        if not any(instr.opname in _AWAIT_OPCODES for instr in dis.get_instructions(func)):
+            item.warn(pytest.PytestWarning(f"{item.name} is async but never awaits; make it a plain def"))
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import json
 import uuid
+from base64 import b64encode
 from typing import Any
 
+import itsdangerous
 import pytest
 import pytest_asyncio
 from fastapi import FastAPI
@@ -20,22 +23,31 @@ class FakeDAO:
 
     def __init__(self) -> None:
         self._store: dict[str, dict[str, Any]] = {}
+        # id -> lowercased field values joined by NUL, so a search is one
+        # substring test per record and never matches across two fields
+        self._search_blobs: dict[str, str] = {}
+
+    def _index(self, id: str) -> None:
+        self._search_blobs[id] = "\0".join(str(v).lower() for v in self._store[id].values())
+
+    def reset(self, records: list[dict[str, Any]]) -> None:
+        self._store.clear()
+        self._search_blobs.clear()
+        self.seed(records)
 
     def seed(self, records: list[dict[str, Any]]) -> None:
         for r in records:
             self._store[str(r["id"])] = r
+            self._index(str(r["id"]))
 
     async def list(
         self, offset: int, limit: int, search: str | None = None
     ) -> tuple[list[dict[str, Any]], int]:
-        items = list(self._store.values())
         if search:
             term = search.lower()
-            items = [
-                item
-                for item in items
-                if any(term in str(v).lower() for v in item.values())
-            ]
+            items = [self._store[key] for key, blob in self._search_blobs.items() if term in blob]
+        else:
+            items = list(self._store.values())
         total = len(items)
         if limit > 0:
             items = items[offset : offset + limit]
@@ -48,18 +60,21 @@ class FakeDAO:
         uid = str(uuid.uuid4())
         record = {"id": uid, **data}
         self._store[uid] = record
+        self._index(uid)
         return record
 
     async def update(self, id: str, data: dict[str, Any]) -> dict[str, Any]:
         if id not in self._store:
             raise ValueError(f"Record '{id}' not found")
         self._store[id].update(data)
+        self._index(id)
         return self._store[id]
 
     async def delete(self, id: str) -> None:
         if id not in self._store:
             raise ValueError(f"Record '{id}' not found")
         del self._store[id]
+        del self._search_blobs[id]
 
 
 class FakeAuthProvider(AdminAuthProvider):
@@ -78,25 +93,34 @@ class FakeAuthProvider(AdminAuthProvider):
         return None
 
 
-@pytest.fixture()
+SESSION_SECRET = "test-secret"
+
+SEED_RECORDS: list[dict[str, Any]] = [
+    {"id": "1", "name": "Alice", "email": "alice@example.com", "role": "admin"},
+    {"id": "2", "name": "Bob", "email": "bob@example.com", "role": "user"},
+    {
+        "id": "3",
+        "name": "Charlie",
+        "email": "charlie@example.com",
+        "role": "user",
+    },
+]
+
+
+# The DAO, resource and app are built once per session; building the admin
+# app (routes, Jinja environment, middleware stack) dominates these tests.
+# Per-test isolation comes from reseeding the store and a fresh client.
+@pytest.fixture(scope="session")
 def fake_dao() -> FakeDAO:
-    dao = FakeDAO()
-    dao.seed(
-        [
-            {"id": "1", "name": "Alice", "email": "alice@example.com", "role": "admin"},
-            {"id": "2", "name": "Bob", "email": "bob@example.com", "role": "user"},
-            {
-                "id": "3",
-                "name": "Charlie",
-                "email": "charlie@example.com",
-                "role": "user",
-            },
-        ]
-    )
-    return dao
+    return FakeDAO()
+
+
+@pytest.fixture(autouse=True)
+def _reset_fake_dao(fake_dao: FakeDAO) -> None:
+    fake_dao.reset([dict(record) for record in SEED_RECORDS])
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def test_resource(fake_dao: FakeDAO) -> ResourceAdmin:
     return ResourceAdmin(
         name="users",
@@ -120,35 +144,63 @@ def test_resource(fake_dao: FakeDAO) -> ResourceAdmin:
     )
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def admin_app(test_resource: ResourceAdmin) -> FastAPI:
-    app = FastAPI()
+    # No OpenAPI schema or docs routes: the admin tests never request them
+    app = FastAPI(openapi_url=None, docs_url=None, redoc_url=None)
     site = AdminSite(
         title="Test Admin",
         auth_provider=FakeAuthProvider(),
-        session_secret="test-secret",
+        session_secret=SESSION_SECRET,
     )
     site.register(test_resource)
     site.mount(app)
     return app
 
 
+@pytest.fixture(scope="session")
+def admin_transport(admin_app: FastAPI) -> ASGITransport:
+    """One ASGI transport shared by every client in the session.
+
+    ASGITransport keeps no connection pool and closing it is a no-op, so
+    per-test clients can wrap it and exit without affecting later tests.
+    App exceptions still propagate into the test that triggered them.
+    """
+    return ASGITransport(app=admin_app, raise_app_exceptions=True)
+
+
 @pytest_asyncio.fixture()
-async def client(admin_app: FastAPI) -> AsyncClient:
-    transport = ASGITransport(app=admin_app)
-    async with AsyncClient(transport=transport, base_url="http://test") as c:
+async def client(admin_transport: ASGITransport) -> AsyncClient:
+    async with AsyncClient(transport=admin_transport, base_url="http://test") as c:
         yield c
 
 
+@pytest.fixture(scope="session")
+def csrf_token() -> str:
+    """CSRF token stored in the minted admin session.
+
+    The admin keeps one token per session (``_csrf_token``) rather than a
+    nonce per form view, so mutating tests can post this without first
+    fetching a form to scrape it.
+    """
+    return "test-csrf-token"
+
+
+@pytest.fixture(scope="session")
+def admin_session_cookie(csrf_token: str) -> str:
+    """An ``admin_session`` cookie for the admin user, signed like SessionMiddleware does."""
+    payload = b64encode(json.dumps({"admin_user_id": "1", "_csrf_token": csrf_token}).encode("utf-8"))
+    return itsdangerous.TimestampSigner(SESSION_SECRET).sign(payload).decode("utf-8")
+
+
 @pytest_asyncio.fixture()
-async def authed_client(admin_app: FastAPI) -> AsyncClient:
-    """Client with an authenticated admin session."""
-    transport = ASGITransport(app=admin_app)
-    async with AsyncClient(transport=transport, base_url="http://test") as c:
-        resp = await c.post(
-            "/admin/login",
-            data={"username": "admin", "password": "admin"},
-            follow_redirects=False,
-        )
-        assert resp.status_code == 303
+async def authed_client(admin_transport: ASGITransport, admin_session_cookie: str) -> AsyncClient:
+    """Client with an authenticated admin session.
+
+    The session cookie is minted directly rather than by posting to
+    /admin/login; test_auth.py covers the login form itself.
+    """
+    async with AsyncClient(transport=admin_transport, base_url="http://test") as c:
+        # Same cookie-jar key the login response would create, so logout clears it
+        c.cookies.set("admin_session", admin_session_cookie, domain="test.local")
         yield c
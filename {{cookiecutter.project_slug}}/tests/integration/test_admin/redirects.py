@@ -0,0 +1,14 @@
+"""Redirect assertion helper for the admin integration tests."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from httpx import AsyncClient
+
+
+async def assert_redirect(client: AsyncClient, method: str, url: str, **kwargs: Any) -> str:
+    """Send a request without following redirects, assert a 303 and return its location."""
+    resp = await client.request(method, url, follow_redirects=False, **kwargs)
+    assert resp.status_code == 303
+    return resp.headers["location"]
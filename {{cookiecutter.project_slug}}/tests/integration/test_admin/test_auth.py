@@ -3,12 +3,12 @@
 import pytest
 from httpx import AsyncClient
 
+from tests.integration.test_admin.redirects import assert_redirect
+
 
 @pytest.mark.asyncio
 async def test_unauthenticated_redirect(client: AsyncClient) -> None:
-    resp = await client.get("/admin/", follow_redirects=False)
-    assert resp.status_code == 303
-    assert "/admin/login" in resp.headers["location"]
+    assert "/admin/login" in await assert_redirect(client, "GET", "/admin/")
 
 
 @pytest.mark.asyncio
@@ -20,13 +20,13 @@ async def test_login_page_renders(client: AsyncClient) -> None:
 
 @pytest.mark.asyncio
 async def test_valid_login(client: AsyncClient) -> None:
-    resp = await client.post(
+    location = await assert_redirect(
+        client,
+        "POST",
         "/admin/login",
         data={"username": "admin", "password": "admin"},
-        follow_redirects=False,
     )
-    assert resp.status_code == 303
-    assert "/admin/" in resp.headers["location"]
+    assert "/admin/" in location
 
 
 @pytest.mark.asyncio
@@ -51,11 +51,7 @@ async def test_nonadmin_user_denied(client: AsyncClient) -> None:
 
 @pytest.mark.asyncio
 async def test_logout(authed_client: AsyncClient) -> None:
-    resp = await authed_client.get("/admin/logout", follow_redirects=False)
-    assert resp.status_code == 303
-    assert "/admin/login" in resp.headers["location"]
+    assert "/admin/login" in await assert_redirect(authed_client, "GET", "/admin/logout")
 
     # After logout, accessing dashboard should redirect to login
-    resp = await authed_client.get("/admin/", follow_redirects=False)
-    assert resp.status_code == 303
-    assert "/admin/login" in resp.headers["location"]
+    assert "/admin/login" in await assert_redirect(authed_client, "GET", "/admin/")
@@ -5,105 +5,127 @@ import re
 import pytest
 from httpx import AsyncClient
 
+from tests.integration.test_admin.redirects import assert_redirect
+
+_CSRF_RE = re.compile(r'<input[^>]+name="csrf_token"[^>]+value="([^"]+)"')
+
 
 def _extract_csrf(html: str) -> str:
     """Extract CSRF token from hidden input in rendered HTML."""
-    match = re.search(r'<input[^>]+name="csrf_token"[^>]+value="([^"]+)"', html)
+    match = _CSRF_RE.search(html)
     assert match, "CSRF token not found in HTML"
     return match.group(1)
 
 
 @pytest.mark.asyncio
-async def test_create_form_renders(authed_client: AsyncClient) -> None:
-    resp = await authed_client.get("/admin/users/create")
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("/admin/users/create", ("Name", "Email", "Role")),
+        ("/admin/users/1/edit", ("Alice",)),
+        ("/admin/users/1/delete", ("Confirm Delete",)),
+    ],
+    ids=["create-form", "edit-form-prefilled", "delete-confirmation"],
+)
+async def test_form_pages_render(
+    authed_client: AsyncClient, csrf_token: str, url: str, expected: tuple[str, ...]
+) -> None:
+    resp = await authed_client.get(url)
     assert resp.status_code == 200
-    assert "Name" in resp.text
-    assert "Email" in resp.text
-    assert "Role" in resp.text
+    for text in expected:
+        assert text in resp.text
+    assert _extract_csrf(resp.text) == csrf_token
 
 
 @pytest.mark.asyncio
-async def test_create_valid_record(authed_client: AsyncClient) -> None:
-    form_resp = await authed_client.get("/admin/users/create")
-    csrf = _extract_csrf(form_resp.text)
-    resp = await authed_client.post(
+async def test_create_valid_record(authed_client: AsyncClient, csrf_token: str) -> None:
+    location = await assert_redirect(
+        authed_client,
+        "POST",
         "/admin/users/create",
         data={
             "name": "NewUser",
             "email": "new@example.com",
             "role": "user",
-            "csrf_token": csrf,
+            "csrf_token": csrf_token,
         },
-        follow_redirects=False,
     )
-    assert resp.status_code == 303
-    assert "/admin/users/" in resp.headers["location"]
+    assert "/admin/users/" in location
 
 
 @pytest.mark.asyncio
-async def test_create_invalid_required_field(authed_client: AsyncClient) -> None:
-    form_resp = await authed_client.get("/admin/users/create")
-    csrf = _extract_csrf(form_resp.text)
+async def test_create_invalid_required_field(authed_client: AsyncClient, csrf_token: str) -> None:
     resp = await authed_client.post(
         "/admin/users/create",
-        data={"name": "", "email": "new@example.com", "role": "user", "csrf_token": csrf},
+        data={"name": "", "email": "new@example.com", "role": "user", "csrf_token": csrf_token},
     )
     assert resp.status_code == 200
     assert "required" in resp.text.lower()
 
 
 @pytest.mark.asyncio
-async def test_edit_form_prefills(authed_client: AsyncClient) -> None:
-    resp = await authed_client.get("/admin/users/1/edit")
-    assert resp.status_code == 200
-    assert "Alice" in resp.text
-
-
-@pytest.mark.asyncio
-async def test_edit_valid_update(authed_client: AsyncClient) -> None:
-    form_resp = await authed_client.get("/admin/users/1/edit")
-    csrf = _extract_csrf(form_resp.text)
-    resp = await authed_client.post(
+async def test_edit_valid_update(authed_client: AsyncClient, csrf_token: str) -> None:
+    location = await assert_redirect(
+        authed_client,
+        "POST",
         "/admin/users/1/edit",
         data={
             "name": "Alice Updated",
             "email": "alice@example.com",
             "role": "admin",
-            "csrf_token": csrf,
+            "csrf_token": csrf_token,
         },
-        follow_redirects=False,
     )
-    assert resp.status_code == 303
-    assert "/admin/users/1" in resp.headers["location"]
+    assert "/admin/users/1" in location
 
 
 @pytest.mark.asyncio
-async def test_delete_confirmation_page(authed_client: AsyncClient) -> None:
-    resp = await authed_client.get("/admin/users/1/delete")
-    assert resp.status_code == 200
-    assert "Confirm Delete" in resp.text
+async def test_delete_removes_record(authed_client: AsyncClient, csrf_token: str) -> None:
+    location = await assert_redirect(authed_client, "POST", "/admin/users/1/delete", data={"csrf_token": csrf_token})
+    assert "/admin/users/" in location
 
 
 @pytest.mark.asyncio
-async def test_delete_removes_record(authed_client: AsyncClient) -> None:
-    confirm_resp = await authed_client.get("/admin/users/1/delete")
-    csrf = _extract_csrf(confirm_resp.text)
-    resp = await authed_client.post(
-        "/admin/users/1/delete",
-        data={"csrf_token": csrf},
-        follow_redirects=False,
+async def test_delete_nonexistent_shows_error(authed_client: AsyncClient, csrf_token: str) -> None:
+    await assert_redirect(authed_client, "POST", "/admin/users/nonexistent/delete", data={"csrf_token": csrf_token})
+
+
+@pytest.mark.asyncio
+async def test_delete_accepts_csrf_header(authed_client: AsyncClient, csrf_token: str) -> None:
+    location = await assert_redirect(
+        authed_client, "POST", "/admin/users/1/delete", headers={"X-CSRF-Token": csrf_token}
     )
-    assert resp.status_code == 303
-    assert "/admin/users/" in resp.headers["location"]
+    assert location.endswith("/admin/users/")
 
 
 @pytest.mark.asyncio
-async def test_delete_nonexistent_shows_error(authed_client: AsyncClient) -> None:
-    confirm_resp = await authed_client.get("/admin/users/1/delete")
-    csrf = _extract_csrf(confirm_resp.text)
-    resp = await authed_client.post(
-        "/admin/users/nonexistent/delete",
-        data={"csrf_token": csrf},
-        follow_redirects=False,
+async def test_invalid_csrf_header_is_rejected(authed_client: AsyncClient, csrf_token: str) -> None:
+    location = await assert_redirect(
+        authed_client,
+        "POST",
+        "/admin/users/create",
+        headers={"X-CSRF-Token": "bogus"},
+        data={"name": "X", "email": "x@example.com", "role": "user", "csrf_token": csrf_token},
     )
-    assert resp.status_code == 303
+    assert location.endswith("/admin/users/create")
+
+
+@pytest.mark.asyncio
+async def test_detail_conditional_get_returns_304(authed_client: AsyncClient, csrf_token: str) -> None:
+    first = await authed_client.get("/admin/users/1")
+    etag = first.headers["etag"]
+    resp = await authed_client.get("/admin/users/1", headers={"If-None-Match": etag})
+    assert resp.status_code == 304
+
+    await authed_client.post(
+        "/admin/users/1/edit",
+        data={
+            "name": "Alice Changed",
+            "email": "alice@example.com",
+            "role": "admin",
+            "csrf_token": csrf_token,
+        },
+    )
+    resp = await authed_client.get("/admin/users/1", headers={"If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.headers["etag"] != etag
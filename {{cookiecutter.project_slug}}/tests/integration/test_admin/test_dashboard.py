@@ -3,12 +3,12 @@
 import pytest
 from httpx import AsyncClient
 
+from tests.integration.test_admin.redirects import assert_redirect
+
 
 @pytest.mark.asyncio
 async def test_dashboard_redirects_unauthenticated(client: AsyncClient) -> None:
-    resp = await client.get("/admin/", follow_redirects=False)
-    assert resp.status_code == 303
-    assert "/admin/login" in resp.headers["location"]
+    assert "/admin/login" in await assert_redirect(client, "GET", "/admin/")
 
 
 @pytest.mark.asyncio
@@ -41,3 +41,13 @@ async def test_list_404_unregistered_resource(authed_client: AsyncClient) -> Non
     resp = await authed_client.get("/admin/widgets/")
     assert resp.status_code == 404
     assert "not found" in resp.text.lower()
+
+
+@pytest.mark.asyncio
+async def test_unregistered_resource_page_fills_slots(authed_client: AsyncClient) -> None:
+    await authed_client.get("/admin/widgets/")
+    resp = await authed_client.get("/admin/gadgets/create")
+    assert resp.status_code == 404
+    assert "Resource &#39;gadgets&#39; not found." in resp.text
+    assert "<span>admin</span>" in resp.text
+    assert "\x1f" not in resp.text
@@ -1 +1,58 @@
 """Unit test fixtures."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from app.infrastructure.db.repositories.refresh_token_repository import RefreshTokenRepository
+from app.infrastructure.db.repositories.user_repository import UserRepository
+
+
+class FakeTx:
+    """Stand-in for a RowQuery transaction that records every call.
+
+    ``fetch_one``/``fetch_all`` return the preset results; when ``error`` is
+    set, every method records the call and then raises it.
+    """
+
+    def __init__(self) -> None:
+        self.fetch_one_result: dict[str, Any] | None = None
+        self.fetch_all_result: list[dict[str, Any]] = []
+        self.error: Exception | None = None
+        self.calls: list[tuple[str, str, dict[str, Any] | None]] = []
+
+    def _record(self, method: str, sql: str, params: dict[str, Any] | None) -> None:
+        self.calls.append((method, sql, params))
+        if self.error is not None:
+            raise self.error
+
+    async def execute(self, sql: str, params: dict[str, Any] | None = None) -> None:
+        self._record("execute", sql, params)
+
+    async def fetch_one(self, sql: str, params: dict[str, Any] | None = None) -> dict[str, Any] | None:
+        self._record("fetch_one", sql, params)
+        return self.fetch_one_result
+
+    async def fetch_all(self, sql: str, params: dict[str, Any] | None = None) -> list[dict[str, Any]]:
+        self._record("fetch_all", sql, params)
+        return self.fetch_all_result
+
+
+@pytest.fixture
+def tx() -> FakeTx:
+    """A fresh fake transaction per test."""
+    return FakeTx()
+
+
+@pytest.fixture
+def refresh_token_repo(tx) -> RefreshTokenRepository:
+    """RefreshTokenRepository bound to ``tx``."""
+    return RefreshTokenRepository(tx)
+
+
+@pytest.fixture
+def user_repo(tx) -> UserRepository:
+    """UserRepository bound to ``tx``."""
+    return UserRepository(tx)
@@ -0,0 +1,36 @@
+"""Fixed timestamps and valid database rows for the repository unit tests.
+
+The rows are read-only so no test can leak changes into another; derive
+variants with ``{**VALID_USER_ROW, "email": ...}``.
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import UTC, datetime, timedelta
+from types import MappingProxyType
+
+NOW = datetime(2024, 1, 1, tzinfo=UTC)
+EXPIRES = NOW + timedelta(days=7)
+USER_UUID = uuid.UUID("00000000-0000-0000-0000-000000000001")
+
+VALID_TOKEN_ROW = MappingProxyType(
+    {
+        "id": "token-123",
+        "user_id": "user-456",
+        "token_hash": "hash-xyz",
+        "expires_at": EXPIRES,
+        "revoked_at": None,
+        "created_at": NOW,
+    }
+)
+VALID_USER_ROW = MappingProxyType(
+    {
+        "id": USER_UUID,
+        "name": "John Doe",
+        "email": "john@example.com",
+        "password_hash": "hash123",
+        "created_at": NOW,
+        "updated_at": None,
+    }
+)
@@ -0,0 +1,49 @@
+"""Shared fixtures for admin unit tests."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+import pytest
+
+from app.admin.resource import ColumnConfig, FieldConfig, FieldType, ResourceAdmin
+
+
+class StubDAO:
+    """DAO that stores nothing; for tests that only need a valid resource."""
+
+    async def list(self, offset, limit, search=None):
+        return [], 0
+
+    async def get(self, id):
+        return None
+
+    async def create(self, data):
+        return data
+
+    async def update(self, id, data):
+        return data
+
+    async def delete(self, id):
+        pass
+
+
+@pytest.fixture()
+def stub_dao() -> StubDAO:
+    return StubDAO()
+
+
+@pytest.fixture()
+def make_resource(stub_dao: StubDAO) -> Callable[..., ResourceAdmin]:
+    """Factory for a minimal valid ResourceAdmin named ``name``."""
+
+    def _make(name: str = "items") -> ResourceAdmin:
+        return ResourceAdmin(
+            name=name,
+            display_name=name.title(),
+            dao=stub_dao,
+            list_columns=[ColumnConfig(name="id", label="ID")],
+            form_fields=[FieldConfig(name="name", label="Name", field_type=FieldType.TEXT)],
+        )
+
+    return _make
@@ -0,0 +1,70 @@
+"""Unit tests for admin auth helpers."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.admin.auth import AdminLoginRequiredError, require_admin, require_admin_with
+
+
+def _request(session: dict, auth_provider=None) -> SimpleNamespace:
+    site = SimpleNamespace(login_url="/admin/login", auth_provider=auth_provider)
+    return SimpleNamespace(
+        app=SimpleNamespace(state=SimpleNamespace(admin_site=site)),
+        session=session,
+        state=SimpleNamespace(),
+    )
+
+
+class _Provider:
+    async def get_user(self, user_id):
+        return {"id": user_id, "username": "admin", "is_admin": True}
+
+
+async def test_require_admin_with_returns_pending_result() -> None:
+    async def fetch():
+        return {"id": "7"}
+
+    request = _request({"admin_user_id": "1"}, _Provider())
+    user, record = await require_admin_with(request, fetch())
+    assert user["username"] == "admin"
+    assert record == {"id": "7"}
+
+
+async def test_require_admin_with_cancels_pending_on_redirect() -> None:
+    events = []
+
+    async def fetch():
+        events.append("started")
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            events.append("cancelled")
+            raise
+
+    class _RevokedProvider:
+        async def get_user(self, user_id):
+            await asyncio.sleep(0)  # let the pending fetch start first
+            return None
+
+    request = _request({"admin_user_id": "1"}, _RevokedProvider())
+    with pytest.raises(AdminLoginRequiredError) as exc_info:
+        await require_admin_with(request, fetch())
+    assert exc_info.value.response.headers["location"] == "/admin/login"
+    await asyncio.sleep(0)
+    assert events == ["started", "cancelled"]
+
+
+async def test_require_admin_caches_user_on_request_state() -> None:
+    calls = []
+
+    class _CountingProvider(_Provider):
+        async def get_user(self, user_id):
+            calls.append(user_id)
+            return await super().get_user(user_id)
+
+    request = _request({"admin_user_id": "1"}, _CountingProvider())
+    first = await require_admin(request)
+    assert await require_admin(request) is first
+    assert calls == ["1"]
@@ -0,0 +1,133 @@
+"""Unit tests for admin form validation and coercion (US3)."""
+
+import pytest
+from fastapi import HTTPException, Request
+
+from app.admin.resource import FieldConfig, FieldType
+from app.admin.views import forms
+from app.admin.views.forms import (
+    FormPlan,
+    coerce_form_data,
+    compile_validator,
+    parse_urlencoded_stream,
+    process_form,
+    record_form_values,
+    validate_form,
+)
+
+_FIELDS = [
+    FieldConfig(name="name", label="Name", field_type=FieldType.TEXT),
+    FieldConfig(name="age", label="Age", field_type=FieldType.NUMBER, required=False),
+    FieldConfig(name="active", label="Active", field_type=FieldType.BOOLEAN),
+    FieldConfig(
+        name="role",
+        label="Role",
+        field_type=FieldType.SELECT,
+        choices=[("admin", "Admin"), ("user", "User")],
+    ),
+    FieldConfig(name="id", label="ID", field_type=FieldType.TEXT, readonly=True),
+]
+
+
+def test_valid_form_is_coerced() -> None:
+    errors, coerced = process_form(_FIELDS, {"name": " Alice ", "age": "42", "active": "on", "role": "user"})
+    assert errors == {}
+    assert coerced == {"name": "Alice", "age": 42, "active": True, "role": "user"}
+
+
+def test_number_falls_back_to_float() -> None:
+    coerced = coerce_form_data(_FIELDS, {"name": "A", "age": "1.5", "role": "user"})
+    assert coerced["age"] == 1.5
+    assert coerced["active"] is False
+
+
+def test_optional_empty_number_is_none() -> None:
+    coerced = coerce_form_data(_FIELDS, {"name": "A", "age": "", "role": "user"})
+    assert coerced["age"] is None
+
+
+def test_validation_errors() -> None:
+    errors = validate_form(_FIELDS, {"name": "", "age": "abc", "role": "owner"})
+    assert errors == {
+        "name": "This field is required.",
+        "age": "Must be a number.",
+        "role": "Invalid choice.",
+    }
+
+
+def test_readonly_fields_are_skipped() -> None:
+    errors, coerced = process_form(_FIELDS, {"name": "A", "role": "user", "id": "7"})
+    assert errors == {}
+    assert "id" not in coerced
+
+
+def test_standalone_helpers_reuse_one_plan_per_field_set(monkeypatch) -> None:
+    built: list[object] = []
+    for_fields = FormPlan.for_fields.__func__
+
+    def spy(cls, fields):
+        built.append(fields)
+        return for_fields(cls, fields)
+
+    monkeypatch.setattr(FormPlan, "for_fields", classmethod(spy))
+    monkeypatch.setattr(forms, "_PLANS", {})
+    fields = [FieldConfig(name="code", label="Code", field_type=FieldType.NUMBER)]
+    for _ in range(3):
+        assert validate_form(fields, {"code": "1"}) == {}
+        assert coerce_form_data(fields, {"code": "1"}) == {"code": 1}
+        assert process_form(fields, {"code": "x"}) == ({"code": "Must be a number."}, {"code": "x"})
+    assert len(built) == 1
+
+
+def test_form_plan_coerces_with_generated_function() -> None:
+    plan = FormPlan.for_fields(_FIELDS)
+    raw = {"name": "A", "age": " 3 ", "role": "user", "id": "9", "csrf_token": "t"}
+    assert plan.validate(raw) == {}
+    assert plan.coerce(raw) == {"name": "A", "age": 3, "active": False, "role": "user"}
+    assert plan.accepted_keys == {"name", "age", "active", "role", "id", "csrf_token"}
+
+
+def _form_request(*chunks: bytes) -> Request:
+    messages = [{"type": "http.request", "body": c, "more_body": i < len(chunks) - 1} for i, c in enumerate(chunks)]
+
+    async def receive() -> dict:
+        return messages.pop(0)
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "headers": [(b"content-type", b"application/x-www-form-urlencoded")],
+    }
+    return Request(scope, receive)
+
+
+async def test_stream_parser_decodes_and_filters_keys() -> None:
+    request = _form_request(b"name=+J%C3%A9r%C3%B4me+B%20&ext", b"ra=1&csrf_token=abc")
+    data = await parse_urlencoded_stream(request, allowed_keys={"name", "csrf_token"})
+    assert data == {"name": "Jérôme B", "csrf_token": "abc"}
+
+
+async def test_stream_parser_rejects_oversized_body() -> None:
+    request = _form_request(b"a=" + b"x" * 40, b"&b=" + b"y" * 40)
+    with pytest.raises(HTTPException) as exc_info:
+        await parse_urlencoded_stream(request, allowed_keys={"a"}, max_bytes=64)
+    assert exc_info.value.status_code == 413
+
+
+def test_compiled_validator_handles_optional_and_blank_values() -> None:
+    validate = compile_validator(_FIELDS)
+    assert validate({"name": "A", "age": "", "role": "user"}) == {}
+    assert validate({"name": " ", "age": "1e3", "role": ""}) == {
+        "name": "This field is required.",
+        "role": "This field is required.",
+    }
+
+
+def test_compiled_validator_quotes_field_names() -> None:
+    fields = [FieldConfig(name="it's", label="Odd", field_type=FieldType.NUMBER)]
+    assert compile_validator(fields)({"it's": "x"}) == {"it's": "Must be a number."}
+
+
+def test_record_form_values_align_with_fields() -> None:
+    record = {"id": 7, "name": "Alice", "active": False, "role": None}
+    assert record_form_values(_FIELDS, record) == ["Alice", "", False, "", "7"]
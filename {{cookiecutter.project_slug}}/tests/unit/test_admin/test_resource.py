@@ -5,44 +5,23 @@ import pytest
 from app.admin.resource import ColumnConfig, FieldConfig, FieldType, ResourceAdmin
 
 
-class _StubDAO:
-    async def list(self, offset, limit, search=None):
-        return [], 0
-
-    async def get(self, id):
-        return None
-
-    async def create(self, data):
-        return data
-
-    async def update(self, id, data):
-        return data
-
-    async def delete(self, id):
-        pass
-
-
-def _dao() -> _StubDAO:
-    return _StubDAO()
-
-
-def test_valid_resource_creation() -> None:
+def test_valid_resource_creation(stub_dao) -> None:
     r = ResourceAdmin(
         name="users",
         display_name="Users",
-        dao=_dao(),
+        dao=stub_dao,
         list_columns=[ColumnConfig(name="id", label="ID")],
         form_fields=[FieldConfig(name="name", label="Name", field_type=FieldType.TEXT)],
     )
     assert r.name == "users"
 
 
-def test_name_must_be_valid_slug() -> None:
+def test_name_must_be_valid_slug(stub_dao) -> None:
     with pytest.raises(ValueError, match="lowercase alphanumeric"):
         ResourceAdmin(
             name="Invalid Name",
             display_name="Invalid",
-            dao=_dao(),
+            dao=stub_dao,
             list_columns=[ColumnConfig(name="id", label="ID")],
             form_fields=[
                 FieldConfig(name="name", label="Name", field_type=FieldType.TEXT)
@@ -50,23 +29,23 @@ def test_name_must_be_valid_slug() -> None:
         )
 
 
-def test_name_with_hyphens_is_valid() -> None:
+def test_name_with_hyphens_is_valid(stub_dao) -> None:
     r = ResourceAdmin(
         name="order-items",
         display_name="Order Items",
-        dao=_dao(),
+        dao=stub_dao,
         list_columns=[ColumnConfig(name="id", label="ID")],
         form_fields=[FieldConfig(name="name", label="Name", field_type=FieldType.TEXT)],
     )
     assert r.name == "order-items"
 
 
-def test_empty_list_columns_raises() -> None:
+def test_empty_list_columns_raises(stub_dao) -> None:
     with pytest.raises(ValueError, match="list_columns must not be empty"):
         ResourceAdmin(
             name="items",
             display_name="Items",
-            dao=_dao(),
+            dao=stub_dao,
             list_columns=[],
             form_fields=[
                 FieldConfig(name="name", label="Name", field_type=FieldType.TEXT)
@@ -74,23 +53,23 @@ def test_empty_list_columns_raises() -> None:
         )
 
 
-def test_empty_form_fields_raises() -> None:
+def test_empty_form_fields_raises(stub_dao) -> None:
     with pytest.raises(ValueError, match="form_fields must not be empty"):
         ResourceAdmin(
             name="items",
             display_name="Items",
-            dao=_dao(),
+            dao=stub_dao,
             list_columns=[ColumnConfig(name="id", label="ID")],
             form_fields=[],
         )
 
 
-def test_id_field_must_exist() -> None:
+def test_id_field_must_exist(stub_dao) -> None:
     with pytest.raises(ValueError, match="id_field"):
         ResourceAdmin(
             name="items",
             display_name="Items",
-            dao=_dao(),
+            dao=stub_dao,
             list_columns=[ColumnConfig(name="name", label="Name")],
             form_fields=[
                 FieldConfig(name="name", label="Name", field_type=FieldType.TEXT)
@@ -99,12 +78,12 @@ def test_id_field_must_exist() -> None:
         )
 
 
-def test_select_field_requires_choices() -> None:
+def test_select_field_requires_choices(stub_dao) -> None:
     with pytest.raises(ValueError, match="choices"):
         ResourceAdmin(
             name="items",
             display_name="Items",
-            dao=_dao(),
+            dao=stub_dao,
             list_columns=[ColumnConfig(name="id", label="ID")],
             form_fields=[
                 FieldConfig(name="status", label="Status", field_type=FieldType.SELECT)
@@ -112,11 +91,11 @@ def test_select_field_requires_choices() -> None:
         )
 
 
-def test_all_field_types() -> None:
+def test_all_field_types(stub_dao) -> None:
     r = ResourceAdmin(
         name="items",
         display_name="Items",
-        dao=_dao(),
+        dao=stub_dao,
         list_columns=[ColumnConfig(name="id", label="ID")],
         form_fields=[
             FieldConfig(name="title", label="Title", field_type=FieldType.TEXT),
@@ -143,3 +122,29 @@ def test_all_field_types() -> None:
 def test_column_config_link_to_detail() -> None:
     col = ColumnConfig(name="name", label="Name", link_to_detail=True)
     assert col.link_to_detail is True
+
+
+def test_form_field_names_cached(stub_dao) -> None:
+    r = ResourceAdmin(
+        name="items",
+        display_name="Items",
+        dao=stub_dao,
+        list_columns=[ColumnConfig(name="id", label="ID")],
+        form_fields=[
+            FieldConfig(name="title", label="Title", field_type=FieldType.TEXT),
+            FieldConfig(name="count", label="Count", field_type=FieldType.NUMBER),
+        ],
+    )
+    assert r.form_field_names == frozenset({"title", "count"})
+    assert r.form_plan is r.form_plan
+
+
+def test_field_config_valid_choices() -> None:
+    f = FieldConfig(
+        name="role",
+        label="Role",
+        field_type=FieldType.SELECT,
+        choices=[("admin", "Admin"), ("user", "User")],
+    )
+    assert f.valid_choices == frozenset({"admin", "user"})
+    assert FieldConfig(name="n", label="N", field_type=FieldType.TEXT).valid_choices == frozenset()
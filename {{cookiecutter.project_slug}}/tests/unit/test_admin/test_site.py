@@ -2,61 +2,100 @@
 
 import pytest
 
-from app.admin.resource import ColumnConfig, FieldConfig, FieldType, ResourceAdmin
 from app.admin.site import AdminSite
+from app.admin.utils import compute_etag
 
 
-class _StubDAO:
-    async def list(self, offset, limit, search=None):
-        return [], 0
+def test_register_accepts_valid_resource(make_resource) -> None:
+    site = AdminSite()
+    res = make_resource()
+    site.register(res)
+    assert site.get_resources() == (res,)
 
-    async def get(self, id):
-        return None
 
-    async def create(self, data):
-        return data
+def test_register_duplicate_raises(make_resource) -> None:
+    site = AdminSite()
+    site.register(make_resource("items"))
+    with pytest.raises(ValueError, match="already registered"):
+        site.register(make_resource("items"))
 
-    async def update(self, id, data):
-        return data
 
-    async def delete(self, id):
-        pass
+def test_get_resources_returns_registration_order(make_resource) -> None:
+    site = AdminSite()
+    r1 = make_resource("alpha")
+    r2 = make_resource("beta")
+    site.register(r1)
+    site.register(r2)
+    assert site.get_resources() == (r1, r2)
+
 
+def test_get_resources_snapshot_reused_until_register(make_resource) -> None:
+    site = AdminSite()
+    site.register(make_resource("alpha"))
+    snapshot = site.get_resources()
+    assert site.get_resources() is snapshot
 
-def _make_resource(name: str = "items") -> ResourceAdmin:
-    return ResourceAdmin(
-        name=name,
-        display_name=name.title(),
-        dao=_StubDAO(),
-        list_columns=[ColumnConfig(name="id", label="ID")],
-        form_fields=[FieldConfig(name="name", label="Name", field_type=FieldType.TEXT)],
-    )
+    site.register(make_resource("beta"))
+    assert site.get_resources() is not snapshot
+    assert len(site.get_resources()) == 2
 
 
-def test_register_accepts_valid_resource() -> None:
+def test_get_router_fails_if_no_resources() -> None:
     site = AdminSite()
-    res = _make_resource()
-    site.register(res)
-    assert site.get_resources() == [res]
+    with pytest.raises(RuntimeError, match="No resources registered"):
+        site.get_router()
 
 
-def test_register_duplicate_raises() -> None:
+def test_get_router_is_cached(make_resource) -> None:
     site = AdminSite()
-    site.register(_make_resource("items"))
-    with pytest.raises(ValueError, match="already registered"):
-        site.register(_make_resource("items"))
+    site.register(make_resource())
+    assert site.get_router() is site.get_router()
 
 
-def test_get_resources_returns_registration_order() -> None:
+def test_register_after_get_router_raises(make_resource) -> None:
     site = AdminSite()
-    r1 = _make_resource("alpha")
-    r2 = _make_resource("beta")
-    site.register(r1)
-    site.register(r2)
-    assert site.get_resources() == [r1, r2]
+    site.register(make_resource("alpha"))
+    site.get_router()
+    with pytest.raises(RuntimeError, match="after the router has been built"):
+        site.register(make_resource("beta"))
 
 
-def test_get_router_fails_if_no_resources() -> None:
+def test_template_bytecode_is_persisted(tmp_path, make_resource) -> None:
+    site = AdminSite(template_cache_dir=tmp_path)
+    site.register(make_resource())
+    site.get_router()
+    assert site.get_template("admin/list.html") is site.get_template("admin/list.html")
+    assert any(tmp_path.iterdir())
+
+
+def test_no_bytecode_cache_without_a_directory() -> None:
+    assert AdminSite()._env.bytecode_cache is None
+
+
+def test_etags_agree_across_separately_built_sites() -> None:
+    record = {"id": "7", "name": "Alice"}
+    first, second = AdminSite(session_secret="s3cret"), AdminSite(session_secret="s3cret")
+    other = AdminSite(session_secret="another")
+
+    etag = compute_etag(first.etag_salt, "users", "1", "csrf", record)
+    assert compute_etag(second.etag_salt, "users", "1", "csrf", record) == etag
+    assert compute_etag(other.etag_salt, "users", "1", "csrf", record) != etag
+
+
+def test_get_resource_by_name(make_resource) -> None:
     site = AdminSite()
-    with pytest.raises(RuntimeError, match="No resources registered"):
-        site.get_router()
+    res = make_resource("items")
+    site.register(res)
+    assert site.get_resource("items") is res
+    assert site.get_resource("missing") is None
+
+
+def test_resource_urls_are_prefix_joined(make_resource) -> None:
+    site = AdminSite(prefix="/backoffice")
+    site.register(make_resource("items"))
+    urls = site.resource_urls["items"]
+    assert urls.list_url == "/backoffice/items/"
+    assert urls.create_url == "/backoffice/items/create"
+    assert urls.detail_url("7") == "/backoffice/items/7"
+    assert urls.edit_url("7") == "/backoffice/items/7/edit"
+    assert urls.delete_url("7") == "/backoffice/items/7/delete"
@@ -0,0 +1,107 @@
+"""Unit tests for the example in-memory user DAO."""
+
+from __future__ import annotations
+
+import pytest
+
+from app.admin_resources.users import InMemoryUserDAO
+
+
+async def _ids(dao: InMemoryUserDAO) -> list[str]:
+    records, _ = await dao.list(offset=0, limit=0)
+    return [r["id"] for r in records]
+
+
+def _assert_columns_in_sync(dao: InMemoryUserDAO) -> None:
+    assert dao._ids == [r["id"] for r in dao._records]
+    assert dao._index == {uid: pos for pos, uid in enumerate(dao._ids)}
+    assert dao._search_blobs == [InMemoryUserDAO._search_blob(r) for r in dao._records]
+
+
+async def test_delete_middle_row_moves_last_row_into_its_slot() -> None:
+    dao = InMemoryUserDAO()
+    ids = await _ids(dao)
+
+    await dao.delete(ids[1])
+
+    assert await _ids(dao) == [ids[0], ids[4], ids[2], ids[3]]
+    assert await dao.get(ids[1]) is None
+    moved = await dao.get(ids[4])
+    assert moved is not None and moved["name"] == "User 5"
+    updated = await dao.update(ids[4], {"name": "Moved"})
+    assert updated["id"] == ids[4]
+    assert (await dao.get(ids[4]))["name"] == "Moved"
+    assert (await dao.get(ids[2]))["name"] == "User 3"
+    _assert_columns_in_sync(dao)
+
+
+async def test_delete_last_row() -> None:
+    dao = InMemoryUserDAO()
+    ids = await _ids(dao)
+
+    await dao.delete(ids[-1])
+
+    assert await _ids(dao) == ids[:-1]
+    assert await dao.get(ids[-1]) is None
+    assert await dao.count() == 4
+    _assert_columns_in_sync(dao)
+
+
+async def test_delete_unknown_id_raises() -> None:
+    dao = InMemoryUserDAO()
+
+    with pytest.raises(ValueError, match="not found"):
+        await dao.delete("missing")
+    assert await dao.count() == 5
+
+
+async def test_search_sees_updated_values() -> None:
+    dao = InMemoryUserDAO()
+    ids = await _ids(dao)
+
+    await dao.update(ids[2], {"name": "Zelda", "email": "zelda@example.org"})
+
+    records, total = await dao.list(offset=0, limit=10, search="zelda")
+    assert total == 1
+    assert [r["id"] for r in records] == [ids[2]]
+    assert (await dao.list(offset=0, limit=10, search="User 3"))[1] == 0
+
+
+async def test_search_with_paging() -> None:
+    dao = InMemoryUserDAO()
+    ids = await _ids(dao)
+
+    first, total = await dao.list(offset=0, limit=2, search="example.com")
+    second, _ = await dao.list(offset=2, limit=2, search="example.com")
+    last, _ = await dao.list(offset=4, limit=2, search="example.com")
+
+    assert total == 5
+    assert [r["id"] for r in first + second + last] == ids
+    assert len(last) == 1
+
+
+async def test_seed_rows_are_indexed_and_searchable() -> None:
+    dao = InMemoryUserDAO()
+
+    assert await dao.count() == 5
+    _assert_columns_in_sync(dao)
+    records, total = await dao.list(offset=0, limit=10, search="user4@")
+    assert total == 1
+    assert records[0]["name"] == "User 4"
+
+
+async def test_search_is_case_insensitive_on_name_and_email() -> None:
+    dao = InMemoryUserDAO()
+    created = await dao.create({"name": "Ada Lovelace", "email": "Countess@Analytical.org", "role": "user"})
+
+    for term in ("ADA", "lovelace", "countess@", "ANALYTICAL.ORG"):
+        records, total = await dao.list(offset=0, limit=10, search=term)
+        assert (total, [r["id"] for r in records]) == (1, [created["id"]]), term
+
+
+async def test_search_does_not_match_across_name_and_email() -> None:
+    dao = InMemoryUserDAO()
+    await dao.create({"name": "Ada", "email": "lovelace@example.org", "role": "user"})
+
+    for term in ("adalovelace", "ada lovelace", "ada\x00lovelace"):
+        assert (await dao.list(offset=0, limit=10, search=term))[1] == 0, term
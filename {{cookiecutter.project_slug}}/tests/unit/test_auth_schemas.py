@@ -0,0 +1,36 @@
+"""Tests for the auth request schemas."""
+
+from __future__ import annotations
+
+import pytest
+from pydantic import ValidationError
+
+from app.interfaces.api.schemas.auth import LoginRequest, RegisterRequest
+from app.interfaces.api.schemas.user import CreateUserRequest
+
+
+class TestAuthRequestEmail:
+    """Test the precompiled email check on auth requests."""
+
+    def test_domain_lowercased_local_part_kept(self):
+        """The domain is normalized like EmailStr; the local part is untouched."""
+        body = LoginRequest(email="Jane.Doe@Example.COM", password="password123")
+
+        assert body.email == "Jane.Doe@example.com"
+
+    @pytest.mark.parametrize("email", ["plain", "a@b", "a@@b.io", "a b@c.io", "a@-b.io", "a@b.io "])
+    def test_malformed_addresses_rejected(self, email):
+        """Addresses without a dotted domain or with stray characters fail."""
+        with pytest.raises(ValidationError):
+            RegisterRequest(name="A", email=email, password="password123")
+
+    def test_unknown_fields_rejected(self):
+        """Request bodies do not accept extra keys."""
+        with pytest.raises(ValidationError):
+            LoginRequest(email="a@example.com", password="password123", remember=True)
+
+    def test_create_user_request_uses_same_check(self):
+        """The create-user body validates email the same way."""
+        assert CreateUserRequest(name="A", email="a@Example.io").email == "a@example.io"
+        with pytest.raises(ValidationError):
+            CreateUserRequest(name="A", email="a@b")
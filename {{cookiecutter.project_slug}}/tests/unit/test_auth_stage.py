@@ -0,0 +1,134 @@
+"""Tests for the JWT AuthenticationStage and its payload cache."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.application.services.token_service import TokenService
+from app.interfaces.pipeline.stages.auth import (
+    AccessTokenCache,
+    AuthAndAuditStage,
+    AuthenticationFailed,
+    AuthenticationStage,
+)
+
+SECRET = "test-secret-key-of-at-least-32-bytes"
+
+
+class _Clock:
+    def __init__(self, now: float) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _ctx(token: str, token_service: object) -> SimpleNamespace:
+    request = SimpleNamespace(
+        headers={"Authorization": f"Bearer {token}"},
+        app=SimpleNamespace(state=SimpleNamespace(token_service=token_service)),
+    )
+    return SimpleNamespace(request=request, state={})
+
+
+class TestAccessTokenCache:
+    """Test AccessTokenCache expiry."""
+
+    def test_entry_expires_at_ttl_or_token_exp_whichever_first(self):
+        """Entries are dropped after the TTL, and never outlive the token's exp."""
+        clock = _Clock(1000.0)
+        cache = AccessTokenCache(ttl=30, clock=clock)
+        cache.put("long-lived", {"exp": 5000})
+        cache.put("short-lived", {"exp": 1010})
+
+        clock.now = 1009.0
+        assert cache.get("long-lived") == {"exp": 5000}
+        assert cache.get("short-lived") == {"exp": 1010}
+        clock.now = 1010.0
+        assert cache.get("short-lived") is None
+        clock.now = 1030.0
+        assert cache.get("long-lived") is None
+
+
+class TestAuthenticationStage:
+    """Test AuthenticationStage.resolve()."""
+
+    @pytest.mark.asyncio
+    async def test_repeat_token_decoded_once(self):
+        """A second request with the same token is served from the cache."""
+        real = TokenService(secret_key=SECRET)
+        token = real.create_access_token("user-1")
+        token_service = MagicMock(wraps=real)
+        stage = AuthenticationStage(cache=AccessTokenCache())
+
+        for _ in range(2):
+            ctx = _ctx(token, token_service)
+            await stage.resolve(ctx)
+            assert ctx.state == {"user_id": "user-1", "authenticated": True}
+
+        token_service.decode_token.assert_called_once_with(token)
+
+    @pytest.mark.asyncio
+    async def test_refresh_token_rejected_and_not_cached(self):
+        """Non-access tokens abort every time rather than being cached."""
+        token_service = TokenService(secret_key=SECRET)
+        token, _, _ = token_service.create_refresh_token("user-1")
+        cache = AccessTokenCache()
+        stage = AuthenticationStage(cache=cache)
+
+        with pytest.raises(AuthenticationFailed):
+            await stage.resolve(_ctx(token, token_service))
+        assert cache.get(token) is None
+
+    @pytest.mark.asyncio
+    async def test_malformed_token_rejected_without_decoding(self):
+        """Tokens that are not three segments never reach the token service."""
+        token_service = MagicMock()
+        stage = AuthenticationStage(cache=AccessTokenCache())
+
+        with pytest.raises(AuthenticationFailed):
+            await stage.resolve(_ctx("not-a-jwt", token_service))
+        token_service.decode_token.assert_not_called()
+
+
+class TestAuthAndAuditStage:
+    """Test the fused AuthAndAuditStage."""
+
+    @pytest.mark.asyncio
+    async def test_authenticates_and_logs(self, caplog):
+        """One resolve sets the user on the context and logs the request."""
+        token_service = TokenService(secret_key=SECRET)
+        ctx = _ctx(token_service.create_access_token("user-1"), token_service)
+        ctx.request.method = "GET"
+        ctx.request.url = SimpleNamespace(path="/api/v1/auth/me")
+
+        with caplog.at_level("INFO", logger="app.interfaces.pipeline.stages.logging_stage"):
+            await AuthAndAuditStage().resolve(ctx)
+
+        assert ctx.state == {"user_id": "user-1", "authenticated": True}
+        assert "GET /api/v1/auth/me (user=user-1)" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_invalid_token_aborts_before_logging(self, caplog):
+        """A bad token aborts the request without logging it."""
+        ctx = _ctx("not-a-jwt", TokenService(secret_key=SECRET))
+
+        with caplog.at_level("INFO"), pytest.raises(AuthenticationFailed):
+            await AuthAndAuditStage().resolve(ctx)
+
+        assert "Request:" not in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_url_not_touched_above_info(self, caplog):
+        """With INFO disabled the request URL is never built."""
+        token_service = TokenService(secret_key=SECRET)
+        ctx = _ctx(token_service.create_access_token("user-1"), token_service)
+        ctx.request.method = "GET"  # no ctx.request.url: reading it would fail
+
+        with caplog.at_level("WARNING", logger="app.interfaces.pipeline.stages.logging_stage"):
+            await AuthAndAuditStage().resolve(ctx)
+
+        assert ctx.state["user_id"] == "user-1"
@@ -0,0 +1,26 @@
+"""Tests for the blocking-call thread pool."""
+
+from __future__ import annotations
+
+import os
+import threading
+
+import pytest
+
+from app.application.services.blocking import get_blocking_pool, run_blocking, usable_cpu_count
+
+
+class TestRunBlocking:
+    """Test run_blocking() and the pool behind it."""
+
+    @pytest.mark.asyncio
+    async def test_runs_in_pool_thread(self):
+        """Calls run on a pool worker, never on the event loop thread."""
+        thread_name = await run_blocking(lambda: threading.current_thread().name)
+
+        assert thread_name.startswith("blocking")
+
+    def test_pool_sized_to_usable_cpus(self):
+        """The pool has one worker per CPU the process may use."""
+        assert 1 <= usable_cpu_count() <= (os.cpu_count() or 1)
+        assert get_blocking_pool()._max_workers == usable_cpu_count()
@@ -0,0 +1,83 @@
+"""Unit tests for CommandBus/QueryBus dispatch."""
+
+from dataclasses import dataclass
+
+import pytest
+
+from app.application.bus.command_bus import (
+    CommandBus,
+    DuplicateHandlerError,
+    HandlerNotFoundError,
+    command_handler,
+)
+from app.application.bus.message import Command
+
+
+@dataclass(frozen=True, slots=True)
+class _PingCommand(Command):
+    value: int
+
+
+@dataclass(frozen=True, slots=True)
+class _UnhandledCommand(Command):
+    pass
+
+
+@command_handler(_PingCommand)
+async def _handle_ping(command: _PingCommand, *, offset: int = 0) -> int:
+    return command.value + offset
+
+
+def test_subclasses_record_their_dispatch_key() -> None:
+    assert _PingCommand.__dispatch_key__ is _PingCommand
+    assert _PingCommand(1).__dispatch_key__ is _PingCommand
+
+
+async def test_dispatch_passes_kwargs_to_handler() -> None:
+    assert await CommandBus().dispatch(_PingCommand(1), offset=2) == 3
+
+
+async def test_dispatch_unregistered_raises() -> None:
+    with pytest.raises(HandlerNotFoundError, match="_UnhandledCommand"):
+        await CommandBus().dispatch(_UnhandledCommand())
+
+
+@dataclass(frozen=True)
+class _PlainMessage:
+    pass
+
+
+async def test_dispatch_non_message_raises_handler_not_found() -> None:
+    with pytest.raises(HandlerNotFoundError, match="_PlainMessage"):
+        await CommandBus().dispatch(_PlainMessage())
+
+
+def test_registering_a_different_handler_raises() -> None:
+    async def _other(command: _PingCommand) -> int:
+        return 0
+
+    with pytest.raises(DuplicateHandlerError):
+        command_handler(_PingCommand)(_other)
+
+
+def test_registering_the_same_handler_twice_raises() -> None:
+    with pytest.raises(DuplicateHandlerError):
+        command_handler(_PingCommand)(_handle_ping)
+
+
+def test_slotted_commands_have_no_instance_dict() -> None:
+    assert not hasattr(_PingCommand(1), "__dict__")
+
+
+async def test_frozen_dispatch_matches_lookup() -> None:
+    CommandBus.freeze()
+    try:
+        assert CommandBus.dispatch is not CommandBus._dispatch_lookup
+        assert await CommandBus().dispatch(_PingCommand(1), offset=2) == 3
+        with pytest.raises(HandlerNotFoundError, match="_UnhandledCommand"):
+            await CommandBus().dispatch(_UnhandledCommand())
+        with pytest.raises(HandlerNotFoundError, match="_PlainMessage"):
+            await CommandBus().dispatch(_PlainMessage())
+    finally:
+        CommandBus.thaw()
+    assert CommandBus.dispatch is CommandBus._dispatch_lookup
@@ -0,0 +1,33 @@
+"""Tests for the ChangePasswordCommand handler."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.application.commands.change_password import ChangePasswordCommand
+from app.application.handlers.commands.change_password_handler import handle_change_password
+from app.domain.errors import ValidationError
+
+
+class TestHandleChangePassword:
+    """Test handle_change_password()."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "user_id",
+        ["", "not-a-uuid", "12345678123456781234567812345678", "{12345678-1234-5678-1234-567812345678}"],
+    )
+    async def test_malformed_user_id_rejected_before_db(self, user_id):
+        """Only the canonical hyphenated form is accepted; nothing touches the UoW."""
+        uow = MagicMock()
+
+        with pytest.raises(ValidationError):
+            await handle_change_password(
+                ChangePasswordCommand(user_id=user_id, old_password="old", new_password="new"),
+                uow=uow,
+                password_hasher=MagicMock(),
+            )
+
+        uow.__aenter__.assert_not_called()
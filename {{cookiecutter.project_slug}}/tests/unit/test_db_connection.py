@@ -0,0 +1,47 @@
+"""Tests for engine setup helpers."""
+
+from __future__ import annotations
+
+import logging
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from app.infrastructure.db.connection import configure_prepared_statements
+
+
+def _engine(*connections: object) -> MagicMock:
+    engine = MagicMock()
+    engine._connection_manager._pool = list(connections)
+    return engine
+
+
+class TestConfigurePreparedStatements:
+    """Test configure_prepared_statements()."""
+
+    def test_sets_prepare_threshold_on_postgres_connections(self):
+        """Every pooled psycopg connection gets the configured threshold."""
+        connections = [SimpleNamespace(prepare_threshold=5), SimpleNamespace(prepare_threshold=5)]
+        settings = SimpleNamespace(db_driver="postgresql", db_prepare_threshold=0)
+
+        configure_prepared_statements(_engine(*connections), settings)
+
+        assert [c.prepare_threshold for c in connections] == [0, 0]
+
+    def test_sqlite_connections_untouched(self):
+        """SQLite caches statements itself; its connections are left alone."""
+        connection = SimpleNamespace()
+        settings = SimpleNamespace(db_driver="sqlite", db_prepare_threshold=0)
+
+        configure_prepared_statements(_engine(connection), settings)
+
+        assert not hasattr(connection, "prepare_threshold")
+
+    def test_missing_pool_attribute_warns(self, caplog):
+        """A RowQuery without the private pool attribute is reported, not fatal."""
+        engine = SimpleNamespace(_connection_manager=SimpleNamespace())
+        settings = SimpleNamespace(db_driver="postgresql", db_prepare_threshold=0)
+
+        with caplog.at_level(logging.WARNING, logger="app.infrastructure.db.connection"):
+            configure_prepared_statements(engine, settings)
+
+        assert "_connection_manager._pool" in caplog.text
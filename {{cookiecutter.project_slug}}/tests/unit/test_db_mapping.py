@@ -0,0 +1,69 @@
+"""Tests for the shared repository column converters."""
+
+from __future__ import annotations
+
+import asyncio
+import uuid
+from datetime import UTC, datetime
+
+import pytest
+
+from app.infrastructure.db.mapping import (
+    map_rows,
+    to_datetime,
+    to_epoch_ms,
+    to_optional_datetime,
+    to_optional_epoch_ms,
+    to_uuid,
+)
+
+
+class TestConverters:
+    """Test the timestamp and id converters."""
+
+    def test_strings_and_native_values(self):
+        """ISO strings are parsed; already-typed values pass through."""
+        now = datetime.now(UTC)
+        raw_id = uuid.uuid4()
+
+        assert to_datetime(now.isoformat()) == now
+        assert to_datetime(now) is now
+        assert to_optional_datetime(None) is None
+        assert to_uuid(str(raw_id)) == raw_id
+        assert to_uuid(raw_id) is raw_id
+
+    def test_epoch_ms_round_trip(self):
+        """Epoch milliseconds map back to the same aware UTC datetime."""
+        when = datetime(2024, 5, 1, 12, 30, 15, 123000, tzinfo=UTC)
+
+        assert to_epoch_ms(when) == 1714566615123
+        assert to_datetime(to_epoch_ms(when)) == when
+        assert to_datetime(to_epoch_ms(when)).tzinfo is UTC
+        assert to_optional_epoch_ms(None) is None
+
+    def test_unexpected_type_raises_type_error(self):
+        """Other types raise TypeError so mappers report DataMappingError."""
+        with pytest.raises(TypeError):
+            to_datetime(123.0)
+
+
+class TestMapRows:
+    """Test map_rows()."""
+
+    @pytest.mark.asyncio
+    async def test_maps_in_order_and_yields_between_batches(self):
+        """Large inputs are converted in order, letting other tasks run between batches."""
+        ticks = []
+
+        async def ticker():
+            for _ in range(3):
+                ticks.append(len(ticks))
+                await asyncio.sleep(0)
+
+        task = asyncio.create_task(ticker())
+        result = await map_rows(list(range(7)), lambda n: n * 2, batch_size=2)
+        ran_during_mapping = bool(ticks)
+        await task
+
+        assert result == [0, 2, 4, 6, 8, 10, 12]
+        assert ran_during_mapping
@@ -0,0 +1,92 @@
+"""Tests for the LoginUserCommand handler."""
+
+from __future__ import annotations
+
+import threading
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.application.commands.login_user import LoginUserCommand
+from app.application.handlers.commands.login_user_handler import handle_login_user
+from app.application.services.token_service import TokenService
+from app.domain.entities.user import UserEntity
+from app.domain.errors import AuthenticationError
+
+
+class TestHandleLoginUser:
+    """Test handle_login_user()."""
+
+    @pytest.mark.asyncio
+    async def test_unknown_email_still_verifies_against_dummy_hash(self):
+        """A missing user costs a full verify and never opens the transaction."""
+        uow = MagicMock()
+        uow.user_reader.get_by_email = AsyncMock(return_value=None)
+        hasher = MagicMock(dummy_hash="dummy-hash")
+        hasher.verify.return_value = True
+
+        with pytest.raises(AuthenticationError):
+            await handle_login_user(
+                LoginUserCommand(email="nobody@example.com", password="pw"),
+                uow=uow,
+                password_hasher=hasher,
+                token_service=MagicMock(),
+            )
+
+        hasher.verify.assert_called_once_with("pw", "dummy-hash")
+        uow.__aenter__.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_dummy_hash_resolved_off_the_event_loop(self):
+        """The lazily computed dummy hash is read in the worker thread, not on the loop."""
+        uow = MagicMock()
+        uow.user_reader.get_by_email = AsyncMock(return_value=None)
+        threads = []
+
+        class _Hasher:
+            @property
+            def dummy_hash(self) -> str:
+                threads.append(threading.get_ident())
+                return "dummy-hash"
+
+            def verify(self, password: str, password_hash: str) -> bool:
+                return False
+
+        with pytest.raises(AuthenticationError):
+            await handle_login_user(
+                LoginUserCommand(email="nobody@example.com", password="pw"),
+                uow=uow,
+                password_hasher=_Hasher(),
+                token_service=MagicMock(),
+            )
+
+        assert threads and threads[0] != threading.get_ident()
+
+    @pytest.mark.asyncio
+    async def test_legacy_hash_upgraded_in_the_login_transaction(self):
+        """A hash flagged by needs_rehash is replaced on a fresh, transactional copy."""
+        read_user = UserEntity.create(name="A", email="a@example.com", password_hash="legacy")
+        stored_user = UserEntity.create(name="A", email="a@example.com", password_hash="legacy")
+        uow = MagicMock()
+        uow.__aenter__ = AsyncMock(return_value=uow)
+        uow.__aexit__ = AsyncMock(return_value=None)
+        uow.user_reader.get_by_email = AsyncMock(return_value=read_user)
+        uow.user_repository.get_by_id = AsyncMock(return_value=stored_user)
+        uow.user_repository.save = AsyncMock()
+        uow.refresh_token_repository.save = AsyncMock()
+        hasher = MagicMock()
+        hasher.verify.return_value = True
+        hasher.needs_rehash.return_value = True
+        hasher.hash.return_value = "upgraded"
+
+        await handle_login_user(
+            LoginUserCommand(email="a@example.com", password="pw"),
+            uow=uow,
+            password_hasher=hasher,
+            token_service=TokenService(secret_key="test-secret-key-of-at-least-32-bytes"),
+        )
+
+        hasher.hash.assert_called_once_with("pw")
+        uow.user_repository.save.assert_awaited_once_with(stored_user)
+        assert stored_user.password_hash == "upgraded"
+        assert read_user.password_hash == "legacy"
@@ -0,0 +1,108 @@
+"""Tests for the bcrypt and argon2id password hashers."""
+
+from __future__ import annotations
+
+import bcrypt
+
+from app.infrastructure.security.password_hasher import Argon2PasswordHasher, BcryptPasswordHasher
+
+
+def _hash(password: str) -> str:
+    # Minimum cost keeps the suite fast; verify reads the cost from the hash
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=4)).decode()
+
+
+def _spy_checkpw(monkeypatch) -> list[bool]:
+    """Count bcrypt.checkpw calls from here on; returns the list of their results."""
+    checkpw = bcrypt.checkpw
+    results: list[bool] = []
+
+    def spy(password: bytes, hashed_password: bytes) -> bool:
+        results.append(checkpw(password, hashed_password))
+        return results[-1]
+
+    monkeypatch.setattr(bcrypt, "checkpw", spy)
+    return results
+
+
+class TestBcryptPasswordHasherVerify:
+    """Test BcryptPasswordHasher.verify() and its verified-password cache."""
+
+    def test_repeat_success_skips_bcrypt(self, monkeypatch):
+        """A second verify of the right password is answered from the cache."""
+        hasher = BcryptPasswordHasher(verified_cache_size=1024)
+        password_hash = _hash("secret")
+
+        calls = _spy_checkpw(monkeypatch)
+        assert hasher.verify("secret", password_hash)
+        assert hasher.verify("secret", password_hash)
+
+        assert len(calls) == 1
+
+    def test_wrong_password_still_runs_bcrypt(self, monkeypatch):
+        """A cached hash never short-circuits a different password."""
+        hasher = BcryptPasswordHasher(verified_cache_size=1024)
+        password_hash = _hash("secret")
+        hasher.verify("secret", password_hash)
+
+        calls = _spy_checkpw(monkeypatch)
+        assert not hasher.verify("guess", password_hash)
+
+        assert len(calls) == 1
+
+    def test_cache_off_by_default(self, monkeypatch):
+        """Without an explicit cache size every verify runs bcrypt."""
+        hasher = BcryptPasswordHasher()
+        password_hash = _hash("secret")
+
+        calls = _spy_checkpw(monkeypatch)
+        assert hasher.verify("secret", password_hash)
+        assert hasher.verify("secret", password_hash)
+
+        assert len(calls) == 2
+
+    def test_cache_bounded(self, monkeypatch):
+        """Only the most recently verified hashes are remembered."""
+        hasher = BcryptPasswordHasher(verified_cache_size=1)
+        first, second = _hash("one"), _hash("two")
+        hasher.verify("one", first)
+        hasher.verify("two", second)
+
+        calls = _spy_checkpw(monkeypatch)
+        assert hasher.verify("one", first)
+
+        assert len(calls) == 1
+
+
+def _argon2(**kwargs) -> Argon2PasswordHasher:
+    # Minimum cost keeps the suite fast; verify reads the parameters from the hash
+    return Argon2PasswordHasher(time_cost=1, memory_cost=8, **kwargs)
+
+
+class TestArgon2PasswordHasher:
+    """Test Argon2PasswordHasher hashing, legacy verification and rehash checks."""
+
+    def test_hash_and_verify(self):
+        """Hashes are argon2id and verify only the original password."""
+        hasher = _argon2()
+        password_hash = hasher.hash("secret")
+
+        assert password_hash.startswith("$argon2id$")
+        assert hasher.verify("secret", password_hash)
+        assert not hasher.verify("guess", password_hash)
+        assert not hasher.needs_rehash(password_hash)
+
+    def test_legacy_bcrypt_hash_verified_and_flagged_for_rehash(self):
+        """bcrypt hashes still log in and are reported for upgrade."""
+        hasher = _argon2()
+        legacy = _hash("secret")
+
+        assert hasher.verify("secret", legacy)
+        assert not hasher.verify("guess", legacy)
+        assert hasher.needs_rehash(legacy)
+
+    def test_weaker_parameters_flagged_for_rehash(self):
+        """Hashes made with other parameters are reported for upgrade."""
+        weak = _argon2().hash("secret")
+
+        assert Argon2PasswordHasher(time_cost=2, memory_cost=16).needs_rehash(weak)
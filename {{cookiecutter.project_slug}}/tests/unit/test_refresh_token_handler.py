@@ -0,0 +1,70 @@
+"""Tests for the RefreshTokenCommand and LogoutUserCommand handlers."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.application.commands.logout_user import LogoutUserCommand
+from app.application.commands.refresh_token import RefreshTokenCommand
+from app.application.handlers.commands.logout_user_handler import handle_logout_user
+from app.application.handlers.commands.refresh_token_handler import handle_refresh_token
+from app.application.services.token_service import TokenService
+from app.domain.error_codes import TOKEN_REVOKED
+from app.domain.errors import AuthenticationError
+
+SECRET = "test-secret-key-of-at-least-32-bytes"
+
+
+def _uow(service: TokenService, *, revoked: bool) -> MagicMock:
+    """A UoW whose pre-check finds a live token; ``revoked`` means revoke() then updates nothing."""
+    _, record = service.issue_refresh_token("user-1")
+    uow = MagicMock()
+    uow.__aenter__ = AsyncMock(return_value=uow)
+    uow.__aexit__ = AsyncMock(return_value=None)
+    uow.refresh_token_reader.get_by_token_hash = AsyncMock(return_value=record)
+    uow.refresh_token_repository.revoke = AsyncMock(return_value=not revoked)
+    uow.refresh_token_repository.save = AsyncMock()
+    return uow
+
+
+class TestRefreshTokenReplay:
+    """A token revoked between the pre-check and the transaction is rejected."""
+
+    @pytest.mark.asyncio
+    async def test_refresh_rejected_when_concurrent_request_revoked_first(self):
+        """Only the request whose revoke updated the row gets a new pair."""
+        service = TokenService(secret_key=SECRET)
+        token, _ = service.issue_refresh_token("user-1")
+        uow = _uow(service, revoked=True)
+
+        with pytest.raises(AuthenticationError) as exc_info:
+            await handle_refresh_token(RefreshTokenCommand(refresh_token=token), uow=uow, token_service=service)
+
+        assert exc_info.value.code == TOKEN_REVOKED
+        uow.refresh_token_repository.save.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_refresh_issues_pair_when_revoke_wins(self):
+        """The winning request saves the new refresh token."""
+        service = TokenService(secret_key=SECRET)
+        token, _ = service.issue_refresh_token("user-1")
+        uow = _uow(service, revoked=False)
+
+        result = await handle_refresh_token(RefreshTokenCommand(refresh_token=token), uow=uow, token_service=service)
+
+        assert result.refresh_token != token
+        uow.refresh_token_repository.save.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_logout_reports_token_consumed_by_concurrent_refresh(self):
+        """Logout does not report success for a token a concurrent refresh already rotated."""
+        service = TokenService(secret_key=SECRET)
+        token, _ = service.issue_refresh_token("user-1")
+        uow = _uow(service, revoked=True)
+
+        with pytest.raises(AuthenticationError) as exc_info:
+            await handle_logout_user(LogoutUserCommand(refresh_token=token), uow=uow, token_service=service)
+
+        assert exc_info.value.code == TOKEN_REVOKED
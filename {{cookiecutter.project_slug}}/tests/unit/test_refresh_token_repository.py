@@ -3,210 +3,139 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
-from unittest.mock import AsyncMock
 
 import pytest
 
 from app.domain.interfaces.refresh_token_repository import RefreshTokenRecord
 from app.infrastructure.db.repositories.refresh_token_repository import (
+    SAVE_MANY_BATCH_SIZE,
     RefreshTokenRepository,
 )
 from app.infrastructure.errors import DatabaseError, DataMappingError
+from tests.unit.repository_rows import EXPIRES, NOW, VALID_TOKEN_ROW
+
+_RECORD = RefreshTokenRecord(
+    id="token-789",
+    user_id="user-999",
+    token_hash="hash-abc",
+    expires_at=EXPIRES,
+    revoked_at=None,
+    created_at=NOW,
+)
 
 
 class TestRefreshTokenRepositorySave:
     """Test RefreshTokenRepository.save()."""
 
     @pytest.mark.asyncio
-    async def test_save_success(self):
+    async def test_save_success(self, tx, refresh_token_repo):
         """Successfully save a refresh token."""
         record = RefreshTokenRecord(
             id="token-123",
             user_id="user-456",
             token_hash="hash-xyz",
-            expires_at=datetime.now(UTC) + timedelta(days=7),
+            expires_at=EXPIRES,
             revoked_at=None,
-            created_at=datetime.now(UTC),
+            created_at=NOW,
         )
 
-        mock_tx = AsyncMock()
-        repo = RefreshTokenRepository(mock_tx)
-        await repo.save(record)
-
-        mock_tx.execute.assert_called_once()
-        call_args = mock_tx.execute.call_args
-        assert call_args[0][0] == "refresh_tokens.insert"
-        assert call_args[0][1]["id"] == "token-123"
-        assert call_args[0][1]["user_id"] == "user-456"
-
-    @pytest.mark.asyncio
-    async def test_save_database_error(self):
-        """Raise DatabaseError when save fails."""
-        record = RefreshTokenRecord(
-            id="token-789",
-            user_id="user-999",
-            token_hash="hash-abc",
-            expires_at=datetime.now(UTC) + timedelta(days=7),
-            revoked_at=None,
-            created_at=datetime.now(UTC),
-        )
+        await refresh_token_repo.save(record)
 
-        mock_tx = AsyncMock()
-        mock_tx.execute.side_effect = Exception("Foreign key constraint failed")
-
-        repo = RefreshTokenRepository(mock_tx)
-
-        with pytest.raises(DatabaseError) as exc_info:
-            await repo.save(record)
-
-        assert exc_info.value.message == "Failed to save refresh token"
-        assert "Foreign key constraint failed" in str(exc_info.value.cause)
+        [(method, sql, params)] = tx.calls
+        assert (method, sql) == ("execute", "refresh_tokens.insert")
+        assert params["id"] == "token-123"
+        assert params["user_id"] == "user-456"
+        assert params["expires_at"] == int(record.expires_at.timestamp() * 1000)
+        assert params["revoked_at"] is None
 
 
 class TestRefreshTokenRepositoryGetByTokenHash:
     """Test RefreshTokenRepository.get_by_token_hash()."""
 
     @pytest.mark.asyncio
-    async def test_get_by_token_hash_success(self):
+    async def test_get_by_token_hash_success(self, tx, refresh_token_repo):
         """Successfully fetch a refresh token by hash."""
-        mock_row = {
-            "id": "token-123",
-            "user_id": "user-456",
-            "token_hash": "hash-xyz",
-            "expires_at": datetime.now(UTC) + timedelta(days=7),
-            "revoked_at": None,
-            "created_at": datetime.now(UTC),
-        }
-
-        mock_tx = AsyncMock()
-        mock_tx.fetch_one.return_value = mock_row
+        tx.fetch_one_result = VALID_TOKEN_ROW
 
-        repo = RefreshTokenRepository(mock_tx)
-        result = await repo.get_by_token_hash("hash-xyz")
+        result = await refresh_token_repo.get_by_token_hash("hash-xyz")
 
         assert result is not None
         assert result.id == "token-123"
         assert result.user_id == "user-456"
-        mock_tx.fetch_one.assert_called_once_with(
-            "refresh_tokens.get_by_token_hash", {"token_hash": "hash-xyz"}
-        )
+        assert tx.calls == [("fetch_one", "refresh_tokens.get_by_token_hash", {"token_hash": "hash-xyz"})]
 
     @pytest.mark.asyncio
-    async def test_get_by_token_hash_not_found(self):
+    async def test_get_by_token_hash_not_found(self, tx, refresh_token_repo):
         """Return None when token not found."""
-        mock_tx = AsyncMock()
-        mock_tx.fetch_one.return_value = None
-
-        repo = RefreshTokenRepository(mock_tx)
-        result = await repo.get_by_token_hash("nonexistent-hash")
+        result = await refresh_token_repo.get_by_token_hash("nonexistent-hash")
 
         assert result is None
 
-    @pytest.mark.asyncio
-    async def test_get_by_token_hash_database_error(self):
-        """Raise DatabaseError when database operation fails."""
-        mock_tx = AsyncMock()
-        mock_tx.fetch_one.side_effect = Exception("Connection pool exhausted")
-
-        repo = RefreshTokenRepository(mock_tx)
-
-        with pytest.raises(DatabaseError) as exc_info:
-            await repo.get_by_token_hash("some-hash")
-
-        assert exc_info.value.message == "Failed to fetch refresh token by hash"
-        assert str(exc_info.value.cause) == "Connection pool exhausted"
-
 
 class TestRefreshTokenRepositoryRevoke:
-    """Test RefreshTokenRepository.revoke()."""
+    """Test RefreshTokenRepository.revoke() and revoke_all_for_user()."""
 
     @pytest.mark.asyncio
-    async def test_revoke_success(self):
-        """Successfully revoke a refresh token."""
-        mock_tx = AsyncMock()
-        repo = RefreshTokenRepository(mock_tx)
-        await repo.revoke("token-123")
-
-        mock_tx.execute.assert_called_once()
-        call_args = mock_tx.execute.call_args
-        assert call_args[0][0] == "refresh_tokens.revoke"
-        assert call_args[0][1]["id"] == "token-123"
+    @pytest.mark.parametrize(
+        ("method", "arg", "expected_tx_method", "sql_key", "key"),
+        [
+            ("revoke", "token-123", "fetch_one", "refresh_tokens.revoke", "id"),
+            ("revoke_all_for_user", "user-789", "execute", "refresh_tokens.revoke_all_for_user", "user_id"),
+        ],
+    )
+    async def test_revoke_success(self, tx, refresh_token_repo, method, arg, expected_tx_method, sql_key, key):
+        """Revocations run one statement stamped with the current epoch-ms time."""
+        await getattr(refresh_token_repo, method)(arg)
+
+        [(tx_method, sql, params)] = tx.calls
+        assert (tx_method, sql) == (expected_tx_method, sql_key)
+        assert params[key] == arg
+        revoked_at = params["revoked_at"]
+        assert isinstance(revoked_at, int)
+        assert abs(revoked_at - datetime.now(UTC).timestamp() * 1000) < 60_000
 
     @pytest.mark.asyncio
-    async def test_revoke_database_error(self):
-        """Raise DatabaseError when revoke fails."""
-        mock_tx = AsyncMock()
-        mock_tx.execute.side_effect = Exception("Update failed")
+    async def test_revoke_reports_whether_a_row_was_updated(self, tx, refresh_token_repo):
+        """revoke() is True only when its UPDATE matched an unrevoked token."""
+        tx.fetch_one_result = {"id": "token-123"}
+        assert await refresh_token_repo.revoke("token-123") is True
 
-        repo = RefreshTokenRepository(mock_tx)
-
-        with pytest.raises(DatabaseError) as exc_info:
-            await repo.revoke("token-456")
+        tx.fetch_one_result = None
+        assert await refresh_token_repo.revoke("token-123") is False
 
-        assert exc_info.value.message == "Failed to revoke refresh token"
-        assert str(exc_info.value.cause) == "Update failed"
-
-
-class TestRefreshTokenRepositoryRevokeAllForUser:
-    """Test RefreshTokenRepository.revoke_all_for_user()."""
-
-    @pytest.mark.asyncio
-    async def test_revoke_all_for_user_success(self):
-        """Successfully revoke all tokens for a user."""
-        mock_tx = AsyncMock()
-        repo = RefreshTokenRepository(mock_tx)
-        await repo.revoke_all_for_user("user-789")
-
-        mock_tx.execute.assert_called_once()
-        call_args = mock_tx.execute.call_args
-        assert call_args[0][0] == "refresh_tokens.revoke_all_for_user"
-        assert call_args[0][1]["user_id"] == "user-789"
-
-    @pytest.mark.asyncio
-    async def test_revoke_all_for_user_database_error(self):
-        """Raise DatabaseError when bulk revoke fails."""
-        mock_tx = AsyncMock()
-        mock_tx.execute.side_effect = Exception("Batch update timeout")
 
-        repo = RefreshTokenRepository(mock_tx)
-
-        with pytest.raises(DatabaseError) as exc_info:
-            await repo.revoke_all_for_user("user-999")
+class TestRefreshTokenRepositoryDataMapping:
+    """Test RefreshTokenRepository data mapping error handling."""
 
-        assert exc_info.value.message == "Failed to revoke all refresh tokens for user"
-        assert str(exc_info.value.cause) == "Batch update timeout"
+    def test_to_record_matches_regular_construction(self):
+        """Rows parsed from ISO text rehydrate to a record equal to one built normally."""
+        mock_row = {**VALID_TOKEN_ROW, "expires_at": EXPIRES.isoformat(), "created_at": NOW.isoformat()}
 
+        record = RefreshTokenRepository._to_record(mock_row)
 
-class TestRefreshTokenRepositoryDataMapping:
-    """Test RefreshTokenRepository data mapping error handling."""
+        assert record == RefreshTokenRecord(
+            id="token-123",
+            user_id="user-456",
+            token_hash="hash-xyz",
+            expires_at=EXPIRES,
+            revoked_at=None,
+            created_at=NOW,
+        )
+        with pytest.raises(AttributeError):
+            record.token_hash = "other"
 
-    @pytest.mark.asyncio
-    async def test_to_record_mapping_error_missing_field(self):
+    def test_to_record_mapping_error_missing_field(self):
         """Raise DataMappingError when required field is missing."""
-        mock_row = {
-            "id": "token-123",
-            "user_id": "user-456",
-            # Missing 'token_hash'
-            "expires_at": datetime.now(UTC),
-            "created_at": datetime.now(UTC),
-        }
+        mock_row = {key: value for key, value in VALID_TOKEN_ROW.items() if key != "token_hash"}
 
         with pytest.raises(DataMappingError) as exc_info:
             RefreshTokenRepository._to_record(mock_row)
 
         assert "Failed to map database row to RefreshTokenRecord" in exc_info.value.message
 
-    @pytest.mark.asyncio
-    async def test_to_record_mapping_error_invalid_datetime(self):
+    def test_to_record_mapping_error_invalid_datetime(self):
         """Raise DataMappingError when datetime is invalid."""
-        mock_row = {
-            "id": "token-123",
-            "user_id": "user-456",
-            "token_hash": "hash-xyz",
-            "expires_at": "not-a-datetime",
-            "revoked_at": None,
-            "created_at": datetime.now(UTC),
-        }
+        mock_row = {**VALID_TOKEN_ROW, "expires_at": "not-a-datetime"}
 
         with pytest.raises(DataMappingError) as exc_info:
             RefreshTokenRepository._to_record(mock_row)
@@ -215,67 +144,92 @@ class TestRefreshTokenRepositoryDataMapping:
         assert exc_info.value.cause is not None
 
     @pytest.mark.asyncio
-    async def test_get_by_token_hash_mapping_error(self):
+    async def test_get_by_token_hash_mapping_error(self, tx, refresh_token_repo):
         """Raise DataMappingError when row mapping fails during fetch."""
-        mock_row = {
-            "id": "token-123",
-            "user_id": "user-456",
-            "token_hash": "hash-xyz",
-            "expires_at": "invalid",
-            "revoked_at": None,
-            "created_at": datetime.now(UTC),
-        }
-
-        mock_tx = AsyncMock()
-        mock_tx.fetch_one.return_value = mock_row
+        mock_row = {**VALID_TOKEN_ROW, "expires_at": "invalid"}
 
-        repo = RefreshTokenRepository(mock_tx)
+        tx.fetch_one_result = mock_row
 
         with pytest.raises(DataMappingError) as exc_info:
-            await repo.get_by_token_hash("hash-xyz")
+            await refresh_token_repo.get_by_token_hash("hash-xyz")
 
         assert (
             exc_info.value.message
             == "Failed to map database row to RefreshTokenRecord"
         )
 
-    @pytest.mark.asyncio
-    async def test_to_record_with_revoked_at_success(self):
+    def test_to_record_with_revoked_at_success(self):
         """Successfully map a revoked token."""
-        now = datetime.now(UTC)
-        revoked = now + timedelta(hours=1)
-        mock_row = {
-            "id": "token-123",
-            "user_id": "user-456",
-            "token_hash": "hash-xyz",
-            "expires_at": now + timedelta(days=7),
-            "revoked_at": revoked,
-            "created_at": now,
-        }
+        revoked = NOW + timedelta(hours=1)
+        mock_row = {**VALID_TOKEN_ROW, "revoked_at": revoked}
 
         result = RefreshTokenRepository._to_record(mock_row)
 
         assert result.id == "token-123"
         assert result.revoked_at == revoked
 
-    @pytest.mark.asyncio
-    async def test_to_record_with_iso_string_dates(self):
+    def test_to_record_with_iso_string_dates(self):
         """Successfully map a record with ISO format date strings."""
-        now = datetime.now(UTC)
-        expires = (now + timedelta(days=7)).isoformat()
-        created = now.isoformat()
-
-        mock_row = {
-            "id": "token-123",
-            "user_id": "user-456",
-            "token_hash": "hash-xyz",
-            "expires_at": expires,
-            "revoked_at": None,
-            "created_at": created,
-        }
+        mock_row = {**VALID_TOKEN_ROW, "expires_at": EXPIRES.isoformat(), "created_at": NOW.isoformat()}
 
         result = RefreshTokenRepository._to_record(mock_row)
 
         assert result.id == "token-123"
         assert isinstance(result.expires_at, datetime)
         assert isinstance(result.created_at, datetime)
+
+
+class TestRefreshTokenRepositorySaveMany:
+    """Test RefreshTokenRepository.save_many()."""
+
+    @staticmethod
+    def _records(count: int) -> list[RefreshTokenRecord]:
+        return [
+            RefreshTokenRecord(
+                id=f"token-{i}",
+                user_id="user-1",
+                token_hash=f"hash-{i}",
+                expires_at=EXPIRES,
+                revoked_at=None,
+                created_at=NOW,
+            )
+            for i in range(count)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_save_many_batches_rows_into_multi_row_inserts(self, tx, refresh_token_repo):
+        """Records are written with one INSERT per batch, each row bound by suffix."""
+        await refresh_token_repo.save_many(self._records(SAVE_MANY_BATCH_SIZE + 2))
+
+        assert [method for method, _, _ in tx.calls] == ["execute", "execute"]
+        _, sql, params = tx.calls[1]
+        assert sql.startswith("INSERT INTO refresh_tokens (id, user_id,")
+        assert sql.count("(:id_") == 2
+        assert params["id_1"] == f"token-{SAVE_MANY_BATCH_SIZE + 1}"
+        assert len(params) == 12
+
+
+class TestRefreshTokenRepositoryDatabaseErrors:
+    """Test that driver failures surface as DatabaseError."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("tx_method", "method", "args", "expected_msg"),
+        [
+            ("execute", "save", (_RECORD,), "Failed to save refresh token"),
+            ("execute", "save_many", ([_RECORD, _RECORD],), "Failed to save refresh tokens"),
+            ("fetch_one", "get_by_token_hash", ("some-hash",), "Failed to fetch refresh token by hash"),
+            ("fetch_one", "revoke", ("token-456",), "Failed to revoke refresh token"),
+            ("execute", "revoke_all_for_user", ("user-999",), "Failed to revoke all refresh tokens for user"),
+        ],
+    )
+    async def test_database_error(self, tx, refresh_token_repo, tx_method, method, args, expected_msg):
+        """Raise DatabaseError, keeping the driver exception as the cause."""
+        tx.error = Exception("Connection lost")
+
+        with pytest.raises(DatabaseError) as exc_info:
+            await getattr(refresh_token_repo, method)(*args)
+
+        assert exc_info.value.message == expected_msg
+        assert str(exc_info.value.cause) == "Connection lost"
+        assert tx.calls[-1][0] == tx_method
@@ -0,0 +1,70 @@
+"""Tests for TokenService decoding."""
+
+from __future__ import annotations
+
+import hashlib
+from datetime import UTC, datetime
+
+import pytest
+
+from app.application.services.token_service import TokenService
+from app.domain.errors import AuthenticationError
+
+SECRET = "test-secret-key-of-at-least-32-bytes"
+OTHER_SECRET = "another-secret-key-of-at-least-32-bytes"
+
+
+class TestTokenServiceDecode:
+    """Test TokenService.decode_token() / decode_refresh_token()."""
+
+    def test_expired_access_token_rejected(self):
+        """Access tokens are still checked for expiry by PyJWT."""
+        service = TokenService(secret_key=SECRET, access_token_expire_minutes=-1)
+        token = service.create_access_token("user-1")
+
+        with pytest.raises(AuthenticationError):
+            service.decode_token(token)
+
+    def test_refresh_token_expiry_left_to_repository(self):
+        """Refresh token exp is not verified; the stored record is authoritative."""
+        service = TokenService(secret_key=SECRET, refresh_token_expire_days=-1)
+        token, _, _ = service.create_refresh_token("user-1")
+
+        payload = service.decode_refresh_token(token)
+
+        assert payload["sub"] == "user-1"
+        assert payload["type"] == "refresh"
+
+    def test_refresh_token_signature_still_verified(self):
+        """A token signed with another key is rejected."""
+        token, _, _ = TokenService(secret_key=OTHER_SECRET).create_refresh_token("user-1")
+
+        with pytest.raises(AuthenticationError):
+            TokenService(secret_key=SECRET).decode_refresh_token(token)
+
+    def test_hash_token_is_sha256_hex(self):
+        """hash_token returns the hex SHA-256 digest."""
+        assert TokenService.hash_token("a") == ("ca978112ca1bbdcafac231b39a23dc4da786eff8147c4e72b9807785afee48bb")
+
+    def test_hash_token_matches_hashlib_for_real_tokens(self):
+        """Refresh tokens hash exactly as hashlib.sha256 would store them."""
+        token, _, _ = TokenService(secret_key=SECRET).create_refresh_token("user-1")
+
+        assert TokenService.hash_token(token) == hashlib.sha256(token.encode()).hexdigest()
+
+
+class TestTokenServiceIssueRefreshToken:
+    """Test TokenService.issue_refresh_token()."""
+
+    def test_record_matches_token(self):
+        """The record stores the token's hash, id and the shared timestamp."""
+        service = TokenService(secret_key=SECRET)
+        now = datetime.now(UTC)
+
+        token, record = service.issue_refresh_token("user-1", now=now)
+
+        assert record.token_hash == service.hash_token(token)
+        assert record.id == service.decode_refresh_token(token)["jti"]
+        assert record.user_id == "user-1"
+        assert record.created_at == now
+        assert record.revoked_at is None
@@ -0,0 +1,62 @@
+"""Tests for SqlUnitOfWork."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.infrastructure.db.repositories.refresh_token_repository import RefreshTokenRepository
+from app.infrastructure.db.unit_of_work import SqlUnitOfWork
+
+
+def _engine() -> MagicMock:
+    engine = MagicMock()
+    transaction_cm = MagicMock()
+    transaction_cm.__aenter__ = AsyncMock(return_value=MagicMock(name="tx"))
+    transaction_cm.__aexit__ = AsyncMock(return_value=None)
+    engine.transaction.return_value = transaction_cm
+    return engine
+
+
+class TestSqlUnitOfWork:
+    """Test SqlUnitOfWork repository lifecycle."""
+
+    @pytest.mark.asyncio
+    async def test_repositories_built_on_first_access(self):
+        """Entering builds no repositories; each is created once, when used."""
+        uow = SqlUnitOfWork(_engine())
+
+        async with uow:
+            assert uow._user_repository is None
+            assert uow._refresh_token_repository is None
+            repository = uow.refresh_token_repository
+            assert isinstance(repository, RefreshTokenRepository)
+            assert uow.refresh_token_repository is repository
+            assert uow._user_repository is None
+
+    @pytest.mark.asyncio
+    async def test_repository_outside_transaction_raises(self):
+        """Transactional repositories are unavailable before entering and after exit."""
+        uow = SqlUnitOfWork(_engine())
+
+        with pytest.raises(RuntimeError):
+            _ = uow.user_repository
+        async with uow:
+            pass
+        with pytest.raises(RuntimeError):
+            _ = uow.refresh_token_repository
+
+    @pytest.mark.asyncio
+    async def test_cancellation_reaches_transaction_exit(self):
+        """A cancelled body still exits the engine's transaction context, with the error."""
+        engine = _engine()
+        uow = SqlUnitOfWork(engine)
+
+        with pytest.raises(asyncio.CancelledError):
+            async with uow:
+                raise asyncio.CancelledError
+
+        exc_type = engine.transaction.return_value.__aexit__.await_args.args[-3]
+        assert exc_type is asyncio.CancelledError
@@ -0,0 +1,53 @@
+"""Tests for domain value objects."""
+
+from __future__ import annotations
+
+import uuid
+from dataclasses import dataclass
+
+import pytest
+
+from app.domain.value_objects.user_id import UserId
+
+
+class TestUserId:
+    """Test the UserId value object."""
+
+    def test_slotted_without_instance_dict(self):
+        """UserId stores its value in a slot, so instances carry no __dict__."""
+        user_id = UserId.generate()
+
+        assert UserId.__slots__ == ("value",)
+        assert not hasattr(user_id, "__dict__")
+
+    def test_equal_by_value_and_immutable(self):
+        """Two ids wrapping the same UUID are equal; fields cannot be reassigned."""
+        raw = uuid.uuid4()
+        user_id = UserId(value=raw)
+
+        assert user_id == UserId(value=raw)
+        assert hash(user_id) == hash(UserId(value=raw))
+        with pytest.raises(AttributeError):
+            user_id.value = uuid.uuid4()
+
+
+class TestValueObjectRepr:
+    """Test ValueObject.__repr__()."""
+
+    def test_repr_lists_fields_and_caches_names_per_class(self):
+        """repr shows every field; the field-name tuple is cached on the subclass."""
+        raw = uuid.UUID("12345678-1234-5678-1234-567812345678")
+
+        assert repr(UserId(value=raw)) == f"UserId(value={raw!r})"
+        assert UserId.__dict__["__vo_field_names__"] == ("value",)
+
+    def test_compiled_repr_not_inherited_by_subclasses(self):
+        """A subclass defined after its parent's repr was compiled gets its own."""
+        raw = uuid.UUID("12345678-1234-5678-1234-567812345678")
+        repr(UserId(value=raw))
+
+        @dataclass(frozen=True, slots=True, repr=False)
+        class TaggedUserId(UserId):
+            tag: str
+
+        assert repr(TaggedUserId(value=raw, tag="x")) == f"TaggedUserId(value={raw!r}, tag='x')"